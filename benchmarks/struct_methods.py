@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from ctypes import Structure, c_char, c_double, c_int, c_uint16
+from timeit import timeit
+from typing import Any, Callable
+
+from ctypedffi import Struct
+
+
+@Struct.annotate
+class Record(Struct):
+    id: c_int
+    kind: c_char
+    flags: c_uint16
+    value: c_double
+
+
+@Struct.annotate
+class Nested(Struct):
+    record: Record
+    count: c_int
+
+
+def _generic_new(ctype: type[Structure], *args: Any, **kwargs: Any) -> Structure:
+    value = ctype.__new__(ctype)
+    Structure.__init__(value, *args, **kwargs)
+    return value
+
+
+def _generic_to_dict(value: Any) -> dict[str, Any]:
+    return {name: getattr(value, name) for name, *_ in type(value)._fields_}
+
+
+def _bench(name: str, func: Callable[[], Any], number: int) -> float:
+    seconds = timeit(func, number=number)
+    print(f'{name:<40} {seconds / number * 1e9:>10.1f} ns')
+    return seconds
+
+
+def main(number: int = 200_000) -> None:
+    record = Record(1, b'a', 3, 4.5)
+    nested = Nested(record, 2)
+
+    comparisons = [
+        ('__init__ (positional)', lambda: _generic_new(Record, 1, b'a', 3, 4.5), lambda: Record(1, b'a', 3, 4.5)),
+        ('__init__ (keywords)', lambda: _generic_new(Record, id=1, value=4.5), lambda: Record(id=1, value=4.5)),
+        ('to_tuple', lambda: (record.id, record.kind, record.flags, record.value), record.to_tuple),
+        ('to_dict', lambda: _generic_to_dict(record), record.to_dict),
+        ('nested __init__', lambda: _generic_new(Nested, record, 2), lambda: Nested(record, 2)),
+        ('nested to_dict', lambda: _generic_to_dict(nested), nested.to_dict),
+    ]
+
+    for name, generic, generated in comparisons:
+        generic_time = _bench(f'{name} generic', generic, number)
+        generated_time = _bench(f'{name} generated', generated, number)
+        print(f'{"":<40} {generic_time / generated_time:>10.2f}x\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,21 @@
+from .arena import *  # noqa: F401, F403
+from .arrays import *  # noqa: F401, F403
+from .buffers import *  # noqa: F401, F403
+from .callbacks import *  # noqa: F401, F403
+from .codegen import *  # noqa: F401, F403
 from .cython import *  # noqa: F401, F403
 from .ctypes import *  # noqa: F401, F403
+from .handle import *  # noqa: F401, F403
+from .layout import *  # noqa: F401, F403
 from .library import *  # noqa: F401, F403
 from .libs import *  # noqa: F401, F403
 from .string import *  # noqa: F401, F403
+from .pool import *  # noqa: F401, F403
+from .prefork import *  # noqa: F401, F403
+from .serialize import *  # noqa: F401, F403
+from .shared import *  # noqa: F401, F403
+from .stream import *  # noqa: F401, F403
 from .struct import *  # noqa: F401, F403
 from .types import *  # noqa: F401, F403
 from .utils import *  # noqa: F401, F403
+from .values import *  # noqa: F401, F403
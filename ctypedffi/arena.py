@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from ctypes import (
+    Array, Structure, Union, _Pointer, addressof, alignment, c_char, c_char_p, c_void_p, memmove, memset, sizeof
+)
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Mapping
+
+from .layout import FieldLayout, struct_fields
+from .string import String
+from .types import C_T_CDB, CDataBase
+
+__all__ = [
+    'ArenaStats', 'Arena'
+]
+
+
+@dataclass
+class ArenaStats:
+    used: int = 0
+    capacity: int = 0
+    high_water: int = 0
+    allocations: int = 0
+    chunks: int = 0
+    resets: int = 0
+
+
+@lru_cache
+def _field_map(ctype: type[CDataBase]) -> dict[str, FieldLayout]:
+    return {field.name: field for field in struct_fields(ctype)}
+
+
+def _is_pointer_like(ctype: type[CDataBase]) -> bool:
+    return isinstance(ctype, type) and (
+        issubclass(ctype, (_Pointer, String)) or ctype in (c_char_p, c_void_p)
+    )
+
+
+def _pointee(ctype: type[CDataBase]) -> type[CDataBase] | None:
+    if issubclass(ctype, _Pointer):
+        return ctype._type_
+
+    return None if ctype is c_void_p else c_char
+
+
+def _is_struct(ctype: Any) -> bool:
+    return isinstance(ctype, type) and issubclass(ctype, (Structure, Union))
+
+
+class Arena:
+    def __init__(self, chunk_size: int = 1 << 16) -> None:
+        self.chunk_size = chunk_size
+
+        self._chunks = list[Array[c_char]]()
+        self._used = list[int]()
+        self._index = 0
+
+        self._high_water = 0
+        self._allocations = 0
+        self._resets = 0
+
+        self._add_chunk(chunk_size, 0)
+
+    def _add_chunk(self, size: int, index: int) -> None:
+        self._chunks.insert(index, (c_char * size)())
+        self._used.insert(index, 0)
+
+    def alloc(self, size: int, align: int = 8) -> tuple[Array[c_char], int]:
+        chunk, used = self._chunks[self._index], self._used[self._index]
+        offset = (used + align - 1) & -align
+
+        if offset + size > len(chunk):
+            self._index += 1
+
+            # Chunks past the current one are always empty, they're left over from a previous reset.
+            if self._index == len(self._chunks) or len(self._chunks[self._index]) < size:
+                self._add_chunk(max(self.chunk_size, size), self._index)
+
+            chunk, offset = self._chunks[self._index], 0
+
+        self._used[self._index] = offset + size
+        self._allocations += 1
+        self._high_water = max(self._high_water, self.used)
+
+        return chunk, offset
+
+    def owns(self, address: int) -> bool:
+        return any(
+            addressof(chunk) <= address < addressof(chunk) + used
+            for chunk, used in zip(self._chunks, self._used)
+        )
+
+    def new(self, ctype: type[C_T_CDB], /, **fields: Any) -> C_T_CDB:
+        from .struct import resolve_deferred
+
+        ctype = resolve_deferred(ctype)
+        chunk, offset = self.alloc(sizeof(ctype), alignment(ctype))
+
+        # Arena memory is always zeroed, so there's no need to run __init__.
+        value = ctype.from_buffer(chunk, offset)
+
+        if fields:
+            self._fill(value, fields)
+
+        return value
+
+    def copy(self, value: C_T_CDB) -> C_T_CDB:
+        ctype = type(value)
+        chunk, offset = self.alloc(sizeof(ctype), alignment(ctype))
+
+        memmove(addressof(chunk) + offset, addressof(value), sizeof(ctype))
+
+        return ctype.from_buffer(chunk, offset)
+
+    def string(self, value: str | bytes, encoding: str = 'utf-8') -> Array[c_char]:
+        data = value.encode(encoding) if isinstance(value, str) else value
+        chunk, offset = self.alloc(len(data) + 1, 1)
+
+        memmove(addressof(chunk) + offset, data, len(data))
+
+        return (c_char * (len(data) + 1)).from_buffer(chunk, offset)
+
+    def array(self, ctype: type[C_T_CDB], values: int | Iterable[Any]) -> Array[C_T_CDB]:
+        from .struct import resolve_deferred
+
+        ctype = resolve_deferred(ctype)
+
+        if isinstance(values, int):
+            length, values = values, []
+        else:
+            values = list(values)
+            length = len(values)
+
+        chunk, offset = self.alloc(sizeof(ctype) * length, alignment(ctype))
+        array = (ctype * length).from_buffer(chunk, offset)
+
+        for i, value in enumerate(values):
+            self._store(array, i * sizeof(ctype), ctype, value, i)
+
+        return array
+
+    def _address(self, ctype: type[CDataBase], value: Any) -> int | None:
+        if value is None:
+            return 0
+
+        if isinstance(value, int):
+            return value
+
+        pointee = _pointee(ctype)
+
+        if isinstance(value, (str, bytes)) and pointee is c_char:
+            return addressof(self.string(value))
+
+        if isinstance(value, CDataBase):
+            if isinstance(value, ctype):
+                return None
+
+            if isinstance(value, _Pointer):
+                if pointee is not None and not issubclass(value._type_, pointee):
+                    raise TypeError(
+                        f'Arena: Expected a pointer to {pointee.__name__}, not {type(value).__name__}!'
+                    )
+
+                return c_void_p.from_buffer(value).value or 0
+
+            # Arrays decay to a pointer to their first element, like they do in C.
+            if pointee is not None and not (
+                isinstance(value, pointee) or isinstance(value, Array) and issubclass(value._type_, pointee)
+            ):
+                raise TypeError(
+                    f'Arena: Expected a {pointee.__name__} to point to, not {type(value).__name__}!'
+                )
+
+            # Anything living outside of the arena is copied in, so the whole graph shares one lifetime.
+            if not self.owns(address := addressof(value)):
+                address = addressof(self.copy(value))
+
+            return address
+
+        if isinstance(value, Mapping) and _is_struct(pointee):
+            return addressof(self.new(pointee, **value))  # type: ignore
+
+        if isinstance(value, Iterable) and pointee is not None:
+            return addressof(self.array(pointee, value))
+
+        return None
+
+    def _store(self, target: CDataBase, offset: int, ctype: type[CDataBase], value: Any, key: Any) -> None:
+        if _is_pointer_like(ctype) and (address := self._address(ctype, value)) is not None:
+            # Writing the raw address skips the keepalive references ctypes would otherwise attach.
+            c_void_p.from_buffer(target, offset).value = address
+        elif isinstance(value, Mapping) and _is_struct(ctype):
+            self._fill(ctype.from_buffer(target, offset), value)
+        elif isinstance(key, str):
+            setattr(target, key, value)
+        else:
+            target[key] = value  # type: ignore
+
+    def _fill(self, value: CDataBase, fields: Mapping[str, Any]) -> None:
+        layouts = _field_map(type(value))
+
+        for name, field_value in fields.items():
+            if (field := layouts.get(name, None)) is None:
+                raise TypeError(
+                    f'Arena: {type(value).__name__} has no field \'{name}\'!'
+                )
+
+            if field.bit_size is not None:
+                setattr(value, name, field_value)
+            else:
+                self._store(value, field.offset, field.ctype, field_value, name)
+
+    @property
+    def used(self) -> int:
+        return sum(self._used[:self._index + 1])
+
+    @property
+    def capacity(self) -> int:
+        return sum(map(len, self._chunks))
+
+    def stats(self) -> ArenaStats:
+        return ArenaStats(
+            self.used, self.capacity, self._high_water,
+            self._allocations, len(self._chunks), self._resets
+        )
+
+    def mark(self) -> tuple[int, int]:
+        return self._index, self._used[self._index]
+
+    def rollback(self, mark: tuple[int, int]) -> None:
+        index, used = mark
+
+        # Objects handed out past the mark now alias free memory, it's zeroed so they read as empty.
+        memset(addressof(self._chunks[index]) + used, 0, self._used[index] - used)
+
+        for i in range(index + 1, self._index + 1):
+            memset(self._chunks[i], 0, self._used[i])
+            self._used[i] = 0
+
+        self._index, self._used[index] = index, used
+        self._resets += 1
+
+    def reset(self) -> None:
+        self.rollback((0, 0))
+
+    def close(self) -> None:
+        self.reset()
+
+        # Only the first chunk is kept, so a closed arena doesn't pin its high-water mark.
+        del self._chunks[1:], self._used[1:]
+
+    @contextmanager
+    def scope(self) -> Iterator[Arena]:
+        mark = self.mark()
+
+        try:
+            yield self
+        finally:
+            self.rollback(mark)
+
+    def __enter__(self) -> Arena:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.used}/{self.capacity} bytes in {len(self._chunks)} chunks>'
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import mmap
+import os
+from ctypes import Array, sizeof
+from typing import TYPE_CHECKING, Any, BinaryIO, Generic, Iterator, overload
+
+from .types import C_T_CDB, CDataBase
+from .serialize import dumps_array, loads_array, reduce_array
+from .values import array_equal, array_hashes, array_value_keys
+
+if TYPE_CHECKING:
+    from .struct import Struct
+
+__all__ = [
+    'StructArray', 'MappedStructArray'
+]
+
+
+class StructArray(Generic[C_T_CDB]):
+    __slots__ = ('_type_', '_buffer', '_view', '_offset', '_length', '_stride', '_writable')
+
+    _type_: type[C_T_CDB]
+
+    def __init__(
+        self, ctype: type[C_T_CDB], buffer: Any, offset: int = 0,
+        length: int | None = None, stride: int | None = None
+    ) -> None:
+        _check_struct_type(ctype)
+
+        self._type_ = ctype
+        self._buffer = buffer
+        self._view = memoryview(buffer).cast('B')
+        self._offset = offset
+        self._stride = sizeof(ctype) if stride is None else stride
+        self._writable = not self._view.readonly
+
+        if self._stride <= 0:
+            raise ValueError(
+                f'StructArray: The stride must be positive, not {self._stride}!'
+            )
+
+        available = max(len(self._view) - offset - sizeof(ctype), -self._stride) // self._stride + 1
+
+        if length is None:
+            length = available
+        elif length > available:
+            raise ValueError(
+                f'StructArray: The buffer only holds {available} elements, {length} were requested!'
+            )
+
+        self._length = length
+
+    @property
+    def itemsize(self) -> int:
+        return sizeof(self._type_)
+
+    @property
+    def nbytes(self) -> int:
+        return self._length * self.itemsize
+
+    @property
+    def contiguous(self) -> bool:
+        return self._stride == self.itemsize
+
+    def _item_offset(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError('StructArray: index out of range')
+
+        return self._offset + index * self._stride
+
+    def _item_at(self, offset: int) -> C_T_CDB:
+        if self._writable:
+            return self._type_.from_buffer(self._buffer, offset)
+
+        return self._type_.from_buffer_copy(self._view, offset)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> C_T_CDB:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> StructArray[C_T_CDB]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> C_T_CDB | StructArray[C_T_CDB]:
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._length))
+
+            return self._slice(self._offset + indices.start * self._stride, len(indices), self._stride * indices.step)
+
+        return self._item_at(self._item_offset(index))
+
+    def _slice(self, offset: int, length: int, stride: int) -> StructArray[C_T_CDB]:
+        view = StructArray.__new__(StructArray)
+        view._type_ = self._type_
+        view._buffer = self._buffer
+        view._view = memoryview(self._buffer).cast('B')
+        view._offset = offset
+        view._length = length
+        view._stride = stride
+        view._writable = self._writable
+
+        return view
+
+    def __setitem__(self, index: int, value: C_T_CDB) -> None:
+        if not self._writable:
+            raise TypeError('StructArray: The underlying buffer is read-only!')
+
+        offset = self._item_offset(index)
+        size = self.itemsize
+
+        self._view[offset:offset + size] = memoryview(value).cast('B')
+
+    def __iter__(self) -> Iterator[C_T_CDB]:
+        item_at = self._item_at
+
+        for offset in range(self._offset, self._offset + self._length * self._stride, self._stride):
+            yield item_at(offset)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[{self._type_.__name__}] of {self._length} elements>'
+
+    def tobytes(self) -> bytes:
+        if self.contiguous:
+            return self._view[self._offset:self._offset + self.nbytes].tobytes()
+
+        size = self.itemsize
+
+        return b''.join(
+            self._view[offset:offset + size]
+            for offset in range(self._offset, self._offset + self._length * self._stride, self._stride)
+        )
+
+    def raw(self) -> memoryview:
+        if not self.contiguous:
+            raise ValueError('StructArray: Only contiguous arrays can be viewed as raw memory!')
+
+        return self._view[self._offset:self._offset + self.nbytes]
+
+    def as_ctypes(self) -> Array[C_T_CDB]:
+        if not self.contiguous:
+            raise ValueError('StructArray: Only contiguous arrays can be viewed as a ctypes array!')
+
+        array_type = self._type_ * self._length
+
+        if self._writable:
+            return array_type.from_buffer(self._buffer, self._offset)
+
+        return array_type.from_buffer_copy(self._view, self._offset)
+
+    def value_keys(self) -> list[bytes]:
+        return array_value_keys(self)
+
+    def hashes(self) -> list[int]:
+        return array_hashes(self)
+
+    def equal(self, other: StructArray[C_T_CDB]) -> list[bool]:
+        return array_equal(self, other)
+
+    def dumps(self) -> bytes:
+        return dumps_array(self)
+
+    @classmethod
+    def loads(cls, ctype: type[C_T_CDB], data: Any, copy: bool = False) -> StructArray[C_T_CDB]:
+        return loads_array(ctype, data, copy)
+
+    def __reduce_ex__(self, protocol: int) -> tuple[Any, ...]:  # type: ignore[override]
+        return reduce_array(self, protocol)
+
+    @classmethod
+    def from_records(cls, ctype: type[C_T_CDB], records: Any) -> StructArray[C_T_CDB]:
+        records = list(records)
+        array = (ctype * len(records))(*records)
+
+        return cls(ctype, array)
+
+    @classmethod
+    def empty(cls, ctype: type[C_T_CDB], length: int) -> StructArray[C_T_CDB]:
+        return cls(ctype, bytearray(sizeof(ctype) * length), 0, length)
+
+
+class MappedStructArray(StructArray[C_T_CDB]):
+    __slots__ = ('path', 'mode', 'header_type', 'header', '_file', '_mmap', '_data_offset')
+
+    header_type: type[Struct] | None
+    header: Struct | None
+    _file: BinaryIO | None
+    _mmap: mmap.mmap | None
+
+    def __init__(
+        self, ctype: type[C_T_CDB], path: str | os.PathLike[str], mode: str = 'r',
+        offset: int = 0, header: type[Struct] | None = None
+    ) -> None:
+        if mode not in {'r', 'r+', 'c'}:
+            raise ValueError(
+                f'MappedStructArray: The mode must be one of \'r\', \'r+\' or \'c\', not {mode!r}!'
+            )
+
+        _check_struct_type(ctype)
+
+        self.path = path
+        self.mode = mode
+        self.header_type = header
+        self.header = None
+
+        self._type_ = ctype
+        self._data_offset = offset + (0 if header is None else sizeof(header))
+        self._offset = self._data_offset
+        self._stride = sizeof(ctype)
+        self._writable = mode != 'r'
+        self._length = 0
+        self._buffer = bytearray()
+        self._view = memoryview(self._buffer)
+        self._mmap = None
+
+        self._file = open(path, 'r+b' if mode == 'r+' else 'rb')
+
+        try:
+            self.refresh()
+        except BaseException:
+            self.close()
+            raise
+
+    def refresh(self) -> int:
+        if self._file is None:
+            raise ValueError('MappedStructArray: The mapping has been closed!')
+
+        old_length = self._length
+        file_size = os.fstat(self._file.fileno()).st_size
+
+        if self._mmap is not None and len(self._mmap) == file_size:
+            return 0
+
+        if not file_size or file_size < self._data_offset:
+            self._length = 0
+            return 0
+
+        # Read-only mappings hand out copies of their elements, like any other read-only buffer. Copy-on-write
+        # mappings hand out views without copying, but writes to them stay private and are lost on remapping.
+        access = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}[self.mode]
+
+        new_mmap = mmap.mmap(self._file.fileno(), file_size, access=access)
+
+        # Existing element views keep the previous mapping alive on their own, so we just drop our reference.
+        self.header = None
+        self._release_mmap()
+
+        self._mmap = new_mmap
+        self._buffer = new_mmap
+        self._view = memoryview(new_mmap)
+
+        if self.header_type is not None:
+            header_offset = self._data_offset - sizeof(self.header_type)
+
+            if self._writable:
+                self.header = self.header_type.from_buffer(new_mmap, header_offset)
+            else:
+                self.header = self.header_type.from_buffer_copy(new_mmap, header_offset)
+
+        self._length = (file_size - self._data_offset) // self._stride
+
+        return self._length - old_length
+
+    def flush(self) -> None:
+        if self._mmap is not None and self.mode == 'r+':
+            self._mmap.flush()
+
+    def _release_mmap(self) -> None:
+        if self._mmap is None:
+            return
+
+        self._view.release()
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Elements are still borrowed, the mapping will be unmapped once they're collected.
+            ...
+
+        self._mmap = None
+
+    def close(self) -> None:
+        self.flush()
+        self._release_mmap()
+        self.header = None
+        self._length = 0
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> MappedStructArray[C_T_CDB]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def _check_struct_type(ctype: type[CDataBase]) -> None:
+    if not sizeof(ctype):
+        raise ValueError(
+            f'StructArray: Can\'t create an array of the zero-sized type {ctype.__name__}!'
+        )
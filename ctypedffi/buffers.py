@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from ctypes import c_char
+from threading import Lock
+from typing import Any, Callable
+
+from .libs import PyBytes, PyCapsule, PyMemoryView
+
+__all__ = [
+    'OwnedMemory',
+    'memoryview_at', 'bytes_at', 'capsule_new'
+]
+
+
+class OwnedMemory:
+    __slots__ = ('address', 'size', '_free', '__weakref__')
+
+    def __init__(self, address: int, size: int, free: Callable[[int], Any] | None = None) -> None:
+        self.address = address
+        self.size = size
+        self._free = free
+
+    def release(self) -> None:
+        free, self._free = self._free, None
+
+        if free is not None and self.address:
+            free(self.address)
+
+    def __del__(self) -> None:
+        self.release()
+
+    def memoryview(self, readonly: bool = False) -> memoryview:
+        return memoryview_at(self.address, self.size, readonly, self)
+
+
+def memoryview_at(address: int, size: int, readonly: bool = True, owner: Any | None = None) -> memoryview:
+    if owner is None:
+        # Borrowed view, the caller has to make sure the memory outlives it and every view derived from it.
+        return PyMemoryView.FromMemory(  # type: ignore
+            address, size, PyMemoryView.PyBUF_READ if readonly else PyMemoryView.PyBUF_WRITE  # type: ignore[arg-type]
+        )
+
+    # Memoryviews can't hold references on their own, so we go through a ctypes array which keeps the owner alive
+    # for as long as the view or any view derived from it exists.
+    array = (c_char * size).from_address(address)
+    array.__ctdffi_owner__ = owner  # type: ignore
+
+    view = memoryview(array).cast('B')
+
+    return view.toreadonly() if readonly else view
+
+
+def bytes_at(address: int, size: int) -> bytes:
+    return PyBytes.FromStringAndSize(address, size)  # type: ignore
+
+
+# Pointers of live capsules and their destructors, all capsules share a single C destructor.
+_capsules = dict[int, tuple[Callable[[int], Any], int]]()
+_capsules_lock = Lock()
+
+# PyCapsule only borrows the name, so names have to live for as long as the process.
+_capsule_names = dict[bytes, bytes]()
+
+
+def _capsule_destructor(capsule: int) -> None:
+    with _capsules_lock:
+        entry = _capsules.pop(capsule, None)
+
+    if entry is not None:
+        destructor, address = entry
+        destructor(address)
+
+
+_capsule_destructor_ptr = PyCapsule.Destructor(_capsule_destructor)
+
+# The function pointer argument doesn't take None, a NULL destructor has to be spelled out.
+_no_destructor = PyCapsule.Destructor(0)
+
+
+def capsule_new(address: int, name: str | bytes | None = None, destructor: Callable[[int], Any] | None = None) -> Any:
+    if not address:
+        raise ValueError('capsule_new: Capsules can\'t hold a NULL pointer!')
+
+    if isinstance(name, str):
+        name = name.encode()
+
+    if name is not None:
+        name = _capsule_names.setdefault(name, name)
+
+    capsule_destructor = _no_destructor if destructor is None else _capsule_destructor_ptr
+    capsule = PyCapsule.New(address, name, capsule_destructor)  # type: ignore
+
+    if destructor is not None:
+        with _capsules_lock:
+            _capsules[id(capsule)] = (destructor, address)
+
+    return capsule
@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, Event, Task, get_running_loop, iscoroutinefunction
+from collections import deque
+from ctypes import Array, Structure, Union, c_void_p, pointer
+from itertools import count
+from threading import Condition, Lock, Thread, current_thread
+from threading import Event as ThreadEvent
+from typing import Any, AsyncIterator, Callable, Literal
+
+from .types import FuncPointer
+from .utils import as_cfunc
+
+__all__ = [
+    'CallbackRegistry', 'CallbackDispatcher', 'CallbackBridge',
+    'callback_registry'
+]
+
+
+def _as_functype(signature: type[FuncPointer[Any, Any]] | Callable[..., Any]) -> type[FuncPointer[Any, Any]]:
+    if isinstance(signature, type) and issubclass(signature, FuncPointer):
+        return signature
+
+    return as_cfunc(signature)
+
+
+class _CountedCallback:
+    __slots__ = ('func', 'calls', '_lock')
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self.func = func
+        self.calls = 0
+
+        # C libraries may call back from several threads at once, += alone would lose counts.
+        self._lock = Lock()
+
+    def __call__(self, *args: Any) -> Any:
+        with self._lock:
+            self.calls += 1
+
+        return self.func(*args)
+
+
+def _maybe_counted(func: Callable[..., Any], counted: bool) -> Callable[..., Any]:
+    if counted:
+        return _CountedCallback(func)
+
+    return func
+
+
+def _zero_result(functype: type[FuncPointer[Any, Any]]) -> Any:
+    restype = functype._restype_  # type: ignore
+
+    return getattr(restype(), 'value', None) if restype is not None else None
+
+
+_UNSET: Any = object()
+
+
+class CallbackDispatcher:
+    def __init__(
+        self, functype: type[FuncPointer[Any, Any]], userdata: int, counted: bool = True, default: Any = _UNSET
+    ) -> None:
+        argtypes = functype._argtypes_  # type: ignore
+
+        try:
+            userdata_type = argtypes[userdata]
+        except IndexError:
+            raise ValueError(
+                f'CallbackDispatcher: The signature has no argument at index {userdata}!'
+            )
+
+        if userdata_type is not c_void_p:
+            raise TypeError(
+                f'CallbackDispatcher: The userdata argument must be a c_void_p, not {userdata_type.__name__}!'
+            )
+
+        self.functype = functype
+        self.userdata = userdata
+        self.counted = counted
+        self.default = _zero_result(functype) if default is _UNSET else default
+        self.misses = 0
+        self._misses_lock = Lock()
+
+        self.handlers = dict[int, Callable[..., Any]]()
+        self._tokens = count(1)
+
+        handlers = self.handlers
+
+        # A single closure for every logical callback, the userdata pointer selects the handler.
+        def _dispatch(*args: Any) -> Any:
+            handler = handlers.get(args[userdata] or 0, None)
+
+            # Raising in here would only be printed, and C would get an undefined result back.
+            if handler is None:
+                with self._misses_lock:
+                    self.misses += 1
+
+                return self.default
+
+            return handler(*args)
+
+        self.thunk = functype(_dispatch)
+
+    def register(self, func: Callable[..., Any]) -> int:
+        token = next(self._tokens)
+        self.handlers[token] = _maybe_counted(func, self.counted)
+
+        return token
+
+    def unregister(self, token: int) -> None:
+        self.handlers.pop(token, None)
+
+    def userdata_of(self, token: int) -> c_void_p:
+        return c_void_p(token)
+
+    @property
+    def _as_parameter_(self) -> FuncPointer[Any, Any]:
+        return self.thunk
+
+    def counters(self) -> dict[int, int]:
+        return {
+            token: handler.calls for token, handler in self.handlers.items()
+            if isinstance(handler, _CountedCallback)
+        }
+
+
+class CallbackRegistry:
+    def __init__(self, counted: bool = True) -> None:
+        self.counted = counted
+
+        self._thunks = dict[
+            tuple[type[FuncPointer[Any, Any]], Callable[..., Any]], tuple[FuncPointer[Any, Any], Callable[..., Any]]
+        ]()
+        self._lock = Lock()
+
+    def thunk(
+        self, signature: type[FuncPointer[Any, Any]] | Callable[..., Any], func: Callable[..., Any]
+    ) -> FuncPointer[Any, Any]:
+        functype = _as_functype(signature)
+        key = (functype, func)
+
+        try:
+            return self._thunks[key][0]
+        except KeyError:
+            ...
+
+        with self._lock:
+            if (entry := self._thunks.get(key, None)) is None:
+                callback = _maybe_counted(func, self.counted)
+                entry = self._thunks[key] = (functype(callback), callback)
+
+        return entry[0]
+
+    def callback(
+        self, signature: type[FuncPointer[Any, Any]] | Callable[..., Any]
+    ) -> Callable[[Callable[..., Any]], FuncPointer[Any, Any]]:
+        def wrapper(func: Callable[..., Any]) -> FuncPointer[Any, Any]:
+            return self.thunk(signature, func)
+
+        return wrapper
+
+    def dispatcher(
+        self, signature: type[FuncPointer[Any, Any]] | Callable[..., Any], userdata: int = -1, default: Any = _UNSET
+    ) -> CallbackDispatcher:
+        return CallbackDispatcher(_as_functype(signature), userdata, self.counted, default)
+
+    def release(self, signature: type[FuncPointer[Any, Any]] | Callable[..., Any], func: Callable[..., Any]) -> None:
+        # The C side must not call the thunk anymore, its closure is freed with it.
+        with self._lock:
+            self._thunks.pop((_as_functype(signature), func), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._thunks.clear()
+
+    def __len__(self) -> int:
+        return len(self._thunks)
+
+    def __contains__(self, key: tuple[type[FuncPointer[Any, Any]], Callable[..., Any]]) -> bool:
+        return (_as_functype(key[0]), key[1]) in self._thunks
+
+    def counters(self) -> dict[str, int]:
+        calls = dict[str, int]()
+
+        for (_, func), (_, callback) in list(self._thunks.items()):
+            if isinstance(callback, _CountedCallback):
+                name = getattr(func, '__qualname__', repr(func))
+                calls[name] = calls.get(name, 0) + callback.calls
+
+        return dict(sorted(calls.items(), key=lambda item: item[1], reverse=True))
+
+
+callback_registry = CallbackRegistry()
+
+
+def _make_copier(ctype: type[Any]) -> Callable[[Any], Any] | None:
+    # Aggregates passed to callbacks borrow the caller's memory, which is gone once the callback returns.
+    if issubclass(ctype, (Structure, Union, Array)):
+        return ctype.from_buffer_copy
+
+    pointee = getattr(ctype, '_type_', None)
+
+    if isinstance(pointee, type) and issubclass(pointee, (Structure, Union, Array)):
+        copy_from = pointee.from_buffer_copy
+
+        def _copy_pointee(value: Any) -> Any:
+            return pointer(copy_from(value.contents)) if value else value
+
+        return _copy_pointee
+
+    return None
+
+
+class CallbackBridge:
+    def __init__(
+        self, signature: type[FuncPointer[Any, Any]] | Callable[..., Any],
+        handler: Callable[[list[tuple[Any, ...]]], Any] | None = None, loop: AbstractEventLoop | None = None,
+        maxsize: int = 0, overflow: Literal['drop', 'block'] = 'drop', copy: bool = True, result: Any = None
+    ) -> None:
+        if overflow not in {'drop', 'block'}:
+            raise ValueError(
+                f'CallbackBridge: Overflow must be either \'drop\' or \'block\', not \'{overflow}\'!'
+            )
+
+        if loop is None and handler is not None and iscoroutinefunction(handler):
+            raise ValueError(
+                'CallbackBridge: Coroutine handlers need an event loop to run on!'
+            )
+
+        self.functype = _as_functype(signature)
+        self.handler = handler
+        self.loop = loop
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.result = result
+
+        self.received = 0
+        self.dropped = 0
+        self.wakeups = 0
+
+        self._copiers = [
+            (i, copier) for i, argtype in enumerate(self.functype._argtypes_)  # type: ignore
+            if copy and (copier := _make_copier(argtype)) is not None
+        ]
+
+        self._pending = deque[tuple[Any, ...]]()
+        self._ready = deque[list[tuple[Any, ...]]]()
+        self._lock = Lock()
+        self._space = Condition(self._lock)
+        self._scheduled = False
+
+        self._ready_event: Event | None = None
+        self._tasks = set[Task[Any]]()
+        self._wakeup = ThreadEvent()
+        self._thread: Thread | None = None
+        self._closed = False
+
+        self.thunk = self.functype(self._on_callback)
+
+    @property
+    def _as_parameter_(self) -> FuncPointer[Any, Any]:
+        return self.thunk
+
+    def _on_callback(self, *args: Any) -> Any:
+        # Nothing drains a closed bridge anymore, late callbacks aren't even copied.
+        if self._closed:
+            return self.result
+
+        if self._copiers:
+            args_list = list(args)
+
+            for i, copier in self._copiers:
+                args_list[i] = copier(args_list[i])
+
+            args = tuple(args_list)
+
+        with self._lock:
+            # close() may have run on another thread since the check above.
+            if self._closed:
+                return self.result  # type: ignore[unreachable]
+
+            self.received += 1
+
+            if self.maxsize and len(self._pending) >= self.maxsize:
+                # Blocking the thread that drains the queue would never wake up again, so those are dropped too.
+                if self.overflow == 'drop' or self._is_consumer():
+                    self.dropped += 1
+                    return self.result
+
+                while len(self._pending) >= self.maxsize and not self._closed:
+                    self._space.wait()
+
+                if self._closed:
+                    self.dropped += 1  # type: ignore[unreachable]
+                    return self.result
+
+            self._pending.append(args)
+
+            # Only the first event of a batch wakes the consumer up, the others ride along.
+            if self._scheduled:
+                return self.result
+
+            self._scheduled = True
+
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._drain)
+        else:
+            self._wakeup.set()
+
+        return self.result
+
+    def _is_consumer(self) -> bool:
+        if self.loop is None:
+            return current_thread() is self._thread
+
+        try:
+            return get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _call_consumer(self, func: Callable[[], Any]) -> None:
+        # Loop state may only be touched from the loop, unless it's gone and nothing else can run it.
+        if self.loop is None or self.loop.is_closed() or self._is_consumer():
+            func()
+        else:
+            self.loop.call_soon_threadsafe(func)
+
+    def _take(self) -> list[tuple[Any, ...]]:
+        with self._lock:
+            self._scheduled = False
+
+            batch = list(self._pending)
+            self._pending.clear()
+
+            self._space.notify_all()
+
+        if batch:
+            self.wakeups += 1
+
+        return batch
+
+    def _drain(self) -> None:
+        if not (batch := self._take()):
+            return
+
+        if self.handler is None:
+            self._ready.append(batch)
+
+            if self._ready_event is not None:
+                self._ready_event.set()
+        elif iscoroutinefunction(self.handler):
+            # The loop only keeps weak references to tasks, an unreferenced one can vanish mid-flight.
+            task = self.loop.create_task(self.handler(batch))  # type: ignore
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            self.handler(batch)
+
+    def start(self) -> None:
+        if self.loop is not None:
+            raise ValueError(
+                'CallbackBridge: Bridges bound to an event loop don\'t need a consumer thread!'
+            )
+
+        if self.handler is None:
+            raise ValueError(
+                'CallbackBridge: A consumer thread needs a handler!'
+            )
+
+        if self._thread is not None:
+            return
+
+        def _run() -> None:
+            while not self._closed:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                self._drain()
+
+        self._thread = Thread(target=_run, name='ctypedffi-callback-bridge', daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._space.notify_all()
+
+        self._wakeup.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self._call_consumer(self._drain)
+
+        if self._ready_event is not None:
+            self._call_consumer(self._ready_event.set)
+
+    def __enter__(self) -> CallbackBridge:
+        if self.loop is None:
+            self.start()
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    async def batches(self) -> AsyncIterator[list[tuple[Any, ...]]]:
+        if self.handler is not None:
+            raise ValueError(
+                'CallbackBridge: Batches are delivered to the handler, they can\'t be iterated too!'
+            )
+
+        if self._ready_event is None:
+            self._ready_event = Event()
+
+        while True:
+            while self._ready:
+                yield self._ready.popleft()
+
+            if self._closed:
+                return
+
+            self._ready_event.clear()
+            await self._ready_event.wait()
+
+    def __aiter__(self) -> AsyncIterator[list[tuple[Any, ...]]]:
+        return self.batches()
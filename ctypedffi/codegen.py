@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from ctypes import Structure, Union, _SimpleCData, sizeof
+from functools import lru_cache
+from keyword import iskeyword
+from struct import Struct as PackStruct
+from struct import error as PackError
+from typing import Any, Callable, Mapping
+
+from .layout import FieldLayout, _byteorder, struct_fields
+from .types import CDataBase
+
+__all__ = [
+    'struct_format', 'generate_struct_methods', 'is_generated'
+]
+
+
+_float_codes = {4: 'f', 8: 'd'}
+_int_codes = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+
+_zero_values = {'c': b'\0', '?': False, 'f': 0.0, 'd': 0.0}
+
+
+def _field_code(ctype: type[CDataBase]) -> str | None:
+    # Subclasses of simple types aren't converted to python values by ctypes, so they can't be (un)packed either.
+    if not isinstance(ctype, type) or ctype.__bases__ != (_SimpleCData, ):
+        return None
+
+    code: str = ctype._type_  # type: ignore
+    size = sizeof(ctype)
+
+    if code in 'bhilq':
+        return _int_codes.get(size, None)
+
+    if code in 'BHILQ':
+        return _int_codes[size].upper() if size in _int_codes else None
+
+    if code in 'fd':
+        return _float_codes.get(size, None)
+
+    if code in 'c?' and size == 1:
+        return code
+
+    return None
+
+
+@lru_cache
+def struct_format(ctype: type[CDataBase]) -> str | None:
+    if not issubclass(ctype, Structure):
+        return None
+
+    parts, orders, position = list[str](), set[str](), 0
+
+    for field in struct_fields(ctype):
+        if field.bit_size is not None or field.offset < position:
+            return None
+
+        if (code := _field_code(field.ctype)) is None:
+            return None
+
+        if field.offset > position:
+            parts.append(f'{field.offset - position}x')
+
+        parts.append(code)
+        orders.add(_byteorder(field.ctype))
+
+        position = field.end
+
+    if sizeof(ctype) > position:
+        parts.append(f'{sizeof(ctype) - position}x')
+
+    orders.discard('=')
+
+    if len(orders) > 1:
+        return None
+
+    # Explicit padding and byte order, so that standard sizes and no implicit alignment match the ctypes layout.
+    format = (orders.pop() if orders else '=') + ''.join(parts)
+
+    if PackStruct(format).size != sizeof(ctype):
+        return None
+
+    return format
+
+
+def _generated(func: Callable[..., Any]) -> Callable[..., Any]:
+    func.__dict__['__ctdffi_generated__'] = True
+    return func
+
+
+def _compile(name: str, source: str, namespace: dict[str, Any]) -> Callable[..., Any]:
+    exec(compile(source, f'<ctypedffi generated {name}>', 'exec'), namespace)
+    return _generated(namespace[name])
+
+
+def _is_nested(field: FieldLayout) -> bool:
+    return isinstance(field.ctype, type) and issubclass(field.ctype, (Structure, Union))
+
+
+def generate_struct_methods(cls: type[CDataBase], skip: frozenset[str] = frozenset()) -> dict[str, Any]:
+    fields = struct_fields(cls)
+    names = [field.name for field in fields]
+
+    if not fields or any(not name.isidentifier() or iskeyword(name) or name == 'self' for name in names):
+        return {}
+
+    namespace = dict[str, Any](
+        _cls=cls, _names=tuple(names), _UNSET=object(),
+        _generic_init=Structure.__init__, _PackError=PackError
+    )
+
+    methods = dict[str, Any]()
+
+    if (format := struct_format(cls)) is not None:
+        packer = PackStruct(format)
+        unpack_from = packer.unpack_from
+
+        namespace |= dict(_pack_into=packer.pack_into, _unpack_from=unpack_from)
+
+        codes = [code for code in format[1:] if not code.isdigit() and code != 'x']
+        params = ', '.join(f'{name}={_zero_values.get(code, 0)!r}' for name, code in zip(names, codes))
+        args = ', '.join(names)
+
+        # Values ctypes accepts but struct doesn't, like ctypes instances or out of range ints, take the generic path.
+        methods['__init__'] = _compile('__init__', (
+            f'def __init__(self, {params}):\n'
+            f'    try:\n'
+            f'        _pack_into(self, 0, {args})\n'
+            f'    except (_PackError, TypeError):\n'
+            f'        _generic_init(self, {args})\n'
+        ), namespace)
+
+        @_generated
+        def to_tuple(self: CDataBase) -> tuple[Any, ...]:
+            return unpack_from(self)
+
+        @_generated
+        def to_dict(self: CDataBase) -> dict[str, Any]:
+            return dict(zip(names, unpack_from(self)))
+
+        methods['to_tuple'], methods['to_dict'] = to_tuple, to_dict
+    else:
+        init_lines, tuple_items, dict_items = list[str](), list[str](), list[str]()
+
+        for i, field in enumerate(fields):
+            name = field.name
+
+            init_lines.append(
+                f'    if {name} is not _UNSET:\n'
+                f'        self.{name} = {name}\n'
+            )
+
+            # Reading nested structs through the descriptor goes through the python getfunc
+            # of make_callback_returnable, copying straight from our buffer doesn't.
+            if _is_nested(field):
+                namespace[f'_T{i}'] = field.ctype
+
+                tuple_items.append(f'_T{i}.from_buffer_copy(self, {field.offset})')
+
+                if hasattr(field.ctype, 'to_dict'):
+                    dict_items.append(f'{name!r}: _T{i}.from_buffer(self, {field.offset}).to_dict()')
+                else:
+                    dict_items.append(f'{name!r}: {tuple_items[-1]}')
+            else:
+                tuple_items.append(f'self.{name}')
+                dict_items.append(f'{name!r}: self.{name}')
+
+        params = ', '.join(f'{name}=_UNSET' for name in names)
+
+        methods['__init__'] = _compile('__init__', f'def __init__(self, {params}):\n' + ''.join(init_lines), namespace)
+        methods['to_tuple'] = _compile(
+            'to_tuple', f'def to_tuple(self):\n    return ({", ".join(tuple_items)}, )\n', namespace
+        )
+        methods['to_dict'] = _compile(
+            'to_dict', f'def to_dict(self):\n    return {{{", ".join(dict_items)}}}\n', namespace
+        )
+
+    nested = {field.name: field.ctype for field in fields if _is_nested(field) and hasattr(field.ctype, 'from_dict')}
+
+    if nested:
+        @_generated
+        def from_dict(cls: type[CDataBase], mapping: Mapping[str, Any]) -> CDataBase:
+            return cls(**{
+                name: nested[name].from_dict(value) if name in nested and isinstance(value, Mapping) else value
+                for name, value in mapping.items()
+            })
+    else:
+        @_generated
+        def from_dict(cls: type[CDataBase], mapping: Mapping[str, Any]) -> CDataBase:
+            return cls(**mapping)
+
+    field_names = frozenset(names)
+
+    @_generated
+    def replace(self: CDataBase, **changes: Any) -> CDataBase:
+        for name in changes.keys() - field_names:
+            raise TypeError(
+                f'{type(self).__name__}.replace: Unknown field \'{name}\'!'
+            )
+
+        new = type(self).from_buffer_copy(self)
+
+        for name, value in changes.items():
+            setattr(new, name, value)
+
+        return new
+
+    methods['from_dict'] = classmethod(from_dict)
+    methods['replace'] = replace
+
+    for name, method in methods.items():
+        if name not in skip:
+            setattr(cls, name, method)
+
+    return methods
+
+
+def is_generated(value: Any) -> bool:
+    return getattr(getattr(value, '__func__', value), '__ctdffi_generated__', False)
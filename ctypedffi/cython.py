@@ -1,51 +1,318 @@
 from __future__ import annotations
 
+import copyreg
+import warnings
+from ctypes import (
+    POINTER, c_byte, c_char, c_char_p, c_double, c_float, c_int, c_int8, c_int16, c_int32, c_int64, c_long,
+    c_longdouble, c_longlong, c_short, c_size_t, c_ssize_t, c_ubyte, c_uint, c_uint8, c_uint16, c_uint32, c_uint64,
+    c_ulong, c_ulonglong, c_ushort, c_void_p
+)
+from functools import lru_cache
 from types import ModuleType
-from typing import Any, Mapping, NoReturn
+from typing import Any, Iterable, Mapping, NoReturn, cast
 
+from .ctypes import py_object
 from .libs import PyCapsule
+from .serialize import reduce_class, register_bound
+from .string import String
 from .struct import Struct, StructMeta
-from .types import MetaClassDictBase, Self
-from .utils import as_cfunc, normalize_cfunc
+from .types import CDataBase, FuncPointer, MetaClassDictBase, Self
+from .utils import as_cfunc, bind_cfunc, get_cfunctype, normalize_cfunc
 
 __all__ = [
-    'CythonModuleMeta', 'CythonModule'
+    'CythonModuleMeta', 'CythonModule',
+    'CapsuleTable', 'UnsupportedSignatureWarning', 'parse_capsule_signature'
 ]
 
 _DUMMYMODULE = object()
 
 
+class UnsupportedSignatureWarning(RuntimeWarning):
+    ...
+
+
+_c_type_names: dict[str, type[CDataBase]] = {
+    'char': c_char, 'signed char': c_byte, 'unsigned char': c_ubyte,
+    'short': c_short, 'short int': c_short, 'unsigned short': c_ushort, 'unsigned short int': c_ushort,
+    'int': c_int, 'signed int': c_int, 'signed': c_int, 'unsigned int': c_uint, 'unsigned': c_uint,
+    'long': c_long, 'long int': c_long, 'unsigned long': c_ulong, 'unsigned long int': c_ulong,
+    'long long': c_longlong, 'unsigned long long': c_ulonglong,
+    'float': c_float, 'double': c_double, 'long double': c_longdouble,
+    'int8_t': c_int8, 'int16_t': c_int16, 'int32_t': c_int32, 'int64_t': c_int64,
+    'uint8_t': c_uint8, 'uint16_t': c_uint16, 'uint32_t': c_uint32, 'uint64_t': c_uint64,
+    'size_t': c_size_t, 'Py_ssize_t': c_ssize_t, 'Py_hash_t': c_ssize_t, 'Py_UCS4': c_uint32,
+}
+
+_c_known_names = {*_c_type_names, 'void', 'PyObject'}
+
+_c_qualifiers = {'const', 'volatile', 'restrict', '__restrict', 'struct', 'union', 'enum', 'CYTHON_UNUSED'}
+
+
+def _split_params(params: str) -> list[str]:
+    parts, depth, start = list[str](), 0, 0
+
+    for i, char in enumerate(params):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and not depth:
+            parts.append(params[start:i])
+            start = i + 1
+
+    parts.append(params[start:])
+
+    return [part.strip() for part in parts]
+
+
+def _parse_ctype(declaration: str) -> type[CDataBase]:
+    # Function pointers are passed around as plain addresses.
+    if '(' in declaration:
+        return c_void_p
+
+    stars = declaration.count('*')
+    is_enum = 'enum' in declaration.split()
+    tokens = [token for token in declaration.replace('*', ' ').split() if token not in _c_qualifiers]
+
+    name = ' '.join(tokens)
+
+    # Cython keeps the parameter names for some arguments, like __pyx_skip_dispatch.
+    if len(tokens) > 1 and name not in _c_known_names and ' '.join(tokens[:-1]) in _c_known_names:
+        name = ' '.join(tokens[:-1])
+
+    if name == 'void':
+        return c_void_p
+
+    if name == 'PyObject':
+        if stars == 1:
+            return py_object
+
+        return c_void_p
+
+    if name == 'char' and stars == 1:
+        return String
+
+    base: type[CDataBase] | None = c_int if is_enum and not stars else _c_type_names.get(name)
+
+    if base is None:
+        if stars:
+            return c_void_p
+
+        raise TypeError(
+            f'parse_capsule_signature: Unsupported by-value C type \'{declaration}\'!'
+        )
+
+    if stars == 1:
+        return POINTER(base)
+
+    if stars > 1:
+        return c_void_p
+
+    return base
+
+
+@lru_cache
+def parse_capsule_signature(signature: str) -> tuple[type[CDataBase], tuple[type[CDataBase], ...]]:
+    signature = signature.strip()
+
+    if not signature.endswith(')'):
+        raise ValueError(
+            f'parse_capsule_signature: \'{signature}\' is not a function signature!'
+        )
+
+    depth = 0
+
+    for i in range(len(signature) - 1, -1, -1):
+        if signature[i] == ')':
+            depth += 1
+        elif signature[i] == '(':
+            depth -= 1
+
+            if not depth:
+                break
+    else:
+        raise ValueError(
+            f'parse_capsule_signature: Unbalanced parentheses in \'{signature}\'!'
+        )
+
+    restype = _parse_ctype(signature[:i])
+    params = signature[i + 1:-1].strip()
+
+    if params in {'', 'void'}:
+        return restype, ()
+
+    return restype, tuple(_parse_ctype(param) for param in _split_params(params))
+
+
+class CapsuleTable:
+    def __init__(self, module: ModuleType) -> None:
+        self.module = module
+        self.capsules: dict[str, Any] = module.__pyx_capi__
+        self.signatures = dict[str, bytes]()
+        self.pointers = dict[str, int]()
+        self.functypes = dict[str, type[FuncPointer[Any, Any]] | None]()
+
+    @classmethod
+    def of(cls, module: ModuleType) -> CapsuleTable:
+        key = (module.__name__, getattr(module, '__version__', None), getattr(module, '__file__', None))
+
+        try:
+            return _capsule_tables[key]
+        except KeyError:
+            table = _capsule_tables[key] = cls(module)
+
+        return table
+
+    def _capsule(self, name: str) -> Any:
+        try:
+            return self.capsules[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+    def signature(self, name: str) -> bytes:
+        try:
+            return self.signatures[name]
+        except KeyError:
+            # c_char_p and c_void_p results come back as bytes and int.
+            signature = self.signatures[name] = cast(bytes, PyCapsule.GetName(self._capsule(name)))
+
+        return signature
+
+    def pointer(self, name: str) -> int:
+        try:
+            return self.pointers[name]
+        except KeyError:
+            capsule_ptr = PyCapsule.GetPointer(self._capsule(name), c_char_p(self.signature(name)))
+            pointer = self.pointers[name] = cast(int, capsule_ptr)
+
+        return pointer
+
+    def functype(self, name: str) -> type[FuncPointer[Any, Any]] | None:
+        try:
+            return self.functypes[name]
+        except KeyError:
+            ...
+
+        try:
+            restype, argtypes = parse_capsule_signature(self.signature(name).decode())
+        except (TypeError, ValueError):
+            functype = None
+        else:
+            functype = get_cfunctype(restype, argtypes)
+
+        self.functypes[name] = functype
+
+        return functype
+
+    def resolve_all(self) -> dict[str, int]:
+        for name in self.capsules:
+            self.pointer(name)
+
+        return self.pointers
+
+
+# Capsules can only change when the module does, so tables are shared process-wide per module version.
+_capsule_tables = dict[tuple[str, str | None, str | None], CapsuleTable]()
+
+
+class _LazyCapsuleFunction:
+    def __init__(self, table: CapsuleTable, name: str, func: Any | None = None) -> None:
+        self.table = table
+        self.name = name
+        self.func = func
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr_name = name
+
+    def bind(self, owner: type) -> Any:
+        if self.func is None:
+            func_type = self.table.functype(self.name)
+
+            if func_type is None:
+                raise TypeError(
+                    f'{owner.__name__}: Can\'t autobind {self.name}, its signature '
+                    f'\'{self.table.signature(self.name).decode()}\' is not supported!'
+                )
+
+            value = func_type(self.table.pointer(self.name))
+        else:
+            norm = normalize_cfunc(self.func, self.attr_name)
+            value = bind_cfunc(as_cfunc(norm)(self.table.pointer(norm.oname or norm.name)), norm)
+
+        # Replace ourselves, so that later lookups don't go through the descriptor anymore.
+        value = register_bound(owner, self.attr_name, value)
+        setattr(owner, self.attr_name, value)
+
+        return value
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        return self.bind(owner or type(instance))
+
+
 class CythonModuleMetaDict(MetaClassDictBase):
-    def __init__(self, cls_name: str, module: ModuleType | None) -> None:
+    def __init__(
+        self, cls_name: str, module: ModuleType | None, autobind: bool | Iterable[str] = False, lazy: bool = False
+    ) -> None:
         self.cls_name = cls_name
         self.module = module
+        self.lazy = lazy
 
         if module:
-            self.capsules = module.__pyx_capi__
+            self.table = CapsuleTable.of(module)
+            self.capsules = self.table.capsules
         else:
             self.capsules = dict[str, Any]()
 
         super().__init__(module=self.module, capsules=self.capsules)
 
+        if autobind:
+            self._autobind(None if autobind is True else list(autobind))
+
+    def _autobind(self, names: list[str] | None) -> None:
+        if self.module is None:
+            for name in names or ():
+                dict.__setitem__(self, name, self._raise_module_unavailable)
+            return
+
+        for name in (self.capsules if names is None else names):
+            if name not in self.capsules:
+                raise AttributeError(name)
+
+            if self.lazy:
+                dict.__setitem__(self, name, _LazyCapsuleFunction(self.table, name))
+                continue
+
+            func_type = self.table.functype(name)
+
+            if func_type is None:
+                # Binding everything skips what we can't call, like functions taking Cython typedefs by value.
+                if names is None:
+                    warnings.warn(
+                        f'{self.cls_name}: Skipped autobinding {name}, its signature '
+                        f'\'{self.table.signature(name).decode()}\' is not supported!',
+                        UnsupportedSignatureWarning
+                    )
+                    continue
+
+                raise TypeError(
+                    f'{self.cls_name}: Can\'t autobind {name}, its signature '
+                    f'\'{self.table.signature(name).decode()}\' is not supported!'
+                )
+
+            dict.__setitem__(self, name, func_type(self.table.pointer(name)))
+
     def _setitem_(self, name: str, value: Any, /) -> None:
         if self.to_process(value):
             if self.module is None:
                 value = self._raise_module_unavailable
+            elif self.lazy:
+                value = _LazyCapsuleFunction(self.table, name, value)
             else:
                 norm = normalize_cfunc(value, name)
-                capsule_name = norm.oname or norm.name
-
-                try:
-                    capsule = self.capsules[capsule_name]
-                except KeyError as e:
-                    raise AttributeError(capsule_name) from e
 
                 func_type = as_cfunc(norm)
 
-                mangled_name = PyCapsule.GetName(capsule)
-                capsule_ptr = PyCapsule.GetPointer(capsule, mangled_name)
-
-                value = func_type(capsule_ptr)
+                value = bind_cfunc(func_type(self.table.pointer(norm.oname or norm.name)), norm)
 
         return dict.__setitem__(self, name, value)
 
@@ -73,12 +340,27 @@ class CythonModuleMeta(StructMeta):
                 'CythonModule: Passed module isn\'t a cython module!'
             )
 
-        return CythonModuleMetaDict(name, module)
+        return CythonModuleMetaDict(name, module, kwargs.get('autobind', False), kwargs.get('lazy', False))
 
     def __new__(
         cls: type[Self], name: str, bases: tuple[type, ...], namespace: dict[str, Any], /, **kwargs: Any
     ) -> Self:
-        return super().__new__(cls, name, bases, namespace)  # type: ignore
+        self = super().__new__(cls, name, bases, namespace)  # type: ignore[misc]
+
+        if isinstance(namespace, CythonModuleMetaDict):
+            for attr, value in namespace.items():
+                if not attr.startswith('__') and not isinstance(value, _LazyCapsuleFunction) and callable(value):
+                    setattr(self, attr, register_bound(self, attr, value))
+
+        return self  # type: ignore
+
+    def bind_all(cls) -> None:
+        for value in list(cls.__dict__.values()):
+            if isinstance(value, _LazyCapsuleFunction):
+                value.bind(cls)
+
+
+copyreg.pickle(CythonModuleMeta, reduce_class)
 
 
 class CythonModule(Struct, metaclass=CythonModuleMeta, module=_DUMMYMODULE):
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import atexit
+import warnings
+from collections import Counter, deque
+from contextlib import contextmanager
+from ctypes import c_void_p, cast
+from threading import Event, Lock, RLock, Thread
+from typing import Any, Callable, ClassVar, Generic, Iterator, TypeVar
+from weakref import WeakSet
+
+from .types import C_T, Pointer
+
+__all__ = [
+    'HandleReaper', 'OwnedHandle', 'HandleLeakWarning',
+    'default_reaper', 'leak_report'
+]
+
+
+# Not a ResourceWarning, those are hidden by the default filters and leaks should be seen.
+class HandleLeakWarning(RuntimeWarning):
+    ...
+
+
+# Every reaper is drained at exit, so queued frees are never lost.
+_reapers = WeakSet[Any]()
+
+
+class HandleReaper:
+    def __init__(self, threshold: int = 256) -> None:
+        self.threshold = threshold
+
+        self.freed = 0
+        self.batches = 0
+
+        # deque.append and popleft are atomic, so producers never have to take the lock.
+        self._pending = deque[tuple[Callable[[Any], Any], Any]]()
+
+        # Reentrant, since a destructor might close other handles and flush again.
+        self._flush_lock = RLock()
+        self._wakeup = Event()
+        self._start_lock = Lock()
+        self._thread: Thread | None = None
+        self._stopping = False
+
+        _reapers.add(self)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, destructor: Callable[[Any], Any], pointer: Any, flush: bool = True) -> None:
+        self._pending.append((destructor, pointer))
+
+        if len(self._pending) >= self.threshold:
+            if self._thread is not None:
+                self._wakeup.set()
+            elif flush:
+                self.flush()
+            else:
+                # Finalizers never run destructors at whatever point the GC hit, the thread takes over from here.
+                self._start_from_finalizer()
+
+    def _start_from_finalizer(self) -> None:
+        # The GC might have interrupted start() on this very thread, which then finishes the job.
+        if not self._start_lock.acquire(blocking=False):
+            return
+
+        try:
+            self._start()
+            self._wakeup.set()
+        except RuntimeError:
+            # No more threads at interpreter shutdown, the exit hook drains the queue instead.
+            ...
+        finally:
+            self._start_lock.release()
+
+    def flush(self) -> int:
+        freed = 0
+        popleft = self._pending.popleft
+
+        with self._flush_lock:
+            while True:
+                try:
+                    destructor, pointer = popleft()
+                except IndexError:
+                    break
+
+                destructor(pointer)
+                freed += 1
+
+            if freed:
+                self.freed += freed
+                self.batches += 1
+
+        return freed
+
+    @contextmanager
+    def scope(self) -> Iterator[HandleReaper]:
+        try:
+            yield self
+        finally:
+            self.flush()
+
+    def start(self, interval: float = 0.1) -> None:
+        with self._start_lock:
+            self._start(interval)
+
+    def _start(self, interval: float = 0.1) -> None:
+        if self._thread is not None:
+            return
+
+        self._stopping = False
+
+        def _run() -> None:
+            while not self._stopping:
+                self._wakeup.wait(interval)
+                self._wakeup.clear()
+                self.flush()
+
+        thread = Thread(target=_run, name='ctypedffi-reaper', daemon=True)
+        thread.start()
+
+        self._thread = thread
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join()
+        self._thread = None
+
+        self.flush()
+
+
+default_reaper = HandleReaper()
+
+
+class OwnedHandle(Generic[C_T]):
+    __slots__ = ('address', '_pointer', '_closed', '__weakref__')
+
+    __destructor__: ClassVar[Callable[[Any], Any]]
+    __reaper__: ClassVar[HandleReaper] = default_reaper
+    __pointer_type__: ClassVar[type[Any]] = c_void_p
+
+    _live: ClassVar[WeakSet[OwnedHandle[Any]]] = WeakSet()
+
+    def __init_subclass__(
+        cls, destructor: Callable[[Any], Any] | None = None, reaper: HandleReaper | None = None, **kwargs: Any
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if destructor is not None:
+            cls.__destructor__ = staticmethod(destructor)
+
+        if reaper is not None:
+            cls.__reaper__ = reaper
+
+        for base in getattr(cls, '__orig_bases__', ()):
+            if getattr(base, '__origin__', None) is OwnedHandle and not isinstance(base.__args__[0], TypeVar):
+                cls.__pointer_type__ = Pointer.normalize(Pointer[base.__args__[0]])  # type: ignore
+
+    def __init__(self, pointer: Any) -> None:
+        if not hasattr(self, '__destructor__'):
+            raise TypeError(
+                f'{type(self).__name__}: You have to declare a destructor with `destructor=...` in the class kwargs!'
+            )
+
+        if isinstance(pointer, int) or pointer is None:
+            address = pointer
+        else:
+            address = cast(pointer, c_void_p).value
+
+        if not address:
+            raise ValueError(f'{type(self).__name__}: Can\'t take ownership of a NULL pointer!')
+
+        self.address = address
+        self._closed = False
+
+        # The typed pointer is built once, so passing the handle to C or freeing it doesn't allocate.
+        self._pointer: Pointer[C_T] = cast(address, self.__pointer_type__)
+
+        OwnedHandle._live.add(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pointer(self) -> Pointer[C_T]:
+        if self._closed:
+            raise ValueError(f'{type(self).__name__}: The handle has been closed!')
+
+        return self._pointer
+
+    @property
+    def _as_parameter_(self) -> Pointer[C_T]:
+        return self.pointer
+
+    def close(self) -> None:
+        self._close(True)
+
+    def _close(self, flush: bool) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        self.__reaper__.enqueue(type(self).__destructor__, self._pointer, flush)
+
+    def close_now(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+        type(self).__destructor__(self._pointer)
+
+    def detach(self) -> int:
+        self._closed = True
+
+        return self.address
+
+    def __enter__(self) -> OwnedHandle[C_T]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self._close(False)
+        except Exception:
+            # The reaper or destructor might already be gone at interpreter shutdown.
+            ...
+
+    def __repr__(self) -> str:
+        state = 'closed' if self._closed else f'0x{self.address:x}'
+        return f'<{type(self).__name__} {state}>'
+
+
+def leak_report() -> Counter[str]:
+    return Counter(type(handle).__qualname__ for handle in list(OwnedHandle._live) if not handle.closed)
+
+
+def _warn_leaks() -> None:
+    if (leaks := leak_report()):
+        warnings.warn(
+            'OwnedHandle: Handles still open at exit: '
+            + ', '.join(f'{name} x{count}' for name, count in leaks.most_common()),
+            HandleLeakWarning
+        )
+
+
+@atexit.register
+def _report_leaks_at_exit() -> None:
+    _warn_leaks()
+
+    for reaper in list(_reapers):
+        reaper.stop()
+        reaper.flush()
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from ctypes import Array, Structure, Union, _Pointer, _SimpleCData, alignment, c_int, sizeof
+from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any
+
+from .types import CDataBase
+
+__all__ = [
+    'FieldLayout', 'LayoutReport',
+    'struct_fields', 'layout_fingerprint'
+]
+
+
+class _CFieldProbe(Structure):
+    _fields_ = [('probe', c_int)]
+
+
+_CField = type(_CFieldProbe.probe)
+
+
+@dataclass(frozen=True)
+class FieldLayout:
+    name: str
+    ctype: type[CDataBase]
+    offset: int
+    size: int
+    bit_offset: int | None = None
+    bit_size: int | None = None
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.size
+
+
+def _field_bits(field: Any, ctype: type[CDataBase], bitfield: bool) -> tuple[int, int | None, int | None]:
+    if hasattr(field, 'bit_size'):
+        if not getattr(field, 'is_bitfield', False):
+            return field.byte_size, None, None
+
+        return field.byte_size, field.bit_offset, field.bit_size
+
+    # Before 3.13, CField.size packs bitfields as (bit_size << 16) | bit_offset, which plain fields
+    # of 64 KiB or more can't be told apart from, only the 3-tuple _fields_ entry says which it is.
+    if bitfield:
+        return sizeof(ctype), field.size & 0xFFFF, field.size >> 16
+
+    return field.size, None, None
+
+
+@lru_cache
+def struct_fields(ctype: type[CDataBase]) -> tuple[FieldLayout, ...]:
+    fields = list[FieldLayout]()
+
+    for cls in reversed(ctype.__mro__):
+        for name, ftype, *bits in cls.__dict__.get('_fields_', ()):
+            field = cls.__dict__.get(name, None)
+
+            # Pointer[T] fields wrap their CField, see struct._PointerField.
+            field = getattr(field, 'cfield', field)
+
+            # Struct.annotate appends to the original class' _fields_ after it has been finalized,
+            # the actual fields only live in its inner subclass.
+            if not isinstance(field, _CField):
+                continue
+
+            size, bit_offset, bit_size = _field_bits(field, ftype, bool(bits))
+
+            fields.append(FieldLayout(name, ftype, field.offset, size, bit_offset, bit_size))
+
+    # Declaration order, bitfields of big-endian structs are allocated from the top bits down.
+    return tuple(fields)
+
+
+def _byteorder(ctype: type[CDataBase]) -> str:
+    if getattr(ctype, '__ctype_be__', None) is ctype and getattr(ctype, '__ctype_le__', None) is not ctype:
+        return '>'
+
+    if getattr(ctype, '__ctype_le__', None) is ctype and getattr(ctype, '__ctype_be__', None) is not ctype:
+        return '<'
+
+    return '='
+
+
+def _describe(ctype: type[CDataBase]) -> tuple[Any, ...]:
+    if isinstance(ctype, type) and issubclass(ctype, (Structure, Union)):
+        return (
+            'union' if issubclass(ctype, Union) else 'struct', sizeof(ctype), alignment(ctype),
+            tuple(
+                (f.name, f.offset, f.size, f.bit_offset, f.bit_size, _describe(f.ctype))
+                for f in struct_fields(ctype)
+            )
+        )
+
+    if isinstance(ctype, type) and issubclass(ctype, Array):
+        return ('array', ctype._length_, _describe(ctype._type_))  # type: ignore
+
+    if isinstance(ctype, type) and issubclass(ctype, _Pointer):
+        # Pointees are only described by name, pointers are process-local anyway and types can be recursive.
+        return ('pointer', sizeof(ctype), getattr(ctype._type_, '__name__', repr(ctype._type_)))
+
+    if isinstance(ctype, type) and issubclass(ctype, _SimpleCData):
+        return ('simple', ctype._type_, sizeof(ctype), _byteorder(ctype))  # type: ignore
+
+    return ('opaque', getattr(ctype, '__name__', repr(ctype)), sizeof(ctype))
+
+
+@lru_cache
+def layout_fingerprint(ctype: type[CDataBase]) -> bytes:
+    return blake2b(repr(_describe(ctype)).encode(), digest_size=16).digest()
+
+
+@dataclass(frozen=True)
+class LayoutReport:
+    name: str
+    size: int
+    alignment: int
+    fields: tuple[FieldLayout, ...]
+    padding: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def of(cls, ctype: type[CDataBase]) -> LayoutReport:
+        fields = struct_fields(ctype)
+        padding = list[tuple[int, int]]()
+        position = 0
+
+        # Bitfields share their storage unit, so gaps are computed over the byte ranges covered by any field.
+        for field in fields:
+            if field.offset > position:
+                padding.append((position, field.offset - position))
+
+            position = max(position, field.end)
+
+        if sizeof(ctype) > position:
+            padding.append((position, sizeof(ctype) - position))
+
+        return cls(ctype.__name__, sizeof(ctype), alignment(ctype), fields, tuple(padding))
+
+    @property
+    def padding_bytes(self) -> int:
+        return sum(size for _, size in self.padding)
+
+    @property
+    def padding_ratio(self) -> float:
+        return self.padding_bytes / self.size if self.size else 0.0
+
+    def __str__(self) -> str:
+        rows = list[tuple[int, str]]()
+
+        for field in self.fields:
+            bits = ''
+
+            if field.bit_offset is not None and field.bit_size is not None:
+                bits = f' bits {field.bit_offset}:{field.bit_offset + field.bit_size}'
+
+            rows.append((
+                field.offset, f'{field.offset:>6} {field.size:>6}  {field.name}: {field.ctype.__name__}{bits}'
+            ))
+
+        for offset, size in self.padding:
+            rows.append((offset, f'{offset:>6} {size:>6}  <padding>'))
+
+        header = [
+            f'{self.name}: size {self.size}, alignment {self.alignment}, '
+            f'padding {self.padding_bytes} ({self.padding_ratio:.1%})',
+            f'{"offset":>6} {"size":>6}  field'
+        ]
+
+        return '\n'.join(header + [row for _, row in sorted(rows, key=lambda row: row[0])])
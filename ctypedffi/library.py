@@ -1,23 +1,111 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, cast
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 from ctypesgen.libraryloader import LibraryLoader, load_library  # type: ignore
 
+from .serialize import register_bound
 from .types import CallingConvention, MetaClassDictBase, Self
-from .utils import normalize_cfunc
+from .utils import bind_cfunc, normalize_cfunc
 
 __all__ = [
-    'LibraryMeta', 'Library',
-    'CallingConvention'
+    'LibraryMeta', 'Library', 'LibraryVariant',
+    'CallingConvention',
+    'cpu_flags'
 ]
 
 
+@lru_cache(maxsize=None)
+def cpu_flags() -> frozenset[str]:
+    flags = set[str]()
+
+    try:
+        with open('/proc/cpuinfo') as cpuinfo:
+            for line in cpuinfo:
+                key, _, value = line.partition(':')
+
+                # x86 reports 'flags', arm 'Features', every core repeats them so the first one is enough.
+                if key.strip() in ('flags', 'Features'):
+                    flags.update(value.split())
+                    break
+    except OSError:
+        pass
+
+    return frozenset(flags)
+
+
+@dataclass(frozen=True)
+class LibraryVariant:
+    name: str
+    requires: Iterable[str] | Callable[[], bool] = ()
+
+    def __post_init__(self) -> None:
+        # A single flag would otherwise be checked letter by letter, and lists would break hashing.
+        if isinstance(self.requires, str):
+            object.__setattr__(self, 'requires', frozenset((self.requires,)))
+        elif not callable(self.requires):
+            object.__setattr__(self, 'requires', frozenset(self.requires))
+
+    def supported(self) -> bool:
+        if callable(self.requires):
+            return bool(self.requires())
+
+        return cpu_flags().issuperset(self.requires)
+
+
+LibraryBenchmark = Callable[[LibraryLoader], float]
+
+
+def _select_variant(
+    lib: str | Sequence[str | LibraryVariant], benchmark: LibraryBenchmark | None
+) -> tuple[LibraryVariant, LibraryLoader]:
+    if isinstance(lib, str):
+        return LibraryVariant(lib), load_library(lib)
+
+    variants = [LibraryVariant(v) if isinstance(v, str) else v for v in lib]
+    loaded = list[tuple[LibraryVariant, LibraryLoader]]()
+    errors = list[str]()
+
+    for variant in variants:
+        if not variant.supported():
+            errors.append(f'{variant.name} (unsupported)')
+            continue
+
+        try:
+            loaded.append((variant, load_library(variant.name)))
+        except ImportError:
+            errors.append(f'{variant.name} (not found)')
+            continue
+
+        # Variants are listed best first, without a benchmark the first one that loads wins.
+        if benchmark is None:
+            break
+
+    if not loaded:
+        raise ImportError(
+            f'Library: None of the library variants could be loaded, tried {", ".join(errors)}!'
+        )
+
+    if benchmark is None or len(loaded) == 1:
+        return loaded[0]
+
+    measure = benchmark
+
+    # Lower is better, ties keep the listed order.
+    return min(loaded, key=lambda item: measure(item[1]))
+
+
 class LibraryMetaDict(MetaClassDictBase):
-    def __init__(self, lib_name: str, def_cconv: CallingConvention):
-        self.lib = load_library(lib_name)
+    def __init__(
+        self, lib_name: str | Sequence[str | LibraryVariant], def_cconv: CallingConvention,
+        benchmark: LibraryBenchmark | None = None
+    ):
+        self.variant, self.lib = _select_variant(lib_name, benchmark)
         self.def_cconv = def_cconv
         self['__pytydffi_lib__'] = self.lib
+        self['__pytydffi_variant__'] = self.variant
 
     def _setitem_(self, name: str, value: Any, /) -> None:
         if self.to_process(value):
@@ -26,13 +114,16 @@ class LibraryMetaDict(MetaClassDictBase):
             value = self.lib.get(norm.oname or norm.name, norm.cconv.value)
             value.argtypes = norm.oargs_types or norm.args_types
             value.restype = norm.ores_type or norm.res_type
+            value = bind_cfunc(value, norm)
 
         return dict.__setitem__(self, name, value)
 
 
 class LibraryMeta(type):
     @classmethod
-    def _check_self(self, name: str, bases: tuple[type, ...], **kwargs: Any) -> str | None:
+    def _check_self(
+        self, name: str, bases: tuple[type, ...], **kwargs: Any
+    ) -> str | Sequence[str | LibraryVariant] | None:
         if name == 'Library' and not bases:
             return None
 
@@ -43,17 +134,23 @@ class LibraryMeta(type):
 
         lib_name = kwargs.get('lib', None)
 
-        if lib_name is None:
+        if not lib_name:
             raise ValueError(
                 'Library: You have to specify the library name with `lib=\'libname\'`!'
             )
 
-        return cast(str, lib_name)
+        return lib_name  # type: ignore
 
     @property
     def lib(self) -> LibraryLoader:
         return self.__dict__.__getitem__('__pytydffi_lib__')
 
+    @property
+    def variant(self) -> LibraryVariant:
+        variant: LibraryVariant = self.__dict__.__getitem__('__pytydffi_variant__')
+
+        return variant
+
     @classmethod
     def __prepare__(metacls, name: str, bases: tuple[type, ...], /, **kwargs: Any) -> Mapping[str, object]:
         lib_name = LibraryMeta._check_self(name, bases, **kwargs)
@@ -61,7 +158,7 @@ class LibraryMeta(type):
         if lib_name is None:
             return dict()
 
-        return LibraryMetaDict(lib_name, kwargs.get('cconv', CallingConvention.C))
+        return LibraryMetaDict(lib_name, kwargs.get('cconv', CallingConvention.C), kwargs.get('benchmark', None))
 
     def __new__(
         cls: type[Self], name: str, bases: tuple[type, ...], namespace: dict[str, Any],
@@ -69,7 +166,14 @@ class LibraryMeta(type):
     ) -> Self:
         LibraryMeta._check_self(name, bases, **kwargs)
 
-        return type.__new__(cls, name, bases, namespace)
+        self = type.__new__(cls, name, bases, namespace)
+
+        if isinstance(namespace, LibraryMetaDict):
+            for attr, value in namespace.items():
+                if not attr.startswith('__') and LibraryMetaDict.to_process(value):
+                    setattr(self, attr, register_bound(self, attr, value))  # type: ignore
+
+        return self
 
 
 class Library(metaclass=LibraryMeta):
@@ -1 +1,3 @@
+from . import py_bytes as PyBytes  # noqa: F401, F403
 from . import py_capsule as PyCapsule  # noqa: F401, F403
+from . import py_memoryview as PyMemoryView  # noqa: F401, F403
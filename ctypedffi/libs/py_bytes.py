@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from ctypes import c_ssize_t, pythonapi
+
+from ..ctypes import c_void_p, py_object
+from ..utils import wrap_func_pointer
+
+
+@wrap_func_pointer(pythonapi.PyBytes_FromStringAndSize)
+def FromStringAndSize(v: c_void_p, len: c_ssize_t) -> py_object:
+    ...
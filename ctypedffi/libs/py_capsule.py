@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from ctypes import pythonapi
+from ctypes import CFUNCTYPE, pythonapi
 
-from ..ctypes import c_char_p, c_void_p, py_object
+from ..ctypes import c_char_p, c_int, c_void_p, py_object
 from ..utils import wrap_func_pointer
 
+# The destructor gets the capsule while it's being deallocated, so it must not be handled as a Python object.
+Destructor = CFUNCTYPE(None, c_void_p)
+
+
+@wrap_func_pointer(pythonapi.PyCapsule_New)
+def New(pointer: c_void_p, name: c_char_p, destructor: Destructor) -> py_object:
+    ...
+
 
 @wrap_func_pointer(pythonapi.PyCapsule_GetName)
 def GetName(obj: py_object) -> c_char_p:
@@ -14,3 +22,18 @@ def GetName(obj: py_object) -> c_char_p:
 @wrap_func_pointer(pythonapi.PyCapsule_GetPointer)
 def GetPointer(obj: py_object, name: c_char_p) -> c_void_p:
     ...
+
+
+@wrap_func_pointer(pythonapi.PyCapsule_GetContext)
+def GetContext(obj: py_object) -> c_void_p:
+    ...
+
+
+@wrap_func_pointer(pythonapi.PyCapsule_SetContext)
+def SetContext(obj: py_object, context: c_void_p) -> c_int:
+    ...
+
+
+@wrap_func_pointer(pythonapi.PyCapsule_IsValid)
+def IsValid(obj: py_object, name: c_char_p) -> c_int:
+    ...
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from ctypes import c_ssize_t, pythonapi
+
+from ..ctypes import c_int, c_void_p, py_object
+from ..utils import wrap_func_pointer
+
+PyBUF_READ = 0x100
+PyBUF_WRITE = 0x200
+
+
+@wrap_func_pointer(pythonapi.PyMemoryView_FromMemory)
+def FromMemory(mem: c_void_p, size: c_ssize_t, flags: c_int) -> py_object:
+    ...
@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from ctypes import Array, addressof, c_char, memmove, memset, sizeof
+from dataclasses import dataclass, fields
+from threading import Lock, local
+from typing import Any, ContextManager, Generic, Iterator
+from weakref import finalize
+
+from .types import C_T_CDB, CDataBase
+
+__all__ = [
+    'PoolStats', 'ScratchPool', 'StructPool',
+    'scratch_pool', 'scratch_buffer', 'scratch_struct',
+    'struct_pool_stats'
+]
+
+
+@dataclass
+class PoolStats:
+    acquired: int = 0
+    reused: int = 0
+    allocated: int = 0
+    released: int = 0
+    discarded: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.reused / self.acquired if self.acquired else 0.0
+
+    def __add__(self, other: PoolStats) -> PoolStats:
+        return PoolStats(*(getattr(self, f.name) + getattr(other, f.name) for f in fields(self)))
+
+
+# Set on everything sitting on a free list, releasing twice would hand the same storage to two users later on.
+_FREE = '__ctdffi_free__'
+
+
+def _check_in_use(pool: Any, value: CDataBase) -> None:
+    if value.__dict__.get(_FREE, False):
+        raise ValueError(
+            f'{pool.__class__.__name__}: The {type(value).__name__} was already released!'
+        )
+
+    value.__dict__[_FREE] = True
+
+
+class _ThreadToken:
+    __slots__ = ('__weakref__',)
+
+
+def _retire_stats(lock: Lock, thread_stats: list[PoolStats], retired: PoolStats, stats: PoolStats) -> None:
+    with lock:
+        del thread_stats[next(i for i, item in enumerate(thread_stats) if item is stats)]
+
+        for field in fields(stats):
+            setattr(retired, field.name, getattr(retired, field.name) + getattr(stats, field.name))
+
+
+def _track_stats(local: Any, pool: ScratchPool | StructPool[Any]) -> None:
+    local.stats = PoolStats()
+
+    with pool._stats_lock:
+        pool._thread_stats.append(local.stats)
+
+    # Counters of finished threads are folded into one, the token dies with the thread's locals.
+    local.token = _ThreadToken()
+    finalize(local.token, _retire_stats, pool._stats_lock, pool._thread_stats, pool._retired, local.stats)
+
+
+class _LocalFreeLists(local):
+    def __init__(self, pool: ScratchPool) -> None:
+        self.buffers = dict[int, list[Array[c_char]]]()
+        self.structs = dict[type[CDataBase], list[CDataBase]]()
+
+        _track_stats(self, pool)
+
+
+class ScratchPool:
+    def __init__(self, max_per_class: int = 8, min_size: int = 64, max_size: int = 1 << 20) -> None:
+        self.max_per_class = max_per_class
+        self.min_size = min_size
+        self.max_size = max_size
+
+        self._stats_lock = Lock()
+        self._thread_stats = list[PoolStats]()
+        self._retired = PoolStats()
+
+        # Every thread gets its own free lists, so acquiring and releasing never has to lock.
+        # Anything acquired is removed from the free list, so tasks interleaving on a thread never share storage.
+        self._local = _LocalFreeLists(self)
+
+    def size_class(self, size: int) -> int:
+        return max(self.min_size, 1 << (size - 1).bit_length())
+
+    def acquire_buffer(self, size: int, zero: bool = False) -> Array[c_char]:
+        local = self._local
+        local.stats.acquired += 1
+
+        if size > self.max_size:
+            local.stats.allocated += 1
+            return (c_char * size)()
+
+        size_class = self.size_class(size)
+
+        try:
+            buffer = local.buffers[size_class].pop()
+        except (KeyError, IndexError):
+            local.stats.allocated += 1
+            return (c_char * size_class)()
+
+        local.stats.reused += 1
+        del buffer.__dict__[_FREE]
+
+        if zero:
+            memset(buffer, 0, size_class)
+        else:
+            # Strings left over from a previous user must never be read back by accident.
+            buffer[0] = b'\0'
+
+        return buffer
+
+    def release_buffer(self, buffer: Array[c_char]) -> None:
+        _check_in_use(self, buffer)
+
+        local = self._local
+        local.stats.released += 1
+
+        size_class = len(buffer)
+
+        if size_class > self.max_size or size_class != self.size_class(size_class):
+            local.stats.discarded += 1
+            return
+
+        free_list = local.buffers.setdefault(size_class, [])
+
+        if len(free_list) >= self.max_per_class:
+            local.stats.discarded += 1
+            return
+
+        free_list.append(buffer)
+
+    def acquire_struct(self, ctype: type[C_T_CDB], zero: bool = False) -> C_T_CDB:
+        local = self._local
+        local.stats.acquired += 1
+
+        try:
+            value = local.structs[ctype].pop()
+        except (KeyError, IndexError):
+            local.stats.allocated += 1
+            return ctype()
+
+        local.stats.reused += 1
+        del value.__dict__[_FREE]
+
+        if zero:
+            memset(addressof(value), 0, sizeof(ctype))
+
+        return value  # type: ignore
+
+    def acquire_copy(self, value: C_T_CDB) -> C_T_CDB:
+        local = self._local
+        local.stats.acquired += 1
+        ctype = type(value)
+
+        # Unlike acquire_struct, misses cost no more than a plain copy, so it fits calls whose results may never
+        # come back to the pool.
+        if not (free_list := local.structs.get(ctype, None)):
+            local.stats.allocated += 1
+            return ctype.from_buffer_copy(value)
+
+        local.stats.reused += 1
+        copy = free_list.pop()
+        del copy.__dict__[_FREE]
+
+        memmove(addressof(copy), addressof(value), sizeof(ctype))
+
+        return copy  # type: ignore
+
+    def release_struct(self, value: CDataBase) -> None:
+        _check_in_use(self, value)
+
+        local = self._local
+        local.stats.released += 1
+
+        free_list = local.structs.setdefault(type(value), [])
+
+        if len(free_list) >= self.max_per_class:
+            local.stats.discarded += 1
+            return
+
+        free_list.append(value)
+
+    @contextmanager
+    def buffer(self, size: int, zero: bool = False) -> Iterator[Array[c_char]]:
+        buffer = self.acquire_buffer(size, zero)
+
+        try:
+            yield buffer
+        finally:
+            self.release_buffer(buffer)
+
+    @contextmanager
+    def struct(self, ctype: type[C_T_CDB], zero: bool = False) -> Iterator[C_T_CDB]:
+        value = self.acquire_struct(ctype, zero)
+
+        try:
+            yield value
+        finally:
+            self.release_struct(value)
+
+    def stats(self) -> PoolStats:
+        with self._stats_lock:
+            return sum(self._thread_stats, self._retired + PoolStats())
+
+    def clear(self) -> None:
+        self._local.buffers.clear()
+        self._local.structs.clear()
+
+
+scratch_pool = ScratchPool()
+
+
+def scratch_buffer(size: int, zero: bool = False) -> ContextManager[Array[c_char]]:
+    return scratch_pool.buffer(size, zero)
+
+
+def scratch_struct(ctype: type[C_T_CDB], zero: bool = False) -> ContextManager[C_T_CDB]:
+    return scratch_pool.struct(ctype, zero)
+
+
+class _LocalStructFreeList(local):
+    def __init__(self, pool: StructPool[Any]) -> None:
+        _track_stats(self, pool)
+
+        # Filled by releases only, threads that barely touch the pool don't pay for a full free list.
+        self.free = list[Any]()
+
+
+class _Borrowed(Generic[C_T_CDB]):
+    __slots__ = ('pool', 'value')
+
+    def __init__(self, pool: StructPool[C_T_CDB]) -> None:
+        self.pool = pool
+
+    def __enter__(self) -> C_T_CDB:
+        self.value = self.pool.acquire()
+        return self.value
+
+    def __exit__(self, *args: Any) -> None:
+        self.pool.release(self.value)
+
+    async def __aenter__(self) -> C_T_CDB:
+        return self.__enter__()
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.__exit__()
+
+
+class StructPool(Generic[C_T_CDB]):
+    def __init__(self, ctype: type[C_T_CDB], size: int = 64) -> None:
+        if size < 1:
+            raise ValueError(
+                f'StructPool: The size must be at least 1, not {size}!'
+            )
+
+        self.ctype = ctype
+        self.itemsize = sizeof(ctype)
+        self._size = size
+
+        self._stats_lock = Lock()
+        self._thread_stats = list[PoolStats]()
+        self._retired = PoolStats()
+
+        self._local = _LocalStructFreeList(self)
+
+    @classmethod
+    def of(cls, ctype: type[C_T_CDB], size: int | None = None) -> StructPool[C_T_CDB]:
+        try:
+            pool = _struct_pools[ctype]
+        except KeyError:
+            pool = _struct_pools.setdefault(ctype, cls(ctype, 64 if size is None else size))
+
+        # Threads may already hold free lists filled up to the size, so it can't change later.
+        if size is not None and size != pool.size:
+            raise ValueError(
+                f'StructPool: The pool of {ctype.__name__} already exists with a size of {pool.size}, not {size}!'
+            )
+
+        return pool
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def acquire(self) -> C_T_CDB:
+        local = self._local
+        local.stats.acquired += 1
+
+        try:
+            value: C_T_CDB = local.free.pop()
+        except IndexError:
+            local.stats.allocated += 1
+            return self.ctype()
+
+        local.stats.reused += 1
+        del value.__dict__[_FREE]
+
+        return value
+
+    def release(self, value: C_T_CDB) -> None:
+        if type(value) is not self.ctype:
+            raise TypeError(
+                f'StructPool: Can\'t release a {type(value).__name__} into a pool of {self.ctype.__name__}!'
+            )
+
+        _check_in_use(self, value)
+
+        local = self._local
+        local.stats.released += 1
+
+        if len(local.free) >= self.size:
+            local.stats.discarded += 1
+            return
+
+        # Instances always come out zeroed, like freshly allocated ones.
+        memset(addressof(value), 0, self.itemsize)
+
+        # Whatever was kept alive for the pointer fields would otherwise live as long as the pooled struct.
+        if isinstance(objects := value._objects, dict):
+            objects.clear()
+
+        local.free.append(value)
+
+    def borrow(self) -> _Borrowed[C_T_CDB]:
+        return _Borrowed(self)
+
+    def stats(self) -> PoolStats:
+        with self._stats_lock:
+            return sum(self._thread_stats, self._retired + PoolStats())
+
+    def __len__(self) -> int:
+        return len(self._local.free)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}[{self.ctype.__name__}] of {self.size} per thread>'
+
+
+_struct_pools = dict[type[CDataBase], StructPool[Any]]()
+
+
+def struct_pool_stats() -> dict[str, PoolStats]:
+    return {ctype.__qualname__: pool.stats() for ctype, pool in list(_struct_pools.items())}
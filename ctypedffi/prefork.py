@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import gc
+from ctypes import Array, _Pointer, c_void_p, cast
+from dataclasses import dataclass
+from time import perf_counter
+from types import ModuleType
+from typing import Any
+
+from .codegen import struct_format
+from .cython import CythonModuleMeta
+from .layout import layout_fingerprint, struct_fields
+from .library import Library, LibraryMeta
+from .serialize import contains_pointers
+from .struct import DeferredStruct, StructMeta, _deferred_structs
+from .types import CDataBase, Pointer
+from .utils import MemoizedFunction, OutParamFunction
+from .values import significant_ranges
+
+__all__ = [
+    'WarmupReport', 'warmup'
+]
+
+
+@dataclass
+class WarmupReport:
+    libraries: int = 0
+    functions: int = 0
+    structs: int = 0
+    deferred: int = 0
+    seconds: float = 0.0
+    frozen: int = 0
+
+
+def _bind_symbol(value: Any) -> bool:
+    if isinstance(value, MemoizedFunction):
+        value = value.func
+
+    if isinstance(value, OutParamFunction):
+        # Out storage is per thread, the one built here is inherited by the main thread of every child.
+        value._template()
+        value = value.func_ptr
+
+    if not isinstance(value, CDataBase):
+        return False
+
+    if not cast(value, c_void_p).value:
+        raise ImportError(
+            f'warmup: The symbol {getattr(value, "__name__", value)!r} resolved to NULL!'
+        )
+
+    return True
+
+
+def _warm_library(cls: LibraryMeta, report: WarmupReport) -> None:
+    report.libraries += 1
+    report.functions += sum(
+        _bind_symbol(value) for name, value in list(cls.__dict__.items()) if not name.startswith('__')
+    )
+
+
+def _warm_cython(cls: CythonModuleMeta, report: WarmupReport) -> None:
+    # CythonModule itself has no capsules to bind.
+    if 'capsules' not in cls.__dict__:
+        return
+
+    cls.bind_all()
+
+    report.libraries += 1
+    report.functions += sum(1 for name in cls.__dict__.get('capsules', ()) if name in cls.__dict__)
+
+
+def _warm_struct(cls: StructMeta, report: WarmupReport, seen: set[int]) -> None:
+    if not struct_fields(cls):
+        return
+
+    report.structs += 1
+
+    # Everything derived from the layout is cached on first use, fill them now so children inherit the pages.
+    Pointer[cls]  # type: ignore
+    struct_format(cls)
+    significant_ranges(cls)
+    layout_fingerprint(cls)
+    contains_pointers(cls)
+
+    for field in struct_fields(cls):
+        ctype: Any = field.ctype
+
+        while isinstance(ctype, type) and issubclass(ctype, (Array, _Pointer)):
+            ctype = ctype._type_  # type: ignore
+
+        if isinstance(ctype, StructMeta) and id(ctype) not in seen:
+            seen.add(id(ctype))
+            _warm_struct(ctype, report, seen)
+
+
+def _warm(value: Any, report: WarmupReport, seen: set[int]) -> None:
+    if id(value) in seen:
+        return
+
+    seen.add(id(value))
+
+    if isinstance(value, ModuleType):
+        for item in list(vars(value).values()):
+            if isinstance(item, (LibraryMeta, StructMeta, DeferredStruct)):
+                _warm(item, report, seen)
+    elif isinstance(value, DeferredStruct):
+        _warm(value.resolve(), report, seen)
+    elif isinstance(value, CythonModuleMeta):
+        _warm_cython(value, report)
+    elif isinstance(value, LibraryMeta):
+        if value is not Library:
+            _warm_library(value, report)
+    elif isinstance(value, StructMeta):
+        _warm_struct(value, report, seen)
+    else:
+        raise TypeError(
+            f'warmup: Expected a module, Library, CythonModule or Struct, not {type(value).__name__}!'
+        )
+
+
+def warmup(*targets: Any, freeze: bool = True) -> WarmupReport:
+    start = perf_counter()
+    report = WarmupReport()
+
+    # Only deferred structs reachable from the targets are finalized, the others stay lazy.
+    pending = [struct for struct in _deferred_structs if not struct.finalized]
+    seen = set[int]()
+
+    for target in targets:
+        _warm(target, report, seen)
+
+    report.deferred = sum(struct.finalized for struct in pending)
+
+    if freeze:
+        # Collecting first keeps garbage out of the permanent generation.
+        gc.collect()
+        gc.freeze()
+
+    report.frozen = gc.get_freeze_count()
+    report.seconds = perf_counter() - start
+
+    return report
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import sys
+from ctypes import Array, Structure, Union, _SimpleCData, c_uint8, c_uint16, c_uint32, c_uint64, c_void_p, cast, sizeof
+from functools import lru_cache
+from pickle import PickleBuffer, PicklingError
+from typing import TYPE_CHECKING, Any, Callable
+
+from .layout import layout_fingerprint, struct_fields
+from .types import C_T_CDB, CDataBase
+
+if TYPE_CHECKING:
+    from .arrays import StructArray
+
+__all__ = [
+    'contains_pointers',
+    'dumps_array', 'loads_array',
+    'register_bound'
+]
+
+
+_ARRAY_MAGIC = b'CTDA'
+_ARRAY_VERSION = 1
+
+
+class _ArrayHeader(Structure):
+    _fields_ = [
+        ('magic', c_uint8 * 4),
+        ('version', c_uint16),
+        ('byteorder', c_uint16),
+        ('itemsize', c_uint32),
+        ('count', c_uint64),
+        ('fingerprint', c_uint8 * 16),
+    ]
+
+
+@lru_cache
+def contains_pointers(ctype: type[CDataBase]) -> bool:
+    if issubclass(ctype, (Structure, Union)):
+        return any(contains_pointers(field.ctype) for field in struct_fields(ctype))
+
+    if issubclass(ctype, Array):
+        return contains_pointers(ctype._type_)
+
+    if issubclass(ctype, _SimpleCData):
+        return ctype._type_ in 'zZPO'  # type: ignore
+
+    # Pointers and function pointers.
+    return True
+
+
+def _check_picklable(ctype: type[CDataBase]) -> None:
+    if contains_pointers(ctype):
+        raise ValueError(
+            f'{ctype.__name__}: ctypes objects containing pointers cannot be pickled'
+        )
+
+
+def _class_ref(cls: type) -> Any:
+    module = sys.modules.get(cls.__module__, None)
+    target: Any = module
+
+    for part in cls.__qualname__.split('.'):
+        target = getattr(target, part, None)
+
+    if target is cls:
+        return cls
+
+    # Deferred structs are only reachable through their proxy, so they are looked up by name when loading.
+    return _reference(cls)
+
+
+@lru_cache(maxsize=None)
+def _load_reference(module: str, qualname: str) -> Any:
+    from importlib import import_module
+
+    from .struct import resolve_deferred
+
+    target: Any = import_module(module)
+
+    for part in qualname.split('.'):
+        target = resolve_deferred(getattr(target, part))
+
+    return target
+
+
+def _resolve_class_ref(ref: Any) -> Any:
+    if isinstance(ref, type):
+        return ref
+
+    return _load_reference(*ref)
+
+
+def _reference(cls: type) -> tuple[str, str]:
+    module, qualname = cls.__module__, cls.__qualname__
+
+    # Checked when dumping, an unreachable class would only fail once the data is loaded somewhere else.
+    try:
+        target = _load_reference(module, qualname)
+    except (ImportError, AttributeError):
+        target = None
+
+    if target is not cls:
+        raise PicklingError(
+            f'Can\'t pickle {cls!r}: it\'s not reachable as {module}.{qualname}'
+        )
+
+    return (module, qualname)
+
+
+def reduce_class(cls: Any) -> tuple[Callable[..., Any], tuple[str, str]]:
+    from .struct import resolve_deferred
+
+    # Loading goes through a per-process cache, so repeated references cost one dict lookup.
+    return (_load_reference, _reference(resolve_deferred(cls)))
+
+
+_bound_functions = dict[int, tuple[type, str]]()
+_bound_types = dict[type, type]()
+
+
+def _bound_pointer(value: CDataBase) -> CDataBase:
+    base = type(value)
+
+    # Function pointer types are shared with callbacks and the library's other symbols, so bound ones get our own.
+    try:
+        bound_type = _bound_types[base]
+    except KeyError:
+        # The function pointer metaclass only reads the signature from the class' own dict.
+        signature = {
+            attr: getattr(base, attr) for attr in ('_flags_', '_restype_', '_argtypes_') if hasattr(base, attr)
+        }
+
+        bound_type = _bound_types[base] = type(base)(  # type: ignore
+            base.__name__, (base,), dict(signature, __reduce_ex__=reduce_bound, __module__=base.__module__)
+        )
+
+    bound: CDataBase = bound_type(cast(value, c_void_p).value)
+    bound.__dict__.update(value.__dict__)
+
+    for attr in ('argtypes', 'restype', 'errcheck'):
+        if (attr_value := getattr(value, attr, None)) is not None:
+            setattr(bound, attr, attr_value)
+
+    return bound
+
+
+def register_bound(owner: type, name: str, value: Any) -> Any:
+    if isinstance(value, CDataBase) and type(value).__reduce_ex__ is not reduce_bound:
+        value = _bound_pointer(value)
+
+    _bound_functions[id(value)] = (owner, name)
+
+    return value
+
+
+def reduce_bound(value: Any, protocol: int = 2) -> Any:
+    entry = _bound_functions.get(id(value), None)
+
+    # Anything that isn't what its owner binds anymore, like a callback sharing a bound functype, pickles as usual.
+    if entry is None or entry[0].__dict__.get(entry[1], None) is not value:
+        return object.__reduce_ex__(value, protocol)
+
+    module, qualname = _reference(entry[0])
+
+    return (_load_reference, (module, f'{qualname}.{entry[1]}'))
+
+
+def _from_memory(ctype: type[C_T_CDB], data: Any, offset: int = 0) -> C_T_CDB:
+    view = memoryview(data)
+
+    # Writable buffers, like out-of-band ones or the bytearrays of in-band PickleBuffers, are used in place.
+    if not view.readonly:
+        return ctype.from_buffer(view, offset)
+
+    return ctype.from_buffer_copy(view, offset)
+
+
+def _rebuild_struct(ref: Any, data: Any) -> CDataBase:
+    ctype: type[CDataBase] = _resolve_class_ref(ref)
+
+    return _from_memory(ctype, data)
+
+
+def reduce_struct(value: CDataBase, protocol: int) -> tuple[Any, ...]:
+    ctype = type(value)
+
+    _check_picklable(ctype)
+
+    data: Any = PickleBuffer(value) if protocol >= 5 else bytes(memoryview(value).cast('B'))
+
+    return (_rebuild_struct, (_class_ref(ctype), data), value.__dict__ or None)
+
+
+def _rebuild_array(ref: Any, fingerprint: bytes, count: int, data: Any) -> StructArray[Any]:
+    from .arrays import StructArray
+
+    ctype = _resolve_class_ref(ref)
+
+    if layout_fingerprint(ctype) != fingerprint:
+        raise TypeError(
+            f'StructArray: The layout of {ctype.__name__} doesn\'t match the pickled one!'
+        )
+
+    return StructArray(ctype, data, 0, count)
+
+
+def reduce_array(array: StructArray[Any], protocol: int) -> tuple[Any, ...]:
+    ctype: type[CDataBase] = array._type_
+
+    _check_picklable(ctype)
+
+    data: Any = array.raw() if array.contiguous else array.tobytes()
+
+    data = PickleBuffer(data) if protocol >= 5 else bytes(data)
+
+    return (_rebuild_array, (_class_ref(ctype), layout_fingerprint(ctype), len(array), data))
+
+
+def dumps_array(array: StructArray[Any]) -> bytes:
+    ctype: type[CDataBase] = array._type_
+
+    _check_picklable(ctype)
+
+    header = _ArrayHeader()
+    header.magic[:] = _ARRAY_MAGIC
+    header.version = _ARRAY_VERSION
+    header.byteorder = sys.byteorder == 'little'
+    header.itemsize = sizeof(ctype)
+    header.count = len(array)
+    header.fingerprint[:] = layout_fingerprint(ctype)
+
+    if array.contiguous:
+        return b''.join((memoryview(header).cast('B'), array.raw()))
+
+    return bytes(memoryview(header).cast('B')) + array.tobytes()
+
+
+def loads_array(ctype: type[C_T_CDB], data: Any, copy: bool = False) -> StructArray[C_T_CDB]:
+    from .arrays import StructArray
+    from .struct import resolve_deferred
+
+    ctype = resolve_deferred(ctype)
+    view = memoryview(data).cast('B')
+
+    if len(view) < sizeof(_ArrayHeader):
+        raise ValueError('StructArray: The data is too short to hold an array header!')
+
+    header = _ArrayHeader.from_buffer_copy(view)
+
+    if bytes(header.magic) != _ARRAY_MAGIC or header.version != _ARRAY_VERSION:
+        raise ValueError('StructArray: The data is not a ctypedffi struct array!')
+
+    if header.byteorder != (sys.byteorder == 'little') or bytes(header.fingerprint) != layout_fingerprint(ctype):
+        raise TypeError(
+            f'StructArray: The layout of {ctype.__name__} doesn\'t match the one stored in the data!'
+        )
+
+    end = sizeof(_ArrayHeader) + header.count * header.itemsize
+
+    if len(view) < end:
+        raise ValueError(
+            f'StructArray: The data is truncated, expected {end} bytes but got {len(view)}!'
+        )
+
+    records = view[sizeof(_ArrayHeader):end]
+
+    if copy:
+        records = bytearray(records)  # type: ignore
+
+    return StructArray(ctype, records, 0, header.count)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from ctypes import Structure, addressof, alignment, c_uint8, c_uint16, c_uint32, c_uint64, memmove, sizeof
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock, get_ident
+from time import sleep
+from typing import Any, Generic, Iterator
+
+from .arrays import StructArray
+from .layout import layout_fingerprint
+from .types import C_T_CDB
+
+__all__ = [
+    'SharedStructBlock'
+]
+
+
+_SHARED_MAGIC = 0x46445443  # 'CTDF'
+_SHARED_VERSION = 1
+_HEADER_ALIGN = 64
+
+
+class _SharedHeader(Structure):
+    _fields_ = [
+        ('magic', c_uint32),
+        ('version', c_uint16),
+        ('seqlock', c_uint16),
+        ('count', c_uint64),
+        ('itemsize', c_uint64),
+        ('stride', c_uint64),
+        ('fingerprint', c_uint8 * 16),
+    ]
+
+
+def _round_up(value: int, align: int) -> int:
+    return (value + align - 1) // align * align
+
+
+def _seqlock_prefix(ctype: type[C_T_CDB], seqlock: bool) -> int:
+    return _round_up(sizeof(c_uint64), alignment(ctype)) if seqlock else 0
+
+
+def _open_shm(name: str | None, create: bool, size: int = 0) -> SharedMemory:
+    try:
+        # Attaching processes must not unlink the block at exit, which the resource tracker does before 3.13.
+        return SharedMemory(name, create, size, track=create)  # type: ignore[call-arg]
+    except TypeError:
+        shm = SharedMemory(name, create, size)
+
+    if not create and os.name == 'posix':
+        resource_tracker.unregister(shm._name, 'shared_memory')  # type: ignore[attr-defined]
+
+    return shm
+
+
+class SharedStructBlock(Generic[C_T_CDB]):
+    def __init__(self, ctype: type[C_T_CDB], shm: SharedMemory, owner: bool) -> None:
+        self.ctype = ctype
+        self.shm = shm
+        self.owner = owner
+        self.header = _SharedHeader.from_buffer(shm.buf)
+
+        if self.header.magic != _SHARED_MAGIC or self.header.version != _SHARED_VERSION:
+            self._release()
+            raise ValueError(
+                f'SharedStructBlock: {shm.name} is not a ctypedffi shared block!'
+            )
+
+        if bytes(self.header.fingerprint) != layout_fingerprint(ctype) or self.header.itemsize != sizeof(ctype):
+            self._release()
+            raise TypeError(
+                f'SharedStructBlock: The layout of {ctype.__name__} doesn\'t match the one stored in {shm.name}!'
+            )
+
+        self.seqlock = bool(self.header.seqlock)
+        self.count: int = self.header.count
+        self.stride: int = self.header.stride
+
+        # With a seqlock, every record is prefixed by its own sequence counter.
+        self._data_offset = _HEADER_ALIGN + _seqlock_prefix(ctype, self.seqlock)
+        self._base_address = addressof(self.header)
+
+        self.array = StructArray(ctype, shm.buf, self._data_offset, self.count, self.stride)
+
+        self._write_locks = [Lock() for _ in range(self.count)]
+        self._writers = dict[int, int]()
+
+    @classmethod
+    def create(
+        cls, ctype: type[C_T_CDB], count: int = 1, name: str | None = None, seqlock: bool = False
+    ) -> SharedStructBlock[C_T_CDB]:
+        if count < 1:
+            raise ValueError(
+                f'SharedStructBlock: The count must be at least 1, not {count}!'
+            )
+
+        itemsize = sizeof(ctype)
+        align = max(alignment(ctype), sizeof(c_uint64) if seqlock else 1)
+        stride = _round_up(_seqlock_prefix(ctype, seqlock) + itemsize, align)
+
+        shm = _open_shm(name, True, _HEADER_ALIGN + stride * count)
+
+        header = _SharedHeader.from_buffer(shm.buf)
+        header.magic = _SHARED_MAGIC
+        header.version = _SHARED_VERSION
+        header.seqlock = seqlock
+        header.count = count
+        header.itemsize = itemsize
+        header.stride = stride
+        header.fingerprint = (c_uint8 * 16).from_buffer_copy(layout_fingerprint(ctype))
+        del header
+
+        return cls(ctype, shm, True)
+
+    @classmethod
+    def attach(cls, ctype: type[C_T_CDB], name: str) -> SharedStructBlock[C_T_CDB]:
+        return cls(ctype, _open_shm(name, False), False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def value(self) -> C_T_CDB:
+        return self.array[0]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> C_T_CDB:
+        return self.array[index]
+
+    def _sequence(self, index: int) -> c_uint64:
+        if not self.seqlock:
+            raise ValueError('SharedStructBlock: The block was not created with seqlock=True!')
+
+        return c_uint64.from_buffer(self.shm.buf, self.array._item_offset(index) - sizeof(c_uint64))
+
+    # The seqlock supports a single writer per record and relies on aligned 64-bit stores being atomic.
+    # Writers within a process are serialized per record, writers in different processes have to be coordinated
+    # by the caller, two of them writing to the same record at once corrupt its sequence.
+    # Readers never block the writer, they retry until they've copied a record that wasn't written to meanwhile.
+    def read(self, index: int = 0, into: C_T_CDB | None = None) -> C_T_CDB:
+        sequence = self._sequence(index)
+        offset = self.array._item_offset(index)
+        item_address = self._base_address + offset
+        size = sizeof(self.ctype)
+
+        # Polling readers can pass the same record every time instead of getting a new one per read.
+        if into is None:
+            copy = self.ctype()
+        elif type(into) is self.ctype:
+            copy = into
+        else:
+            raise TypeError(
+                f'SharedStructBlock: Expected {self.ctype.__name__} to read into, not {type(into).__name__}!'
+            )
+
+        # The record is ours until the write ends, waiting for the sequence to settle would never finish.
+        if self._writers.get(offset, None) == get_ident():
+            memmove(addressof(copy), item_address, size)
+            return copy
+
+        delay = 0.0
+
+        while True:
+            before = sequence.value
+
+            if not before & 1:
+                memmove(addressof(copy), item_address, size)
+
+                if sequence.value == before:
+                    return copy
+
+            # Yield to the writer first, then back off so a stalled one isn't spun on.
+            sleep(delay)
+            delay = min(delay * 2 or 1e-6, 1e-3)
+
+    @contextmanager
+    def write(self, index: int = 0) -> Iterator[C_T_CDB]:
+        sequence = self._sequence(index)
+        offset = self.array._item_offset(index)
+
+        if self._writers.get(offset, None) == get_ident():
+            raise RuntimeError(
+                f'SharedStructBlock: Record {index} of {self.shm.name} is already being written by this thread!'
+            )
+
+        with self._write_locks[(offset - self._data_offset) // self.stride]:
+            self._writers[offset] = get_ident()
+            sequence.value += 1
+
+            try:
+                yield self.array[index]
+            finally:
+                sequence.value += 1
+                del self._writers[offset]
+
+    def _release(self) -> None:
+        self.header = None  # type: ignore[assignment]
+        self.array = None  # type: ignore[assignment]
+        self.shm.close()
+
+    def close(self) -> None:
+        try:
+            self._release()
+        except BufferError as e:
+            raise BufferError(
+                f'SharedStructBlock: Records of {self.shm.name} are still in use, release them before closing!'
+            ) from e
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+    def __enter__(self) -> SharedStructBlock[C_T_CDB]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+        if self.owner:
+            self.unlink()
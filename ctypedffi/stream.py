@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import errno
+from asyncio import StreamReader, StreamWriter
+from ctypes import addressof, memmove, sizeof
+from typing import Any, AsyncIterator, Callable, Generic, Iterable, Iterator, Protocol
+
+from .arrays import StructArray
+from .types import C_T_CDB
+
+__all__ = [
+    'iter_stream', 'aiter_stream',
+    'StructStreamWriter', 'AsyncStructStreamWriter'
+]
+
+
+class SupportsReadinto(Protocol):
+    def readinto(self, buffer: Any, /) -> int | None:
+        ...
+
+
+class SupportsWrite(Protocol):
+    def write(self, buffer: Any, /) -> int | None:
+        ...
+
+
+def _get_readinto(fileobj: Any) -> Callable[[memoryview], int | None]:
+    readinto: Callable[[memoryview], int | None] | None = getattr(fileobj, 'readinto', None)
+
+    if readinto is None:
+        readinto = getattr(fileobj, 'recv_into', None)
+
+    if readinto is None:
+        raise TypeError(
+            f'iter_stream: {type(fileobj).__name__} has neither readinto nor recv_into!'
+        )
+
+    return readinto
+
+
+def _make_chunk(
+    ctype: type[C_T_CDB], buffer: bytearray, view: memoryview, count: int, size: int, copy: bool
+) -> StructArray[C_T_CDB]:
+    if copy:
+        return StructArray(ctype, bytearray(view[:count * size]), 0, count)
+
+    return StructArray(ctype, buffer, 0, count)
+
+
+def _check_batch(batch: int) -> None:
+    if batch < 1:
+        raise ValueError(
+            f'iter_stream: The batch size must be at least 1, not {batch}!'
+        )
+
+
+def iter_stream(
+    ctype: type[C_T_CDB], fileobj: SupportsReadinto | Any, batch: int = 256, copy: bool = False
+) -> Iterator[StructArray[C_T_CDB]]:
+    _check_batch(batch)
+
+    readinto = _get_readinto(fileobj)
+    size = sizeof(ctype)
+
+    # Chunks borrow this buffer unless copy=True, so they're only valid until the next iteration.
+    buffer = bytearray(size * batch)
+    view = memoryview(buffer)
+    filled = 0
+
+    while True:
+        read = readinto(view[filled:])
+
+        if read is None:
+            raise BlockingIOError(
+                'iter_stream: Non-blocking streams are not supported, use aiter_stream instead!'
+            )
+
+        if not read:
+            if filled:
+                raise EOFError(
+                    f'iter_stream: Stream ended in the middle of a record ({filled} of {size} bytes)!'
+                )
+
+            return
+
+        filled += read
+
+        if (count := filled // size):
+            yield _make_chunk(ctype, buffer, view, count, size, copy)
+
+            used = count * size
+            filled -= used
+
+            if filled:
+                view[:filled] = view[used:used + filled]
+
+
+async def aiter_stream(
+    ctype: type[C_T_CDB], reader: StreamReader, batch: int = 256, copy: bool = False
+) -> AsyncIterator[StructArray[C_T_CDB]]:
+    _check_batch(batch)
+
+    size = sizeof(ctype)
+
+    buffer = bytearray(size * batch)
+    view = memoryview(buffer)
+    filled = 0
+
+    while True:
+        data = await reader.read(len(buffer) - filled)
+
+        if not data:
+            if filled:
+                raise EOFError(
+                    f'aiter_stream: Stream ended in the middle of a record ({filled} of {size} bytes)!'
+                )
+
+            return
+
+        view[filled:filled + len(data)] = data
+        filled += len(data)
+
+        if (count := filled // size):
+            yield _make_chunk(ctype, buffer, view, count, size, copy)
+
+            used = count * size
+            filled -= used
+
+            if filled:
+                view[:filled] = view[used:used + filled]
+
+
+class _StructStreamWriterBase(Generic[C_T_CDB]):
+    def __init__(self, ctype: type[C_T_CDB], batch: int = 256) -> None:
+        _check_batch(batch)
+
+        self.ctype = ctype
+        self.size = sizeof(ctype)
+        self.buffer = (ctype * batch)()
+        self.view = memoryview(self.buffer).cast('B')
+        self.address = addressof(self.buffer)
+        self.capacity = batch
+        self.count = 0
+
+    def _append(self, record: C_T_CDB) -> bool:
+        if not isinstance(record, self.ctype):
+            raise TypeError(
+                f'StructStreamWriter: Expected {self.ctype.__name__}, not {type(record).__name__}!'
+            )
+
+        memmove(self.address + self.count * self.size, addressof(record), self.size)
+        self.count += 1
+
+        return self.count == self.capacity
+
+    def _pending(self) -> memoryview:
+        pending = self.view[:self.count * self.size]
+        self.count = 0
+
+        return pending
+
+
+class StructStreamWriter(_StructStreamWriterBase[C_T_CDB]):
+    def __init__(self, ctype: type[C_T_CDB], fileobj: SupportsWrite | Any, batch: int = 256) -> None:
+        super().__init__(ctype, batch)
+
+        write = getattr(fileobj, 'write', None)
+
+        self.fileobj = fileobj
+        self._write: Callable[[memoryview], int | None] = write or getattr(fileobj, 'sendall')
+        self._sendall = write is None
+
+    def write(self, record: C_T_CDB) -> None:
+        if self._append(record):
+            self.flush()
+
+    def write_many(self, records: Iterable[C_T_CDB] | StructArray[C_T_CDB]) -> None:
+        if isinstance(records, StructArray) and records.contiguous and records._type_ is self.ctype:
+            self.flush()
+            self._write_all(records.raw())
+            return
+
+        for record in records:
+            if self._append(record):
+                self.flush()
+
+    def _write_all(self, data: memoryview) -> None:
+        # Sockets' sendall either sends everything or raises.
+        if self._sendall:
+            self._write(data)
+            return
+
+        total = len(data)
+
+        while data:
+            written = self._write(data)
+
+            # Raw non-blocking files return None when they would block, like BufferedWriter we report how far we got.
+            if written is None:
+                raise BlockingIOError(
+                    errno.EAGAIN, 'StructStreamWriter: Non-blocking streams are not supported!', total - len(data)
+                )
+
+            data = data[written:]
+
+    def flush(self) -> None:
+        if self.count:
+            self._write_all(self._pending())
+
+        if hasattr(self.fileobj, 'flush'):
+            self.fileobj.flush()
+
+    def __enter__(self) -> StructStreamWriter[C_T_CDB]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.flush()
+
+
+class AsyncStructStreamWriter(_StructStreamWriterBase[C_T_CDB]):
+    def __init__(self, ctype: type[C_T_CDB], writer: StreamWriter, batch: int = 256) -> None:
+        super().__init__(ctype, batch)
+
+        self.writer = writer
+
+    async def write(self, record: C_T_CDB) -> None:
+        if self._append(record):
+            await self.flush()
+
+    async def write_many(self, records: Iterable[C_T_CDB] | StructArray[C_T_CDB]) -> None:
+        if isinstance(records, StructArray) and records.contiguous and records._type_ is self.ctype:
+            await self.flush()
+            self.writer.write(records.tobytes())
+            await self.writer.drain()
+            return
+
+        for record in records:
+            if self._append(record):
+                await self.flush()
+
+    async def flush(self) -> None:
+        if self.count:
+            # The transport may hold on to what we pass it, so the reused batch buffer can't be handed out directly.
+            self.writer.write(self._pending().tobytes())
+
+        await self.writer.drain()
+
+    async def __aenter__(self) -> AsyncStructStreamWriter[C_T_CDB]:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.flush()
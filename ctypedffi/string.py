@@ -5,9 +5,14 @@ import mmap
 import pickle
 import sys
 from abc import abstractmethod
-from ctypes import POINTER, Array, Union, c_char, c_char_p, cast
+from ctypes import (
+    POINTER, Array, Union, addressof, c_char, c_char_p, c_void_p, cast, create_string_buffer, sizeof,
+    string_at
+)
+from functools import lru_cache
+from itertools import accumulate
 from typing import (
-    TYPE_CHECKING, Any, Iterable, NoReturn, Protocol, SupportsIndex, TypeAlias, TypeVar, runtime_checkable
+    TYPE_CHECKING, Any, Iterable, NoReturn, Protocol, SupportsIndex, TypeAlias, TypeVar, overload, runtime_checkable
 )
 
 from .types import CDataBase
@@ -19,7 +24,8 @@ __all__ = [
     'StrType',
     'UserString',
     'MutableString',
-    'String'
+    'String',
+    'StringArray'
 ]
 
 
@@ -406,3 +412,158 @@ class String(MutableString, Union):
 
 
 StrType = str | String | c_char_p | Array[c_char] | POINTER(c_char)
+
+
+# Decoded strings shared by every StringArray.decode(..., intern=True) call, bounded so one-off strings age out.
+@lru_cache(maxsize=4096)
+def _interned_string(string: bytes, encoding: str) -> str:
+    return string.decode(encoding)
+
+
+class StringArray:
+    __slots__ = ('_blob', '_table', '_pointer', '_count', 'encoding')
+
+    def __init__(self, strings: Iterable[str | bytes], encoding: str = 'utf-8', terminated: bool = True) -> None:
+        encoded = [string.encode(encoding) if isinstance(string, str) else bytes(string) for string in strings]
+
+        # An embedded NUL would silently split the blob and shift every following offset.
+        if any(b'\0' in string for string in encoded):
+            raise ValueError(
+                'StringArray: Strings can\'t contain NUL characters!'
+            )
+
+        # Every string lives in a single NUL separated blob, the table only holds offsets into it.
+        blob = b'\0'.join(encoded) + b'\0'
+
+        self._blob = create_string_buffer(blob, len(blob))
+        self._count = len(encoded)
+        self.encoding = encoding
+
+        base = addressof(self._blob)
+        offsets = accumulate((len(string) + 1 for string in encoded[:-1]), initial=0) if encoded else ()
+
+        self._table = (c_void_p * (self._count + terminated))(*(base + offset for offset in offsets))
+        self._pointer = cast(self._table, POINTER(c_char_p))
+
+    @property
+    def _as_parameter_(self) -> Any:
+        return self._pointer
+
+    @classmethod
+    def from_param(cls, obj: StringArray | Iterable[str | bytes] | None) -> Any:
+        if obj is None:
+            return POINTER(c_char_p)()
+
+        if isinstance(obj, StringArray):
+            return obj
+
+        if isinstance(obj, (str, bytes)):
+            raise TypeError(
+                'StringArray: Expected a sequence of strings, not a single string!'
+            )
+
+        return cls(obj)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError('StringArray: index out of range')
+
+        return self._item(index)
+
+    def _item(self, index: int) -> str:
+        return string_at(self._table[index]).decode(self.encoding)  # type: ignore
+
+    def __iter__(self) -> Any:
+        encoding = self.encoding
+
+        for address in self._table[:self._count]:
+            yield string_at(address).decode(encoding)  # type: ignore
+
+    def tobytes(self) -> list[bytes]:
+        return self._blob.raw[:-1].split(b'\0') if self._count else []
+
+    def tolist(self) -> list[str]:
+        return [string.decode(self.encoding) for string in self.tobytes()]
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.tolist()!r})'
+
+    @staticmethod
+    def decode(
+        pointer: Any, count: int | None = None, encoding: str | None = 'utf-8', intern: bool = False
+    ) -> list[str] | list[bytes]:
+        address = pointer if isinstance(pointer, int) or pointer is None else cast(pointer, c_void_p).value
+
+        if not address:
+            return list[str]()
+
+        if count is None:
+            count = _count_until_null(address)
+
+        addresses = list((c_void_p * count).from_address(address))
+
+        raw = _read_packed(addresses)
+
+        if raw is None:
+            raw = [string_at(address) if address else b'' for address in addresses]
+
+        if encoding is None:
+            return raw
+
+        if intern:
+            return [_interned_string(string, encoding) for string in raw]
+
+        return [string.decode(encoding) for string in raw]
+
+
+def _count_until_null(address: int) -> int:
+    # Reading ahead in chunks could run past the terminator into unmapped memory.
+    count, size = 0, sizeof(c_void_p)
+
+    while c_void_p.from_address(address + count * size).value is not None:
+        count += 1
+
+    return count
+
+
+def _read_packed(addresses: list[int | None]) -> list[bytes] | None:
+    # Tables built from a single blob, like ours or argv, can be read with one copy and split.
+    if not addresses or None in addresses:
+        return None
+
+    first, last = addresses[0], addresses[-1]
+
+    # Everything between first and last is only guaranteed to be mapped if no gap spans more than a page.
+    for prev, address in zip(addresses, addresses[1:]):
+        if not 0 < address - prev <= mmap.PAGESIZE:  # type: ignore
+            return None
+
+    raw = string_at(first, last - first) + string_at(last)  # type: ignore
+    strings = raw.split(b'\0')
+
+    if len(strings) != len(addresses):
+        return None
+
+    offsets = accumulate((len(string) + 1 for string in strings), initial=first)
+
+    if any(offset != address for offset, address in zip(offsets, addresses)):
+        return None
+
+    return strings
@@ -1,15 +1,44 @@
 from __future__ import annotations
 
-from ctypes import Structure
+import copyreg
+import os
+import sys
+from asyncio import StreamReader, StreamWriter
+from ctypes import Array, BigEndianStructure, LittleEndianStructure, Structure, Union, _Pointer, cast
+from ctypes import alignment as _alignment
+from ctypes import sizeof as _sizeof
+from dataclasses import dataclass
+from functools import partial
 from inspect import get_annotations
-from typing import TYPE_CHECKING, Any, Callable, Generic, Mapping, TypeVar
+from threading import RLock
+from typing import (
+    TYPE_CHECKING, Annotated, Any, AsyncIterator, Callable, Generic, Iterator, Mapping, TypeVar, get_args, get_origin,
+    overload
+)
 
+if TYPE_CHECKING:
+    from ctypes import _FuncPointer as _CFuncPtr
+else:
+    from _ctypes import CFuncPtr as _CFuncPtr
+
+from .arrays import MappedStructArray, StructArray
+from .codegen import _generated, generate_struct_methods, is_generated
 from .ctypes import make_callback_returnable
-from .types import CDataBase, MetaClassDictBase, Self, StructMetaBase
+from .layout import LayoutReport, struct_fields
+from .pool import StructPool
+from .serialize import reduce_class, reduce_struct
+from .shared import SharedStructBlock
+from .stream import AsyncStructStreamWriter, StructStreamWriter, aiter_stream, iter_stream
+from .types import C_T_CDB, CDataBase, MetaClassDictBase, Pointer, Self, StructMetaBase, _is_typed_pointer
 from .utils import _protected_keys, as_cfunc, is_python_only, normalize_ctype
+from .values import copy_value, copy_value_into, value_equal, value_hash
 
 __all__ = [
-    'StructMeta', 'Struct', 'OpaqueStruct'
+    'StructMeta', 'Struct', 'OpaqueStruct',
+    'BigEndianStruct', 'LittleEndianStruct',
+    'Bits',
+    'DeferredStruct', 'deferred_report', 'finalize_deferred',
+    'sizeof', 'alignment'
 ]
 
 F = TypeVar('F', bound=Callable[..., Any])
@@ -17,6 +46,55 @@ F = TypeVar('F', bound=Callable[..., Any])
 _opaqueset = False
 
 
+@dataclass(frozen=True)
+class Bits:
+    width: int
+
+    def __post_init__(self) -> None:
+        if self.width < 1:
+            raise ValueError(
+                f'Bits: The bit width must be at least 1, not {self.width}!'
+            )
+
+
+def _annotated_field(name: str, value: Any) -> tuple[str, type[CDataBase]] | tuple[str, type[CDataBase], int]:
+    if get_origin(value) is not Annotated:
+        return (name, normalize_ctype(value))
+
+    ctype, *metadata = get_args(value)
+    ctype = normalize_ctype(ctype)
+
+    for meta in metadata:
+        if isinstance(meta, Bits):
+            return (name, ctype, meta.width)
+
+    return (name, ctype)
+
+
+def _resolve_forward(cls: type, value: Any) -> Any:
+    if (name := getattr(value, '__forward_ref__', None)) is None:
+        return value
+
+    namespace = vars(sys.modules[cls.__module__])
+
+    # Self references of deferred structs find their proxy, which resolves to the class being finalized.
+    if name not in namespace:
+        raise TypeError(
+            f'{cls.__name__}: Can\'t resolve Pointer[\'{name}\'], forward references '
+            f'need Struct.annotate(deferred=True) and a module level struct!'
+        )
+
+    return Pointer[resolve_deferred(namespace[name])]  # type: ignore
+
+
+def _annotated_fields(cls: type) -> list[tuple[str, tuple[str, type[CDataBase]] | tuple[str, type[CDataBase], int]]]:
+    return [
+        (key, _annotated_field(key, _resolve_forward(cls, value)))
+        for key, value in get_annotations(cls, eval_str=True).items()
+        if not (key.startswith('__') or key in _protected_keys or is_python_only(value))
+    ]
+
+
 class StructMetaDict(MetaClassDictBase):
     def _setitem_(self, name: str, value: Any, /) -> None:
         if self.to_process(value):
@@ -33,7 +111,7 @@ class StructMetaDict(MetaClassDictBase):
 class StructMeta(StructMetaBase):
     __bases__: tuple[type, ...]
     __slots__: list[str]
-    _fields_: list[tuple[str, CDataBase]]  # type: ignore
+    _fields_: list[tuple[str, CDataBase] | tuple[str, CDataBase, int]]  # type: ignore
 
     @classmethod
     def __prepare__(metacls, name: str, bases: tuple[type, ...], /, **kwargs: Any) -> Mapping[str, object]:
@@ -44,7 +122,100 @@ class StructMeta(StructMetaBase):
         elif _opaqueset and OpaqueStruct in bases:
             return dict[str, Any]()
 
-        return StructMetaDict(__slots__=[], _fields_=[])
+        layout = dict[str, int]()
+
+        if (pack := kwargs.get('pack', None)) is not None:
+            layout['_pack_'] = pack
+
+        # Only honored by ctypes since 3.13.
+        if (align := kwargs.get('align', None)) is not None:
+            layout['_align_'] = align
+
+        return StructMetaDict(__slots__=[], _fields_=[], **layout)
+
+    def __new__(
+        cls: type[Self], name: str, bases: tuple[type, ...], namespace: dict[str, Any], /, **kwargs: Any
+    ) -> Self:
+        # Set before the class is created, since ctypes assigns _fields_ through __setattr__ while creating it.
+        if (eq := kwargs.get('eq', None)) is not None:
+            namespace['__ctdffi_eq__'] = bool(eq)
+
+        new_cls = super().__new__(cls, name, bases, namespace)  # type: ignore
+
+        # Classes with fields already got their methods from __setattr__.
+        if eq and not namespace.get('_fields_', None):
+            _generate_methods(new_cls)
+
+        return new_cls  # type: ignore
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        # Classes finalized after their creation, like self-referencing ones, get their methods here.
+        if name == '_fields_' and value:
+            _finalize_fields(cls, value)
+
+
+def _finalize_fields(cls: StructMeta, fields: list[Any]) -> None:
+    for field_name, field_type, *_ in fields:
+        if _is_typed_pointer(field_type):
+            StructMetaBase.__setattr__(cls, field_name, _PointerField(cls.__dict__[field_name], field_type))
+
+    _generate_methods(cls)  # type: ignore
+
+
+class _PointerField:
+    __slots__ = ('cfield', 'ptr_type')
+
+    def __init__(self, cfield: Any, ptr_type: type[_Pointer[Any]]) -> None:
+        self.cfield = cfield
+        self.ptr_type = ptr_type
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        return self.cfield.__get__(instance, owner)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        # Pointer[T] fields use our own pointer subclass, plain POINTER(T) values like the ones
+        # of ctypes.pointer() are converted instead of being rejected as incompatible.
+        if isinstance(value, _Pointer) and not isinstance(value, self.ptr_type):
+            if not issubclass(value._type_, self.ptr_type._type_):
+                raise TypeError(
+                    f'Struct: Expected a pointer to {self.ptr_type._type_.__name__}, '
+                    f'not a pointer to {value._type_.__name__}!'
+                )
+
+            value = cast(value, self.ptr_type)
+
+        self.cfield.__set__(instance, value)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.cfield, name)
+
+    def __repr__(self) -> str:
+        return repr(self.cfield)
+
+
+_generated_names = ('__init__', 'to_tuple', 'to_dict', 'from_dict', 'replace', '__eq__', '__hash__')
+
+
+def _generate_methods(cls: type[CDataBase]) -> None:
+    # Methods written by the user anywhere in the hierarchy always win over generated ones.
+    skip = frozenset(
+        name for base in cls.__mro__
+        if isinstance(base, StructMeta) and base.__module__ != __name__
+        for name in _generated_names
+        if name in base.__dict__ and not is_generated(base.__dict__[name])
+    )
+
+    generate_struct_methods(cls, skip)
+
+    if getattr(cls, '__ctdffi_eq__', False):
+        for name, method in (('__eq__', _generated(value_equal)), ('__hash__', _generated(value_hash))):
+            if name not in skip:
+                setattr(cls, name, method)
 
 
 class StructureBase(Generic[Self]):
@@ -52,42 +223,301 @@ class StructureBase(Generic[Self]):
         def __init__(self: type[Self]) -> None:  # type: ignore
             ...
 
+    @overload
+    @staticmethod
+    def annotate(cls: C_STB, /) -> C_STB:
+        ...
+
+    @overload
     @staticmethod
-    def annotate(cls: C_STB) -> C_STB:
+    def annotate(*, deferred: bool = False) -> Callable[[C_STB], C_STB]:
+        ...
+
+    @staticmethod
+    def annotate(cls: C_STB | None = None, /, *, deferred: bool = False) -> C_STB | Callable[[C_STB], C_STB]:
+        if cls is None:
+            return partial(StructureBase.annotate, deferred=deferred)
+
         if Struct not in cls.mro():
             raise ValueError(
                 'Struct.annotate: The annotated class must inherit from Struct!'
             )
 
-        if OpaqueStruct not in cls.mro():
-            for key, value in get_annotations(cls, eval_str=True).items():
-                if key.startswith('__') or key in _protected_keys or is_python_only(value):
-                    continue
+        if deferred and OpaqueStruct not in cls.mro():
+            return DeferredStruct(cls)  # type: ignore
 
+        if OpaqueStruct not in cls.mro():
+            for key, value in _annotated_fields(cls):
                 cls.__slots__.append(key)
-                cls._fields_.append((key, normalize_ctype(value)))  # type: ignore
+                cls._fields_.append(value)  # type: ignore
+
+            slots, fields = cls.__slots__.copy(), cls._fields_.copy()
 
             class inner_annotated(cls):  # type: ignore
-                __slots__ = cls.__slots__.copy()
-                _fields_ = cls._fields_.copy()
+                __slots__ = slots
+                _fields_ = fields
+
+            # Take the place of the decorated class, so that reprs and pickling by reference find us.
+            inner_annotated.__name__ = cls.__name__
+            inner_annotated.__qualname__ = cls.__qualname__
+            inner_annotated.__module__ = cls.__module__
         else:
             inner_annotated = cls  # type: ignore
 
         return make_callback_returnable(inner_annotated)  # type: ignore
 
+    # Generic fallbacks, every finalized Struct gets specialized versions generated from its fields.
+    def to_tuple(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, field.name) for field in struct_fields(type(self)))  # type: ignore
+
+    def to_dict(self) -> dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in struct_fields(type(self))}  # type: ignore
+
+    @classmethod
+    def from_dict(cls: type[C_T_CDB], mapping: Mapping[str, Any]) -> C_T_CDB:  # type: ignore[misc]
+        return cls(**mapping)
+
+    def replace(self: C_T_CDB, **changes: Any) -> C_T_CDB:  # type: ignore[misc]
+        new = type(self).from_buffer_copy(self)
+
+        for name, value in changes.items():
+            setattr(new, name, value)
+
+        return new
+
+    def copy(self: C_T_CDB) -> C_T_CDB:  # type: ignore[misc]
+        return copy_value(self)
+
+    @classmethod
+    def pool(cls: type[C_T_CDB], size: int | None = None) -> StructPool[C_T_CDB]:  # type: ignore[misc]
+        return StructPool.of(cls, size)
+
+    def __reduce_ex__(self, protocol: int) -> tuple[Any, ...]:  # type: ignore[override]
+        return reduce_struct(self, protocol)  # type: ignore
+
+    def copy_into(self: C_T_CDB, destination: C_T_CDB) -> C_T_CDB:  # type: ignore[misc]
+        return copy_value_into(self, destination)
+
     @staticmethod
     def python_only(func: F) -> F:
         func.__dict__['__python_only__'] = True
         return func
 
+    @classmethod
+    def layout_report(cls: type[C_T_CDB]) -> LayoutReport:  # type: ignore[misc]
+        return LayoutReport.of(cls)
+
+    @classmethod
+    def mmap_array(  # type: ignore[misc]
+        cls: type[C_T_CDB], path: str | os.PathLike[str], mode: str = 'r',
+        offset: int = 0, header: type[Struct] | None = None
+    ) -> MappedStructArray[C_T_CDB]:
+        return MappedStructArray(cls, path, mode, offset, header)
+
+    @classmethod
+    def create_shared(  # type: ignore[misc]
+        cls: type[C_T_CDB], count: int = 1, name: str | None = None, seqlock: bool = False
+    ) -> SharedStructBlock[C_T_CDB]:
+        return SharedStructBlock.create(cls, count, name, seqlock)
+
+    @classmethod
+    def attach_shared(cls: type[C_T_CDB], name: str) -> SharedStructBlock[C_T_CDB]:  # type: ignore[misc]
+        return SharedStructBlock.attach(cls, name)
+
+    @classmethod
+    def iter_stream(  # type: ignore[misc]
+        cls: type[C_T_CDB], fileobj: Any, batch: int = 256, copy: bool = False
+    ) -> Iterator[StructArray[C_T_CDB]]:
+        return iter_stream(cls, fileobj, batch, copy)
+
+    @classmethod
+    def aiter_stream(  # type: ignore[misc]
+        cls: type[C_T_CDB], reader: StreamReader, batch: int = 256, copy: bool = False
+    ) -> AsyncIterator[StructArray[C_T_CDB]]:
+        return aiter_stream(cls, reader, batch, copy)
+
+    @classmethod
+    def stream_writer(  # type: ignore[misc]
+        cls: type[C_T_CDB], fileobj: Any, batch: int = 256
+    ) -> StructStreamWriter[C_T_CDB]:
+        return StructStreamWriter(cls, fileobj, batch)
+
+    @classmethod
+    def astream_writer(  # type: ignore[misc]
+        cls: type[C_T_CDB], writer: StreamWriter, batch: int = 256
+    ) -> AsyncStructStreamWriter[C_T_CDB]:
+        return AsyncStructStreamWriter(cls, writer, batch)
+
 
 class Struct(StructureBase, Structure, metaclass=StructMeta):  # type: ignore
     ...
 
 
+# Stands in for the struct until its layout is needed. It's not a type itself, so while isinstance(x, proxy)
+# and issubclass(cls, proxy) work, the proxy can't be the first argument of issubclass, use resolve() for that.
+class DeferredStruct:
+    def __init__(self, cls: type[Struct]) -> None:
+        self.__wrapped__ = cls
+        self.__name__, self.__qualname__, self.__module__ = cls.__name__, cls.__qualname__, cls.__module__
+        self.__resolved__: type[Struct] | None = None
+        self.__resolving__ = False
+
+        _deferred_structs.append(self)
+
+    @property
+    def finalized(self) -> bool:
+        return self.__resolved__ is not None and not self.__resolving__
+
+    def resolve(self) -> type[Struct]:
+        if (resolved := self.__resolved__) is not None:
+            return resolved
+
+        with _deferred_lock:
+            if self.__resolved__ is not None:
+                return self.__resolved__
+
+            cls = self.__wrapped__
+
+            # The class exists before its fields are evaluated, so structs pointing at each other
+            # resolve to this still incomplete class instead of recursing forever.
+            resolved = type(cls)(cls.__name__, (cls, ), {  # type: ignore
+                '__module__': cls.__module__, '__qualname__': cls.__qualname__
+            })
+
+            self.__resolved__, self.__resolving__ = resolved, True
+
+            try:
+                resolved._fields_ = [field for _, field in _annotated_fields(cls)]
+            except BaseException:
+                self.__resolved__ = None
+                raise
+            finally:
+                self.__resolving__ = False
+
+            make_callback_returnable(resolved)  # type: ignore
+
+        return resolved
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Struct:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+
+        return getattr(self.resolve(), name)
+
+    def __mro_entries__(self, bases: tuple[Any, ...]) -> tuple[type, ...]:
+        return (self.resolve(), )
+
+    def __mul__(self, length: int) -> type[Array[Struct]]:
+        return self.resolve() * length
+
+    def __instancecheck__(self, instance: Any) -> bool:
+        return isinstance(instance, self.resolve())
+
+    def __subclasscheck__(self, subclass: type) -> bool:
+        return issubclass(subclass, self.resolve())
+
+    def __repr__(self) -> str:
+        state = 'finalized' if self.finalized else 'deferred'
+        return f'<{self.__class__.__name__} {self.__wrapped__.__qualname__} ({state})>'
+
+
+_deferred_structs = list[DeferredStruct]()
+_deferred_lock = RLock()
+
+
+def resolve_deferred(value: Any) -> Any:
+    return value.resolve() if isinstance(value, DeferredStruct) else value
+
+
+def finalize_deferred() -> int:
+    pending = [struct for struct in _deferred_structs if not struct.finalized]
+
+    for struct in pending:
+        struct.resolve()
+
+    return len(pending)
+
+
+def deferred_report() -> dict[str, list[str]]:
+    report = dict[str, list[str]](finalized=[], deferred=[])
+
+    for struct in _deferred_structs:
+        report['finalized' if struct.finalized else 'deferred'].append(
+            f'{struct.__wrapped__.__module__}.{struct.__wrapped__.__qualname__}'
+        )
+
+    return report
+
+
+def sizeof(value: Any) -> int:
+    return _sizeof(resolve_deferred(value))
+
+
+def alignment(value: Any) -> int:
+    return _alignment(resolve_deferred(value))
+
+
 C_STB = TypeVar('C_STB', bound=StructMeta)
 
 
 class OpaqueStruct(Struct):
     def __init__(self) -> None:
         raise NotImplementedError
+
+
+_SwappedStructure: type[Structure]
+
+if sys.byteorder == 'little':
+    _OTHER_ENDIAN, _SwappedStructure = '__ctype_be__', BigEndianStructure
+else:
+    _OTHER_ENDIAN, _SwappedStructure = '__ctype_le__', LittleEndianStructure
+
+
+def _other_endian(ctype: Any) -> Any:
+    if hasattr(ctype, _OTHER_ENDIAN):
+        return getattr(ctype, _OTHER_ENDIAN)
+
+    if isinstance(ctype, type) and issubclass(ctype, Array):
+        return _other_endian(ctype._type_) * ctype._length_
+
+    # Nested structures keep their own byte order, pointers only ever live in (native) process memory.
+    if isinstance(ctype, type) and issubclass(ctype, (Structure, Union, _Pointer, _CFuncPtr)):
+        return ctype
+
+    raise TypeError(
+        f'Struct: The type {ctype} does not support the non-native byte order!'
+    )
+
+
+class SwappedStructMeta(StructMeta, type(_SwappedStructure)):  # type: ignore
+    def __setattr__(cls, name: str, value: Any) -> None:
+        if name != '_fields_':
+            return super().__setattr__(name, value)
+
+        # The fields are swapped here, ctypes' own swapped metaclass would reject pointer fields.
+        value = [(fname, _other_endian(ftype), *rest) for fname, ftype, *rest in value]
+
+        StructMetaBase.__setattr__(cls, name, value)
+
+        if value:
+            _finalize_fields(cls, value)
+
+
+if sys.byteorder == 'little':
+    LittleEndianStruct = Struct
+
+    class BigEndianStruct(Struct, BigEndianStructure, metaclass=SwappedStructMeta):
+        ...
+else:
+    BigEndianStruct = Struct  # type: ignore[misc, assignment]
+
+    class LittleEndianStruct(Struct, LittleEndianStructure, metaclass=SwappedStructMeta):  # type: ignore
+        ...
+
+
+# Struct classes, resolved deferred ones included, pickle as a reference to where they are declared.
+for _meta in (StructMeta, SwappedStructMeta, DeferredStruct):
+    copyreg.pickle(_meta, reduce_class)
@@ -4,11 +4,13 @@ import array
 import builtins
 import mmap
 from abc import abstractmethod
-from ctypes import CDLL, POINTER, Structure, c_void_p, pointer
+from ctypes import CDLL, POINTER, Array, Structure, addressof, c_size_t, c_void_p, cast, sizeof
 from enum import Enum
 from pickle import PickleBuffer
 from types import FunctionType, UnionType
-from typing import TYPE_CHECKING, Any, Callable, Generic, ParamSpec, Sequence, TypeAlias, TypeVar
+from typing import (
+    TYPE_CHECKING, Any, Callable, ForwardRef, Generic, Iterator, ParamSpec, Sequence, TypeAlias, TypeVar
+)
 
 if TYPE_CHECKING:
     from ctypes import _CData as CDataBase
@@ -40,6 +42,7 @@ __all__ = [
     'StructMetaBase',
     'CDataBase',
     'Pointer', 'FuncPointer', 'FuncPointerType',
+    'Out', 'InOut', 'OutParam',
     'T', 'F', 'P', 'R', 'C_T', 'Self',
     'CallingConvention'
 ]
@@ -73,6 +76,11 @@ class Pointer(Generic[C_T], PointerBase[C_T]):
         except KeyError:
             from .utils import normalize_ctype
 
+            # Forward references are left for Struct.annotate to resolve, ctypes would make an incomplete
+            # pointer type out of them that's incompatible with the one of the actual struct.
+            if isinstance(_type, (str, ForwardRef)):
+                return _cache_pbound_getitem.setdefault(_type, _forward_pointer(_type))
+
             _typev = normalize_ctype(_type)
 
             class PointerInnerClass(PointerBound):
@@ -85,7 +93,7 @@ class Pointer(Generic[C_T], PointerBase[C_T]):
 
     @staticmethod
     def _norm_ptr(cls_type: C_T) -> Pointer[C_T]:
-        ptr_type = POINTER(cls_type)  # type: ignore
+        ptr_type = _typed_pointer(cls_type)
 
         if hasattr(cls_type, '_ctypes_patch_getfunc'):
             from .ctypes import make_callback_returnable
@@ -96,7 +104,7 @@ class Pointer(Generic[C_T], PointerBase[C_T]):
 
     def __new__(cls: type[Self], cls_type: C_T | None = None) -> type[Pointer[C_T]]:  # type: ignore
         if not isinstance(cls_type, type):
-            return pointer(cls_type)  # type: ignore
+            return Pointer._norm_ptr(type(cls_type))(cls_type)  # type: ignore
 
         from .struct import Struct
 
@@ -160,6 +168,31 @@ class PointerBound(Pointer):  # type: ignore
     __bound_value__: C_TB  # type: ignore
     __norm_bvalue__: Pointer[C_TB]
 
+    # The pointer type is normalized once when the class is created, so these skip Pointer.normalize.
+    @classmethod
+    def from_buffer(cls: type[Self], source: WriteableBuffer, offset: int = 0) -> Self:
+        return cls.__norm_bvalue__.from_buffer(source, offset)  # type: ignore
+
+    @classmethod
+    def from_buffer_copy(cls: type[Self], source: ReadableBuffer, offset: int = 0) -> Self:
+        return cls.__norm_bvalue__.from_buffer_copy(source, offset)  # type: ignore
+
+    @classmethod
+    def from_address(cls: type[Self], address: int) -> Self:
+        return cls.__norm_bvalue__.from_address(address)  # type: ignore
+
+    @classmethod
+    def from_param(cls: type[Self], obj: Any) -> Self:
+        return cls.__norm_bvalue__.from_param(obj)  # type: ignore
+
+    @classmethod
+    def in_dll(cls: type[Self], library: CDLL, name: str) -> Self:
+        return cls.__norm_bvalue__.in_dll(library, name)  # type: ignore
+
+    @classmethod
+    def at(cls: type[Self], address: int) -> Pointer[C_TB]:
+        return cast(address, cls.__norm_bvalue__)  # type: ignore
+
     def __new__(cls: type[Self], value: Self | Any | None = None) -> Pointer[C_TB]:  # type: ignore
         if value is None:
             try:
@@ -175,6 +208,143 @@ class PointerBound(Pointer):  # type: ignore
         return ptr  # type: ignore
 
 
+def _forward_pointer(ref: str | ForwardRef) -> type[PointerBound]:
+    name = ref if isinstance(ref, str) else ref.__forward_arg__
+
+    class PointerForwardRef(PointerBound):
+        __bound_value__ = name
+        __forward_ref__ = name
+
+    return PointerForwardRef
+
+
+def _pointer_address(self: Any) -> int:
+    return c_size_t.from_address(addressof(self)).value
+
+
+def _pointer_view(self: Any, count: int, offset: int = 0) -> Array[Any]:
+    if not (address := _pointer_address(self)):
+        raise ValueError('Pointer: Can\'t view memory through a NULL pointer!')
+
+    array_type: type[Array[Any]] = self._type_ * count
+
+    # A view borrows the pointed memory, it's only valid for as long as the memory is.
+    return array_type.from_address(address + offset * sizeof(self._type_))
+
+
+def _pointer_read(self: Any, count: int, offset: int = 0) -> Array[Any]:
+    array_type: type[Array[Any]] = self._type_ * count
+
+    return array_type.from_buffer_copy(_pointer_view(self, count, offset))
+
+
+def _pointer_write(self: Any, values: Any, offset: int = 0) -> None:
+    if isinstance(values, (bytes, bytearray, memoryview, Array)):
+        data = memoryview(values).cast('B')
+        size = sizeof(self._type_)
+
+        if len(data) % size:
+            raise ValueError(
+                f'Pointer: The buffer holds {len(data)} bytes, which isn\'t a multiple of {size}!'
+            )
+
+        # Raw memory is copied over in one go, without going through the elements.
+        memoryview(_pointer_view(self, len(data) // size, offset)).cast('B')[:] = data
+        return
+
+    values = values if isinstance(values, (list, tuple)) else list(values)
+
+    _pointer_view(self, len(values), offset)[:] = values
+
+
+def _pointer_iter(self: Any, count: int, stride: int = 1, start: int = 0) -> Iterator[Any]:
+    if stride < 1:
+        raise ValueError(
+            f'Pointer: The stride must be at least 1, not {stride}!'
+        )
+
+    if not count:
+        return iter(())
+
+    view = _pointer_view(self, start + (count - 1) * stride + 1)
+
+    # Elements are produced one at a time, slicing would build the whole list up front.
+    return (view[i] for i in range(start, start + count * stride, stride))
+
+
+def _pointer_add(self: Any, count: Any) -> Any:
+    if not isinstance(count, int):
+        return NotImplemented
+
+    return cast(_pointer_address(self) + count * sizeof(self._type_), type(self))
+
+
+def _pointer_sub(self: Any, count: Any) -> Any:
+    if not isinstance(count, int):
+        return NotImplemented
+
+    return _pointer_add(self, -count)
+
+
+_pointer_ops = dict[str, Any](
+    address=property(_pointer_address),
+    view=_pointer_view,
+    read=_pointer_read,
+    write=_pointer_write,
+    iter=_pointer_iter,
+    __add__=_pointer_add,
+    __sub__=_pointer_sub
+)
+
+_typed_pointers = dict[Any, type]()
+
+
+def _typed_pointer(cls_type: Any) -> Any:
+    try:
+        return _typed_pointers[cls_type]
+    except KeyError:
+        ...
+
+    # The pointer ops live on our own subclass, the POINTER(T) types ctypes shares with everyone stay untouched.
+    # Its instances are still POINTER(T) instances, so they're accepted wherever those are.
+    base = POINTER(cls_type)
+    namespace = dict(_pointer_ops, _type_=cls_type, __module__=__name__)
+    ptr_type = type(base)(base.__name__, (base, ), namespace)  # type: ignore
+
+    return _typed_pointers.setdefault(cls_type, ptr_type)
+
+
+def _is_typed_pointer(ctype: Any) -> bool:
+    return _typed_pointers.get(getattr(ctype, '_type_', None), None) is ctype
+
+
+class OutParam:
+    __bound_value__: type[CDataBase]
+    __inout__: bool = False
+
+
+class Out(Generic[C_T]):
+    __inout__ = False
+
+    def __class_getitem__(cls, _type: C_T) -> type[OutParam]:
+        try:
+            return _cache_outparam_getitem[(_type, cls.__inout__)]
+        except KeyError:
+            from .utils import normalize_ctype
+
+            class OutInnerClass(OutParam):
+                __bound_value__ = normalize_ctype(_type)
+                __inout__ = cls.__inout__
+
+            _cache_outparam_getitem[(_type, cls.__inout__)] = OutInnerClass
+
+        return _cache_outparam_getitem[(_type, cls.__inout__)]
+
+
+class InOut(Out):  # type: ignore[type-arg]
+    __inout__ = True
+
+
 if TYPE_CHECKING:
     class CFuncPointerBase(FuncPointerType):
         _flags_: int
@@ -195,7 +365,7 @@ class FuncPointer(Generic[P, R], CFuncPointerBase):
             [type[CDataBase] | None, FuncPointer[P, R], tuple[CDataBase, ...]], CDataBase
         ]
 
-    def __new__(cls: type[Self], func: c_void_p | Callable[P, R] | None = None) -> Self:
+    def __new__(cls: type[Self], func: int | c_void_p | Callable[P, R] | None = None) -> Self:
         if func is None:
             def _func(*args):  # type: ignore
                 ...
@@ -242,9 +412,11 @@ class MetaClassDictBase(dict[str, Any]):
 if TYPE_CHECKING:
     _cache_pbound_getitem = dict[C_T, type[PointerBound]]()
     _cache_pbound_voidptr = dict[type[PointerBound], Pointer[C_T]]()
+    _cache_outparam_getitem = dict[tuple[C_T, bool], type[OutParam]]()
 else:
     _cache_pbound_getitem = {}
     _cache_pbound_voidptr = {}
+    _cache_outparam_getitem = {}
 
 
 builtins_isinstance = builtins.isinstance
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from ctypes import Array, c_char, create_string_buffer
-from dataclasses import dataclass
+from collections import OrderedDict
+from ctypes import Array, Structure, Union, _Pointer, addressof, c_char, memmove, sizeof
+from ctypes import cast as cast_c
+from ctypes import pointer as pointer_c
+from dataclasses import dataclass, field
 from inspect import get_annotations
+from threading import Lock, local
 from types import FunctionType, NoneType
 from typing import Any, Callable, Generic, cast, overload
 
 from .ctypes import StrType, VoidReturn, c_double, c_int, c_void_p
-from .string import String
-from .types import CallingConvention, CDataBase, F, FuncPointer, FuncPointerType, P, Pointer, R, T
+from .pool import scratch_pool
+from .string import String, StringArray, UserString
+from .types import CallingConvention, CDataBase, F, FuncPointer, FuncPointerType, OutParam, P, Pointer, R, T
 
 __all__ = [
     '_protected_keys',
@@ -17,14 +22,16 @@ __all__ = [
 
     'normalize_cfunc', 'normalize_ctype', 'unwrap_func',
 
-    'as_cfunc', 'wrap_func_pointer',
+    'as_cfunc', 'get_cfunctype', 'wrap_func_pointer', 'bind_cfunc',
 
-    'with_signature', 'get_string_buff'
+    'with_signature', 'memoize', 'pure', 'MemoizeInfo',
+
+    'get_string_buff'
 ]
 
 
 _protected_keys = {
-    '_fields_',
+    '_fields_', '_pack_', '_align_'
 }
 
 
@@ -45,6 +52,13 @@ def ord_if_char(value: T) -> T | int:
     return value
 
 
+@dataclass
+class OutParamSpec:
+    index: int
+    ctype: type[CDataBase]
+    inout: bool
+
+
 @dataclass
 class NormalizedFunction(Generic[P, R]):
     func: Callable[P, R]
@@ -55,6 +69,10 @@ class NormalizedFunction(Generic[P, R]):
     res_type: type[CDataBase]
     ores_type: type[CDataBase] | None
     cconv: CallingConvention
+    out_params: list[OutParamSpec] = field(default_factory=list)
+    void_return: bool = False
+    memoize: bool = False
+    memoize_size: int | None = None
 
 
 def unwrap_func(func: Callable[P, R]) -> Callable[P, R]:
@@ -80,7 +98,8 @@ def normalize_cfunc(
     oname = func.__dict__.get('__ctdffi_oname__', None)
     cconv = func.__dict__.get('__ctdffi_cconv__', def_cconv)
 
-    res_type, *args_types = [Pointer.normalize(val) for val in (return_type, *args_types_raw)]
+    res_type = Pointer.normalize(return_type)
+    args_types, out_params = _normalize_args(args_types_raw)
 
     ores_type = func.__dict__.get('__ctdffi_ores_type__', None)
     oargs_types = func.__dict__.get('__ctdffi_oargs_types__', None)
@@ -89,12 +108,34 @@ def normalize_cfunc(
         ores_type = Pointer.normalize(ores_type)
 
     if oargs_types is not None:
-        oargs_types = [Pointer.normalize(val) for val in oargs_types]
+        oargs_types, out_params = _normalize_args(oargs_types)
+
+    void_return = (ores_type or return_type) in {None, NoneType, VoidReturn}
+
+    memoize = '__ctdffi_memoize__' in func.__dict__
+    memoize_size = func.__dict__.get('__ctdffi_memoize__', None)
 
-    return NormalizedFunction(func, name, oname, args_types, oargs_types, res_type, ores_type, cconv)
+    return NormalizedFunction(
+        func, name, oname, args_types, oargs_types, res_type, ores_type, cconv, out_params, void_return,
+        memoize, memoize_size
+    )
 
 
-_c_functype_cache = dict[tuple[type[CDataBase], tuple[type[CDataBase], ...]], type]()
+def _normalize_args(args_types_raw: list[Any]) -> tuple[list[type[CDataBase]], list[OutParamSpec]]:
+    args_types = list[type[CDataBase]]()
+    out_params = list[OutParamSpec]()
+
+    for i, arg_type in enumerate(args_types_raw):
+        if isinstance(arg_type, type) and issubclass(arg_type, OutParam):
+            out_params.append(OutParamSpec(i, arg_type.__bound_value__, arg_type.__inout__))
+            arg_type = Pointer[arg_type.__bound_value__]  # type: ignore
+
+        args_types.append(Pointer.normalize(arg_type))
+
+    return args_types, out_params
+
+
+_c_functype_cache = dict[tuple[type[CDataBase], tuple[type[CDataBase], ...], int], type]()
 
 
 @overload
@@ -111,18 +152,21 @@ def as_cfunc(func: Callable[P, R] | NormalizedFunction[P, R], name: str | None =
     if not isinstance(func, NormalizedFunction):
         func = normalize_cfunc(func, name)
 
-    restype = func.ores_type or func.res_type
-    argtypes = tuple(func.oargs_types or func.args_types)
+    return get_cfunctype(func.ores_type or func.res_type, tuple(func.oargs_types or func.args_types))
+
 
+def get_cfunctype(
+    restype: type[CDataBase], argtypes: tuple[type[CDataBase], ...], flags: int = FuncPointer._flags_
+) -> type[FuncPointer[Any, Any]]:
     try:
-        functype = _c_functype_cache[(restype, argtypes)]
+        functype = _c_functype_cache[(restype, argtypes, flags)]
     except KeyError:
         class CFunctionType(FuncPointer[P, R]):
             _argtypes_ = argtypes
             _restype_ = restype
-            _flags_ = FuncPointer._flags_
+            _flags_ = flags
 
-        functype = _c_functype_cache[(restype, argtypes)] = CFunctionType
+        functype = _c_functype_cache[(restype, argtypes, flags)] = CFunctionType
 
     return functype
 
@@ -175,6 +219,19 @@ def with_signature(
     return wrapper
 
 
+def memoize(maxsize: int | None = 256) -> Callable[[F], F]:
+    def wrapper(func: F) -> F:
+        func.__dict__.__setitem__('__ctdffi_memoize__', maxsize)
+
+        return func
+
+    return wrapper
+
+
+def pure(func: F) -> F:
+    return memoize()(func)
+
+
 def wrap_func_pointer(
     func_ptr: FuncPointerType, name: str | None = None,
     def_cconv: CallingConvention = CallingConvention.C
@@ -182,15 +239,244 @@ def wrap_func_pointer(
     def wrapper(func: Callable[P, R]) -> FuncPointer[P, R]:
         norm = normalize_cfunc(func, name, def_cconv)
 
-        func_pointer = func_ptr
-        func_pointer.argtypes = norm.args_types
-        func_pointer.restype = norm.res_type
+        # Function pointers like the ones of pythonapi are shared, so we bind our own to the same address.
+        func_type = get_cfunctype(norm.res_type, tuple(norm.args_types), func_ptr._flags_)  # type: ignore
 
-        return func_pointer  # type: ignore
+        return func_type(cast_c(func_ptr, c_void_p).value)
 
     return wrapper
 
 
+def _set_pointer_slot(slot: Any, value: Any) -> None:
+    if value is None or isinstance(value, int):
+        c_void_p.from_buffer(slot).value = value
+    elif isinstance(value, _Pointer):
+        memmove(addressof(slot), addressof(value), sizeof(slot))
+    else:
+        slot.contents = value
+
+
+class OutParamFunction(Generic[P, R]):
+    def __init__(self, func_ptr: FuncPointerType, norm: NormalizedFunction[P, R]) -> None:
+        self.func_ptr = func_ptr
+        self.__name__ = norm.name
+        self.__wrapped__ = norm.func
+
+        self.nargs = len(norm.oargs_types or norm.args_types)
+        self.out_params = norm.out_params
+        self.void_return = norm.void_return
+
+        out_indices = {out.index for out in self.out_params if not out.inout}
+
+        self.in_indices = [i for i in range(self.nargs) if i not in out_indices]
+
+        self._local = local()
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        from .serialize import reduce_bound
+
+        return reduce_bound(self, protocol)
+
+    def _template(self) -> tuple[list[Any], list[tuple[CDataBase, bool]], dict[int, CDataBase]]:
+        # Out storage is allocated once per thread and reused by every call, only the values are handed out.
+        try:
+            return self._local.template  # type: ignore
+        except AttributeError:
+            ...
+
+        arguments = list[Any]([None] * self.nargs)
+        slots = list[tuple[CDataBase, bool]]()
+        inout_slots = dict[int, CDataBase]()
+
+        for out in self.out_params:
+            slot = out.ctype()
+            arguments[out.index] = pointer_c(slot)
+
+            # Pointers, like the usual T** out handles, have no .value and are handed out as copies too.
+            slots.append((slot, issubclass(out.ctype, (Structure, Union, Array, _Pointer))))
+
+            if out.inout:
+                inout_slots[out.index] = slot
+
+        template = self._local.template = (arguments, slots, inout_slots)
+
+        return template
+
+    def __call__(self, *args: Any) -> Any:
+        template, slots, inout_slots = self._template()
+
+        if len(args) != len(self.in_indices):
+            raise TypeError(
+                f'{self.__name__}: Expected {len(self.in_indices)} arguments, got {len(args)}!'
+            )
+
+        arguments = template.copy()
+
+        for index, value in zip(self.in_indices, args):
+            if (slot := inout_slots.get(index, None)) is None:
+                arguments[index] = value
+            elif isinstance(slot, _Pointer):
+                _set_pointer_slot(slot, value)
+            elif isinstance(value, CDataBase):
+                memmove(addressof(slot), addressof(value), sizeof(slot))
+            else:
+                slot.value = value  # type: ignore
+
+        result = self.func_ptr(*arguments)
+
+        # Aggregates handed back with scratch_pool.release_struct() are reused by later calls.
+        outs = tuple(
+            scratch_pool.acquire_copy(slot) if aggregate else slot.value  # type: ignore
+            for slot, aggregate in slots
+        )
+
+        if self.void_return:
+            return outs[0] if len(outs) == 1 else outs
+
+        return (result, *outs)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.__name__} of {self.func_ptr!r}>'
+
+
+@dataclass
+class MemoizeInfo:
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+
+def _memoize_key(arg_type: type[CDataBase]) -> Callable[[Any], Any]:
+    if arg_type is String:
+        def _string_key(value: Any) -> Any:
+            if isinstance(value, str):
+                return value.encode()
+
+            if isinstance(value, (String, UserString)):
+                return bytes(value)
+
+            return value
+
+        return _string_key
+
+    if issubclass(arg_type, (Structure, Union, Array)):
+        def _aggregate_key(value: Any) -> Any:
+            if isinstance(value, CDataBase):
+                return (type(value), bytes(memoryview(value).cast('B')))
+
+            return value
+
+        return _aggregate_key
+
+    def _simple_key(value: Any) -> Any:
+        if isinstance(value, CDataBase):
+            return value.value  # type: ignore
+
+        return value
+
+    return _simple_key
+
+
+class MemoizedFunction(Generic[P, R]):
+    def __init__(self, func: Callable[..., Any], norm: NormalizedFunction[P, R]) -> None:
+        self.func = func
+        self.__name__ = norm.name
+        self.__wrapped__ = norm.func
+
+        self.maxsize = norm.memoize_size
+
+        args_types = norm.oargs_types or norm.args_types
+        in_indices = getattr(func, 'in_indices', range(len(args_types)))
+
+        for i in in_indices:
+            if args_types[i] is not String and issubclass(args_types[i], _Pointer):
+                raise TypeError(
+                    f'memoize: Can\'t memoize {norm.name}, argument {i} is passed by pointer!'
+                )
+
+        self._keys = [_memoize_key(args_types[i]) for i in in_indices]
+
+        self._cache = OrderedDict[Any, Any]()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        from .serialize import reduce_bound
+
+        return reduce_bound(self, protocol)
+
+    def __call__(self, *args: Any) -> Any:
+        try:
+            key = tuple(make_key(arg) for make_key, arg in zip(self._keys, args))
+            hash(key)
+        except TypeError:
+            self.misses += 1
+            return self.func(*args)
+
+        with self._lock:
+            try:
+                result = self._cache[key]
+            except KeyError:
+                ...
+            else:
+                self._cache.move_to_end(key)
+                self.hits += 1
+
+                return self._copy(result)
+
+        result = self.func(*args)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = result
+
+            if self.maxsize is not None and len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+        return self._copy(result)
+
+    @staticmethod
+    def _copy(result: Any) -> Any:
+        # Cached aggregates are shared, callers only ever get their own copy, out params included.
+        if isinstance(result, (Structure, Union, Array, _Pointer)):
+            return type(result).from_buffer_copy(result)
+
+        if isinstance(result, tuple):
+            return tuple(map(MemoizedFunction._copy, result))
+
+        return result
+
+    def cache_info(self) -> MemoizeInfo:
+        return MemoizeInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} {self.__name__} of {self.func!r}>'
+
+
+def bind_cfunc(func_ptr: FuncPointerType, norm: NormalizedFunction[P, R]) -> Any:
+    func: Any = func_ptr
+
+    if norm.out_params:
+        func = OutParamFunction(func_ptr, norm)
+
+    if norm.memoize:
+        func = MemoizedFunction(func, norm)
+
+    return func
+
+
 _normalization_map = {
     VoidReturn: c_void_p,
     NoneType: c_void_p,
@@ -198,20 +484,32 @@ _normalization_map = {
     int: c_int,
     bool: c_int,
     str: String,
-    StrType: String
+    StrType: String,
+    list[str]: StringArray,
+    list[bytes]: StringArray
 }
 
 
 def normalize_ctype(value: Any) -> type[CDataBase]:
+    from .struct import DeferredStruct
     from .types import PointerBound
     if isinstance(value, type) and issubclass(value, PointerBound):
+        if (name := getattr(value, '__forward_ref__', None)) is not None:
+            raise TypeError(
+                f'Pointer[\'{name}\']: Forward references can only be used as Struct.annotate fields!'
+            )
+
         return value.__norm_bvalue__  # type: ignore
 
+    if isinstance(value, DeferredStruct):
+        return value.resolve()
+
     return cast(type[CDataBase], _normalization_map.get(value, value))
 
 
 def get_string_buff(err_length: int = 1024) -> tuple[Array[c_char], int]:
-    buf = create_string_buffer(err_length)
+    # Buffers handed back with scratch_pool.release_buffer() are reused by later calls.
+    buf = scratch_pool.acquire_buffer(err_length, zero=True)
     return buf, len(buf)
 
 
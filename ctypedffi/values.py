@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from ctypes import Array, Structure, Union, addressof, memmove, sizeof, string_at
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from .layout import struct_fields
+from .types import C_T_CDB, CDataBase
+
+if TYPE_CHECKING:
+    from .arrays import StructArray
+
+__all__ = [
+    'significant_ranges',
+    'value_bytes', 'value_equal', 'value_hash',
+    'copy_value', 'copy_value_into',
+    'array_value_keys', 'array_hashes', 'array_equal'
+]
+
+
+def _collect_ranges(ctype: type[CDataBase], base: int, ranges: list[tuple[int, int]]) -> None:
+    if isinstance(ctype, type) and issubclass(ctype, (Structure, Union)):
+        # Bitfields cover their whole storage unit, unused bits in there are expected to stay zero.
+        for field in struct_fields(ctype):
+            if field.bit_size is None:
+                _collect_ranges(field.ctype, base + field.offset, ranges)
+            else:
+                ranges.append((base + field.offset, base + field.end))
+    elif (
+        isinstance(ctype, type) and issubclass(ctype, Array)
+        and issubclass(item_type := getattr(ctype, '_type_'), (Structure, Union))
+    ):
+        size = sizeof(item_type)
+
+        for i in range(getattr(ctype, '_length_')):
+            _collect_ranges(item_type, base + i * size, ranges)
+    else:
+        ranges.append((base, base + sizeof(ctype)))
+
+
+@lru_cache
+def significant_ranges(ctype: type[CDataBase]) -> tuple[tuple[int, int], ...]:
+    ranges = list[tuple[int, int]]()
+
+    _collect_ranges(ctype, 0, ranges)
+
+    merged = list[tuple[int, int]]()
+
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        elif end > start:
+            merged.append((start, end))
+
+    return tuple(merged)
+
+
+def _has_padding(ctype: type[CDataBase]) -> bool:
+    return significant_ranges(ctype) != ((0, sizeof(ctype)), )
+
+
+def value_bytes(value: CDataBase) -> bytes:
+    ctype = type(value)
+    raw = string_at(addressof(value), sizeof(ctype))
+
+    if not _has_padding(ctype):
+        return raw
+
+    # Padding holds whatever was there before, so it is zeroed for comparisons and hashes.
+    # This is the same representation array_value_keys produces for every record in bulk.
+    masked = bytearray(len(raw))
+
+    for start, end in significant_ranges(ctype):
+        masked[start:end] = raw[start:end]
+
+    return bytes(masked)
+
+
+def value_equal(a: CDataBase, b: Any) -> bool:
+    if type(a) is not type(b):
+        return NotImplemented
+
+    return value_bytes(a) == value_bytes(b)
+
+
+def value_hash(value: CDataBase) -> int:
+    return hash(value_bytes(value))
+
+
+def copy_value(value: C_T_CDB) -> C_T_CDB:
+    ctype = type(value)
+    new = ctype.__new__(ctype)
+
+    memmove(addressof(new), addressof(value), sizeof(ctype))
+
+    return new
+
+
+def copy_value_into(value: C_T_CDB, destination: C_T_CDB) -> C_T_CDB:
+    if type(destination) is not type(value):
+        raise TypeError(
+            f'copy_into: Can\'t copy a {type(value).__name__} into a {type(destination).__name__}!'
+        )
+
+    memmove(addressof(destination), addressof(value), sizeof(value))
+
+    return destination
+
+
+def _masked_records(array: StructArray[Any]) -> bytearray:
+    ctype: type[CDataBase] = array._type_
+    size = array.itemsize
+
+    records = bytearray(array.tobytes())
+
+    # One strided slice assignment per padding byte zeroes it in every record at once.
+    position = 0
+
+    for start, end in (*significant_ranges(ctype), (size, size)):
+        for offset in range(position, start):
+            records[offset::size] = bytes(len(array))
+
+        position = end
+
+    return records
+
+
+def array_value_keys(array: StructArray[Any]) -> list[bytes]:
+    size = array.itemsize
+
+    records = _masked_records(array) if _has_padding(array._type_) else array.tobytes()
+
+    return [bytes(records[offset:offset + size]) for offset in range(0, len(array) * size, size)]
+
+
+def array_hashes(array: StructArray[Any]) -> list[int]:
+    return list(map(hash, array_value_keys(array)))
+
+
+def array_equal(a: StructArray[Any], b: StructArray[Any]) -> list[bool]:
+    if a._type_ is not b._type_:
+        raise TypeError(
+            f'array_equal: Can\'t compare arrays of {a._type_.__name__} and {b._type_.__name__}!'
+        )
+
+    if len(a) != len(b):
+        raise ValueError(
+            f'array_equal: Arrays have different lengths, {len(a)} and {len(b)}!'
+        )
+
+    return [x == y for x, y in zip(array_value_keys(a), array_value_keys(b))]
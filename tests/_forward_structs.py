@@ -0,0 +1,16 @@
+from ctypes import c_int
+
+from ctypedffi import Pointer, Struct
+
+
+@Struct.annotate(deferred=True)
+class ListNode(Struct):
+    value: c_int
+    next: Pointer['ListNode']
+    owner: Pointer['LinkedList']
+
+
+@Struct.annotate(deferred=True)
+class LinkedList(Struct):
+    head: Pointer['ListNode']
+    size: c_int
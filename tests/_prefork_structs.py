@@ -0,0 +1,19 @@
+from ctypes import c_double, c_int
+
+from ctypedffi import Pointer, Struct
+
+
+@Struct.annotate(deferred=True)
+class Reached(Struct):
+    value: c_int
+    other: Pointer['AlsoReached']
+
+
+@Struct.annotate(deferred=True)
+class AlsoReached(Struct):
+    x: c_double
+
+
+@Struct.annotate(deferred=True)
+class NotReached(Struct):
+    y: c_int
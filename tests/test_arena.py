@@ -0,0 +1,117 @@
+from ctypes import addressof, c_int, c_short, c_void_p, pointer, sizeof
+
+import pytest
+
+from ctypedffi import Arena, Pointer, String, Struct
+
+
+@Struct.annotate
+class Point(Struct):
+    x: c_int
+    y: c_int
+
+
+@Struct.annotate
+class Shape(Struct):
+    name: String
+    origin: Pointer[Point]
+    values: Pointer[c_int]
+    extra: c_void_p
+
+
+def test_new_builds_the_whole_graph() -> None:
+    arena = Arena()
+    shape = arena.new(Shape, name='square', origin={'x': 1, 'y': 2}, values=[3, 4, 5])
+
+    assert shape.name == 'square'
+    assert (shape.origin.contents.x, shape.origin.contents.y) == (1, 2)
+    assert list(shape.values.read(3)) == [3, 4, 5]
+
+    for address in (addressof(shape), shape.origin.address, shape.values.address):
+        assert arena.owns(address)
+
+    assert arena.stats().allocations == 4
+
+
+def test_outside_values_are_copied_in() -> None:
+    arena = Arena()
+    point = Point(1, 2)
+
+    shape = arena.new(Shape, origin=point, extra=point)
+
+    assert arena.owns(shape.origin.address) and shape.origin.address != addressof(point)
+    assert arena.owns(shape.extra)
+
+    # Pointers are stored as they are, whatever they point to.
+    shape = arena.new(Shape, origin=pointer(point))
+
+    assert shape.origin.address == addressof(point)
+
+
+def test_values_of_the_wrong_type_are_rejected() -> None:
+    arena = Arena()
+
+    with pytest.raises(TypeError):
+        arena.new(Shape, origin=c_int(1))
+
+    with pytest.raises(TypeError):
+        arena.new(Shape, values=pointer(c_short(1)))
+
+    with pytest.raises(TypeError):
+        arena.new(Shape, values=(c_short * 2)(1, 2))
+
+    assert list(arena.new(Shape, values=(c_int * 2)(1, 2)).values.read(2)) == [1, 2]
+
+
+def test_reset_reuses_zeroed_memory() -> None:
+    arena = Arena()
+    first = arena.new(Point, x=1, y=2)
+    arena.reset()
+
+    # Objects from before the reset alias the freed memory, which reads as empty.
+    assert (first.x, first.y) == (0, 0)
+    assert arena.used == 0
+
+    second = arena.new(Point)
+
+    assert addressof(second) == addressof(first)
+    assert arena.stats().resets == 1
+
+
+def test_scope_rolls_back() -> None:
+    arena = Arena()
+    kept = arena.new(Point, x=1)
+
+    with arena.scope():
+        arena.array(c_int, 100)
+
+    assert arena.used == sizeof(Point) and kept.x == 1
+
+
+def test_overflow_to_new_chunks() -> None:
+    arena = Arena(chunk_size=64)
+    points = [arena.new(Point, x=i) for i in range(8)]
+
+    assert arena.stats().chunks == 1
+
+    overflow = arena.new(Point, x=8)
+    large = arena.array(c_int, 64)
+
+    # Anything larger than a chunk gets one of its own size.
+    assert arena.stats().chunks == 3
+    assert arena.capacity == 64 + 64 + sizeof(large)
+    assert [point.x for point in points + [overflow]] == list(range(9))
+
+    # Chunks are kept across resets, filling the arena again doesn't allocate.
+    arena.reset()
+
+    for _ in range(9):
+        arena.new(Point)
+
+    arena.array(c_int, 64)
+
+    assert arena.stats().chunks == 3
+
+    arena.close()
+
+    assert arena.capacity == 64
@@ -0,0 +1,78 @@
+from ctypes import c_double, c_int
+
+import pytest
+
+from ctypedffi import MappedStructArray, Struct
+
+
+@Struct.annotate
+class Sample(Struct):
+    id: c_int
+    value: c_double
+
+
+def test_read_only_mapping(tmp_path) -> None:  # type: ignore
+    path = tmp_path / 'samples.bin'
+    path.write_bytes(bytes(Sample(1, 0.5)) + bytes(Sample(2, 1.5)))
+
+    with MappedStructArray(Sample, path) as samples:
+        assert [(sample.id, sample.value) for sample in samples] == [(1, 0.5), (2, 1.5)]
+
+        with pytest.raises(TypeError):
+            samples[0] = Sample(3, 2.5)
+
+        # Elements are copies, writing to them never reaches the file.
+        samples[1].id = 7
+
+        assert samples[1].id == 2
+        assert samples.raw().readonly
+
+    assert path.read_bytes() == bytes(Sample(1, 0.5)) + bytes(Sample(2, 1.5))
+
+
+def test_writable_mapping(tmp_path) -> None:  # type: ignore
+    path = tmp_path / 'samples.bin'
+    path.write_bytes(bytes(Sample(1, 0.5)))
+
+    with MappedStructArray(Sample, path, 'r+') as samples:
+        samples[0].id = 7
+
+    assert path.read_bytes() == bytes(Sample(7, 0.5))
+
+
+def test_copy_on_write_mapping(tmp_path) -> None:  # type: ignore
+    path = tmp_path / 'samples.bin'
+    path.write_bytes(bytes(Sample(1, 0.5)))
+
+    with MappedStructArray(Sample, path, 'c') as samples:
+        sample = samples[0]
+        sample.id = 7
+
+        # Elements are views of the mapping, but the writes never reach the file.
+        assert samples[0].id == 7
+        assert not samples.raw().readonly
+
+    assert path.read_bytes() == bytes(Sample(1, 0.5))
+
+
+def test_failed_mapping_closes_the_file(tmp_path, monkeypatch) -> None:  # type: ignore
+    path = tmp_path / 'samples.bin'
+    path.write_bytes(bytes(Sample(1, 0.5)))
+
+    files = []
+    close = MappedStructArray.close
+
+    def _close(self) -> None:  # type: ignore
+        files.append(self._file)
+        close(self)
+
+    def _mmap(*args, **kwargs) -> None:  # type: ignore
+        raise OSError('mmap failed')
+
+    monkeypatch.setattr(MappedStructArray, 'close', _close)
+    monkeypatch.setattr('ctypedffi.arrays.mmap.mmap', _mmap)
+
+    with pytest.raises(OSError):
+        MappedStructArray(Sample, path)
+
+    assert len(files) == 1 and files[0].closed
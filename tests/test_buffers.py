@@ -0,0 +1,103 @@
+import gc
+import weakref
+from ctypes import addressof, c_char_p, create_string_buffer
+
+import pytest
+
+from ctypedffi import OwnedMemory, bytes_at, capsule_new, memoryview_at
+from ctypedffi.libs import PyCapsule
+
+
+class _Owner:
+    def __init__(self, size: int) -> None:
+        self.buffer = create_string_buffer(b'abcdef', size)
+
+
+def test_memoryview_at_borrowed() -> None:
+    buffer = create_string_buffer(b'abcdef', 6)
+
+    view = memoryview_at(addressof(buffer), 6)
+
+    assert view.readonly and bytes(view) == b'abcdef'
+
+    writable = memoryview_at(addressof(buffer), 6, readonly=False)
+    writable[0] = ord('x')
+
+    assert buffer.raw == b'xbcdef'
+
+
+def test_memoryview_at_keeps_owner_alive() -> None:
+    owner = _Owner(6)
+    ref = weakref.ref(owner)
+
+    # Views derived from the first one keep the owner alive too.
+    view = memoryview_at(addressof(owner.buffer), 6, owner=owner)[2:4]
+    del owner
+    gc.collect()
+
+    assert ref() is not None and bytes(view) == b'cd'
+
+    del view
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_bytes_at_copies() -> None:
+    buffer = create_string_buffer(b'abcdef', 6)
+    data = bytes_at(addressof(buffer), 4)
+
+    buffer[0] = b'x'
+
+    assert data == b'abcd'
+
+
+def test_owned_memory_frees_once() -> None:
+    buffer = create_string_buffer(8)
+    freed = list[int]()
+
+    memory = OwnedMemory(addressof(buffer), 8, freed.append)
+    memory.release()
+    memory.release()
+
+    assert freed == [addressof(buffer)]
+
+
+def test_owned_memory_lives_as_long_as_its_views() -> None:
+    buffer = create_string_buffer(b'abcdef', 6)
+    freed = list[int]()
+
+    view = OwnedMemory(addressof(buffer), 6, freed.append).memoryview(readonly=True)
+    gc.collect()
+
+    assert not freed and bytes(view) == b'abcdef'
+
+    del view
+    gc.collect()
+
+    assert freed == [addressof(buffer)]
+
+
+def test_capsule_destructor() -> None:
+    buffer = create_string_buffer(8)
+    destroyed = list[int]()
+
+    capsule = capsule_new(addressof(buffer), 'ctypedffi.test', destroyed.append)
+
+    assert PyCapsule.GetPointer(capsule, c_char_p(b'ctypedffi.test')) == addressof(buffer)
+
+    del capsule
+    gc.collect()
+
+    assert destroyed == [addressof(buffer)]
+
+
+def test_capsule_without_destructor() -> None:
+    buffer = create_string_buffer(8)
+
+    capsule = capsule_new(addressof(buffer))
+
+    assert PyCapsule.GetPointer(capsule, None) == addressof(buffer)
+
+    with pytest.raises(ValueError):
+        capsule_new(0)
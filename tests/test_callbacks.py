@@ -0,0 +1,133 @@
+from asyncio import get_running_loop, run, sleep, wait_for
+from ctypes import c_int, c_void_p
+from threading import Thread
+from typing import Any
+
+import pytest
+
+from ctypedffi import CallbackBridge, CallbackRegistry
+
+
+def callback(x: c_int, userdata: c_void_p) -> c_int:
+    ...
+
+
+def test_dispatch_by_token() -> None:
+    dispatcher = CallbackRegistry().dispatcher(callback)
+
+    double = dispatcher.register(lambda x, userdata: x * 2)
+    offset = dispatcher.register(lambda x, userdata: x + 100)
+
+    assert dispatcher.thunk(3, double) == 6
+    assert dispatcher.thunk(3, offset) == 103
+    assert dispatcher.counters() == {double: 1, offset: 1}
+
+
+def test_unknown_token(capsys) -> None:  # type: ignore
+    dispatcher = CallbackRegistry().dispatcher(callback)
+    token = dispatcher.register(lambda x, userdata: x)
+
+    dispatcher.unregister(token)
+
+    assert dispatcher.thunk(3, token) == 0
+    assert dispatcher.thunk(3, 12345) == 0
+    assert dispatcher.thunk(3, None) == 0
+    assert dispatcher.misses == 3
+
+    # Nothing may be raised inside the thunk.
+    assert 'Exception ignored' not in capsys.readouterr().err
+
+
+def test_counters_are_exact_across_threads() -> None:
+    dispatcher = CallbackRegistry().dispatcher(callback)
+    token = dispatcher.register(lambda x, userdata: x)
+
+    def work() -> None:
+        for _ in range(2000):
+            dispatcher.thunk(1, token)
+            dispatcher.thunk(1, None)
+
+    threads = [Thread(target=work) for _ in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert dispatcher.counters() == {token: 8000}
+    assert dispatcher.misses == 8000
+
+
+def test_unknown_token_default() -> None:
+    dispatcher = CallbackRegistry().dispatcher(callback, default=-1)
+
+    assert dispatcher.thunk(3, 1) == -1
+
+
+def test_bridge_block_on_loop_thread() -> None:
+    batches = list[list[tuple[Any, ...]]]()
+
+    async def handler(batch: list[tuple[Any, ...]]) -> None:
+        batches.append(batch)
+
+    async def main() -> CallbackBridge:
+        bridge = CallbackBridge(callback, handler, get_running_loop(), maxsize=1, overflow='block', result=0)
+
+        # The queue is drained by this very loop, a blocking callback would deadlock it.
+        bridge.thunk(1, None)
+        bridge.thunk(2, None)
+
+        await sleep(0)
+        await sleep(0)
+
+        bridge.close()
+
+        return bridge
+
+    bridge = run(main())
+
+    assert bridge.received == 2
+    assert bridge.dropped == 1
+    assert batches == [[(1, None)]]
+
+
+def test_bridge_close_from_another_thread() -> None:
+    async def main() -> list[list[tuple[Any, ...]]]:
+        loop = get_running_loop()
+        bridge = CallbackBridge(callback, loop=loop, result=0)
+
+        async def consume() -> list[list[tuple[Any, ...]]]:
+            return [batch async for batch in bridge]
+
+        consumer = loop.create_task(consume())
+        await sleep(0)
+
+        def produce() -> None:
+            bridge.thunk(7, None)
+            bridge.close()
+
+        await loop.run_in_executor(None, produce)
+
+        return await wait_for(consumer, 5)
+
+    assert run(main()) == [[(7, None)]]
+
+
+def test_bridge_coroutine_handler_needs_loop() -> None:
+    async def handler(batch: list[tuple[Any, ...]]) -> None:
+        ...
+
+    with pytest.raises(ValueError):
+        CallbackBridge(callback, handler)
+
+
+def test_bridge_ignores_callbacks_after_close() -> None:
+    batches = list[list[tuple[Any, ...]]]()
+
+    with CallbackBridge(callback, batches.append, result=5) as bridge:
+        assert bridge.thunk(1, None) == 5
+
+    assert bridge.thunk(2, None) == 5
+    assert bridge.received == 1
+    assert batches == [[(1, None)]]
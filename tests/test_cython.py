@@ -0,0 +1,115 @@
+from ctypes import CDLL, POINTER, c_double, c_int, c_ssize_t, c_void_p, cast
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from ctypedffi import (
+    CapsuleTable, CythonModule, String, UnsupportedSignatureWarning, capsule_new, parse_capsule_signature
+)
+from ctypedffi.ctypes import py_object
+
+_libc = CDLL(None)
+
+
+def _fake_module(name: str, **signatures: str) -> ModuleType:
+    # Every capsule points at abs(), only the signatures differ.
+    address = cast(_libc.abs, c_void_p).value
+
+    module = ModuleType(name)
+    module.__pyx_capi__ = {  # type: ignore
+        func: capsule_new(address, signature) for func, signature in signatures.items()
+    }
+
+    return module
+
+
+@pytest.mark.parametrize('signature, restype, argtypes', [
+    ('int (int, int)', c_int, (c_int, c_int)),
+    ('double (void)', c_double, ()),
+    ('double *(double const *, Py_ssize_t)', POINTER(c_double), (POINTER(c_double), c_ssize_t)),
+    ('char *(char *)', String, (String, )),
+    ('PyObject *(PyObject *, int __pyx_skip_dispatch)', py_object, (py_object, c_int)),
+    ('enum __pyx_t_color (int)', c_int, (c_int, )),
+    ('int (int (*)(int), void *)', c_int, (c_void_p, c_void_p)),
+    ('int **(struct foo *)', c_void_p, (c_void_p, )),
+])
+def test_parse_signature(signature: str, restype: Any, argtypes: tuple[Any, ...]) -> None:
+    assert parse_capsule_signature(signature) == (restype, argtypes)
+
+
+@pytest.mark.parametrize('signature, error', [
+    ('__pyx_t_5numpy_float64_t (int)', TypeError),
+    ('int (struct foo)', TypeError),
+    ('int', ValueError),
+    ('int (int))', ValueError),
+])
+def test_parse_unsupported_signature(signature: str, error: type[Exception]) -> None:
+    with pytest.raises(error):
+        parse_capsule_signature(signature)
+
+
+def test_autobind_warns_about_skipped_functions() -> None:
+    module = _fake_module('_autobind_skipped', iabs='int (int)', fabs='__pyx_t_5numpy_float64_t (int)')
+
+    with pytest.warns(UnsupportedSignatureWarning, match='fabs'):
+        class Fake(CythonModule, module=module, autobind=True):
+            ...
+
+    assert Fake.iabs(-3) == 3
+    assert 'fabs' not in Fake.__dict__
+
+
+def test_autobind_by_name_raises() -> None:
+    module = _fake_module('_autobind_named', fabs='__pyx_t_5numpy_float64_t (int)')
+
+    with pytest.raises(TypeError):
+        class Fake(CythonModule, module=module, autobind=['fabs']):
+            ...
+
+
+def test_lazy_binding() -> None:
+    module = _fake_module('_lazy_binding', iabs='int (int)', other='int (int)')
+
+    class Fake(CythonModule, module=module, autobind=True, lazy=True):
+        ...
+
+    table = CapsuleTable.of(module)
+
+    # Nothing is resolved until a function is first used, which then replaces its placeholder.
+    assert not table.pointers and not table.functypes
+
+    assert Fake.iabs(-4) == 4
+    assert list(table.pointers) == ['iabs']
+    assert Fake.__dict__['iabs'] is Fake.iabs
+
+    Fake.bind_all()
+
+    assert set(table.pointers) == {'iabs', 'other'}
+
+
+def test_lazy_declared_function() -> None:
+    module = _fake_module('_lazy_declared', iabs='int (int)')
+
+    class Fake(CythonModule, module=module, lazy=True):
+        def iabs(x: c_int) -> c_int:
+            ...
+
+    assert not CapsuleTable.of(module).pointers
+    assert Fake.iabs(-5) == 5
+
+
+def test_capsule_tables_are_shared() -> None:
+    module = _fake_module('_shared_table', iabs='int (int)')
+
+    class First(CythonModule, module=module, autobind=True):
+        ...
+
+    class Second(CythonModule, module=module, autobind=['iabs']):
+        ...
+
+    table = CapsuleTable.of(module)
+
+    assert table is CapsuleTable.of(module)
+    assert list(table.pointers) == ['iabs']
+    assert First.iabs(-6) == Second.iabs(-6) == 6
@@ -0,0 +1,42 @@
+from ctypes import c_int, pointer
+
+import pytest
+
+import _forward_structs as defs
+from ctypedffi import Pointer, Struct, sizeof
+
+
+def test_forward_refs_without_future_annotations() -> None:
+    first, second = defs.ListNode(1), defs.ListNode(2)
+    linked = defs.LinkedList()
+
+    first.next = pointer(second)
+    first.owner = pointer(linked)
+    linked.head = pointer(first)
+
+    assert first.next.contents.value == 2
+    assert linked.head.contents.next.contents.value == 2
+    assert defs.ListNode.finalized and defs.LinkedList.finalized
+
+    assert sizeof(defs.ListNode) == sizeof(defs.ListNode.resolve())
+
+
+def test_forward_ref_needs_deferred() -> None:
+    with pytest.raises(TypeError, match='forward references'):
+        @Struct.annotate
+        class Eager(Struct):
+            next: Pointer['Eager']
+
+
+def test_forward_ref_outside_struct() -> None:
+    with pytest.raises(TypeError, match='Forward references'):
+        Pointer.normalize(Pointer['Anything'])
+
+
+def test_proxy_checks() -> None:
+    node = defs.ListNode(3)
+
+    assert isinstance(node, defs.ListNode)
+    assert issubclass(type(node), defs.ListNode)
+    assert issubclass(defs.ListNode.resolve(), Struct)
+    assert not isinstance(c_int(), defs.ListNode)
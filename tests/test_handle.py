@@ -0,0 +1,80 @@
+import gc
+import warnings
+from threading import Event, current_thread
+from typing import Any
+
+from ctypedffi import HandleLeakWarning, HandleReaper, OwnedHandle
+from ctypedffi.handle import _warn_leaks
+
+freed = list[int]()
+reaper = HandleReaper(threshold=4)
+
+
+class Handle(OwnedHandle, destructor=lambda pointer: freed.append(pointer.value), reaper=reaper):
+    ...
+
+
+def test_close_flushes_at_threshold() -> None:
+    freed.clear()
+
+    for address in range(1, 5):
+        Handle(address).close()
+
+    assert sorted(freed) == [1, 2, 3, 4]
+    assert reaper.pending == 0
+
+
+def test_finalizers_never_flush() -> None:
+    own_reaper = HandleReaper(threshold=4)
+    threads = list[str]()
+    flushed = Event()
+
+    def destructor(pointer: Any) -> None:
+        threads.append(current_thread().name)
+
+        if len(threads) == 8:
+            flushed.set()
+
+    class Finalized(OwnedHandle, destructor=destructor, reaper=own_reaper):
+        ...
+
+    for address in range(1, 9):
+        Finalized(address)
+
+    gc.collect()
+
+    # Reaching the threshold from finalizers hands the queue to the reaper thread instead of growing forever.
+    assert flushed.wait(5)
+    assert own_reaper.pending == 0
+    assert set(threads) == {'ctypedffi-reaper'}
+
+    own_reaper.stop()
+
+
+def test_finalizers_below_threshold_stay_queued() -> None:
+    freed.clear()
+
+    for address in range(1, 4):
+        Handle(address)
+
+    gc.collect()
+
+    assert freed == []
+    assert reaper.pending == 3
+    assert reaper.flush() == 3
+    assert sorted(freed) == [1, 2, 3]
+
+
+def test_leaks_are_not_hidden_by_default() -> None:
+    handle = Handle(42)
+
+    assert not issubclass(HandleLeakWarning, ResourceWarning)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.resetwarnings()
+        warnings.simplefilter('default')
+        _warn_leaks()
+
+    assert any(issubclass(w.category, HandleLeakWarning) for w in caught)
+
+    handle.close_now()
@@ -0,0 +1,75 @@
+from ctypes import BigEndianStructure, Structure, alignment, c_char, c_int, c_uint8, c_uint32, sizeof
+from typing import Annotated
+
+from ctypedffi import Bits as BitWidth
+from ctypedffi import Struct, layout_fingerprint, struct_fields
+from ctypedffi.codegen import struct_format
+from ctypedffi.values import significant_ranges
+
+
+class Large(Structure):
+    _fields_ = [('head', c_int), ('data', c_char * 70000), ('tail', c_int)]
+
+
+class Bits(Structure):
+    _fields_ = [('a', c_uint32, 3), ('b', c_uint32, 5), ('c', c_uint32)]
+
+
+def test_large_field_is_not_a_bitfield() -> None:
+    head, data, tail = struct_fields(Large)
+
+    assert (data.offset, data.size, data.bit_offset, data.bit_size) == (4, 70000, None, None)
+    assert tail.offset == 70004
+
+    assert significant_ranges(Large) == ((0, 70008), )
+    assert struct_format(Large) is None
+
+
+def test_large_field_fingerprint() -> None:
+    class Other(Structure):
+        _fields_ = [('head', c_int), ('data', c_char * 70001), ('tail', c_int)]
+
+    assert layout_fingerprint(Large) != layout_fingerprint(Other)
+
+
+def test_bitfields() -> None:
+    a, b, c = struct_fields(Bits)
+
+    assert (a.offset, a.bit_offset, a.bit_size) == (0, 0, 3)
+    assert (b.offset, b.bit_offset, b.bit_size) == (0, 3, 5)
+    assert (c.offset, c.bit_offset, c.bit_size) == (4, None, None)
+
+
+def test_big_endian_bitfields_keep_declaration_order() -> None:
+    class Flags(BigEndianStructure):
+        _fields_ = [('a', c_uint32, 3), ('b', c_uint32, 5)]
+
+    a, b = struct_fields(Flags)
+
+    assert (a.name, a.bit_size) == ('a', 3)
+    assert (b.name, b.bit_size) == ('b', 5)
+
+
+def test_annotated_bitfields() -> None:
+    @Struct.annotate
+    class AnnotatedBits(Struct):
+        a: Annotated[c_uint32, BitWidth(3)]
+        b: Annotated[c_uint32, BitWidth(5)]
+        c: c_uint32
+
+    assert [(f.name, f.offset, f.bit_offset, f.bit_size) for f in struct_fields(AnnotatedBits)] == [
+        (f.name, f.offset, f.bit_offset, f.bit_size) for f in struct_fields(Bits)
+    ]
+    assert layout_fingerprint(AnnotatedBits) == layout_fingerprint(Bits)
+
+
+def test_packed_struct() -> None:
+    @Struct.annotate
+    class Packed(Struct, pack=1):
+        tag: c_uint8
+        value: c_uint32
+
+    tag, value = struct_fields(Packed)
+
+    assert value.offset == 1
+    assert (sizeof(Packed), alignment(Packed)) == (5, 1)
@@ -0,0 +1,17 @@
+from ctypedffi import LibraryVariant, cpu_flags
+
+
+def test_variant_requires_is_normalized() -> None:
+    variant = LibraryVariant('libm.so.6', 'avx2')
+
+    assert variant.requires == frozenset({'avx2'})
+    assert variant.supported() == ('avx2' in cpu_flags())
+    assert LibraryVariant('libm.so.6', ['sse2', 'avx2']) == LibraryVariant('libm.so.6', ('avx2', 'sse2'))
+    assert len({variant, LibraryVariant('libm.so.6', ['avx2'])}) == 1
+
+
+def test_variant_requires_callable() -> None:
+    check = lambda: False  # noqa: E731
+
+    assert LibraryVariant('libm.so.6', check).requires is check
+    assert not LibraryVariant('libm.so.6', check).supported()
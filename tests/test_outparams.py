@@ -0,0 +1,89 @@
+from ctypes import Structure, c_char, c_char_p, c_double, c_int, c_long, c_ulong, cast
+from resource import RLIMIT_NOFILE
+
+from ctypedffi import InOut, Library, Out, Pointer, memoize, scratch_pool
+
+
+class LibC(Library, lib='c'):
+    def strtol(s: c_char_p, end: Out[Pointer[c_char]], base: c_int) -> c_long:
+        ...
+
+    def strtok_r(s: c_char_p, delim: c_char_p, save: InOut[Pointer[c_char]]) -> c_char_p:
+        ...
+
+
+class LibM(Library, lib='m'):
+    def frexp(x: c_double, exp: Out[c_int]) -> c_double:
+        ...
+
+
+def test_out_simple() -> None:
+    assert LibM.frexp(8.0) == (0.5, 4)
+    assert LibM.frexp(3.0) == (0.75, 2)
+
+
+def test_out_pointer() -> None:
+    data = c_char_p(b'123abc')
+
+    number, end = LibC.strtol(data, 10)
+
+    assert number == 123
+    assert cast(end, c_char_p).value == b'abc'
+
+    # Every call hands out its own copy of the pointer.
+    _, other = LibC.strtol(c_char_p(b'7xyz'), 10)
+
+    assert cast(end, c_char_p).value == b'abc'
+    assert cast(other, c_char_p).value == b'xyz'
+
+
+def test_inout_pointer() -> None:
+    data = (c_char * 8)(*b'a,b,c')
+
+    token, save = LibC.strtok_r(data, b',', None)
+    assert (token, cast(save, c_char_p).value) == (b'a', b'b,c')
+
+    token, save = LibC.strtok_r(None, b',', save)
+    assert (token, cast(save, c_char_p).value) == (b'b', b'c')
+
+
+class RLimit(Structure):
+    _fields_ = [('cur', c_ulong), ('max', c_ulong)]
+
+
+class LibCMemo(Library, lib='c'):
+    @memoize()
+    def getrlimit(resource: c_int, rlim: Out[RLimit]) -> c_int:
+        ...
+
+
+def test_memoized_out_params_are_copied() -> None:
+    status, first = LibCMemo.getrlimit(RLIMIT_NOFILE)
+    limit = (first.cur, first.max)
+
+    first.cur = first.max = 0
+
+    status, second = LibCMemo.getrlimit(RLIMIT_NOFILE)
+
+    assert status == 0
+    assert second is not first
+    assert (second.cur, second.max) == limit
+    assert LibCMemo.getrlimit.cache_info().hits == 1
+
+
+class LibCLimits(Library, lib='c'):
+    def getrlimit(resource: c_int, rlim: Out[RLimit]) -> c_int:
+        ...
+
+
+def test_released_out_params_are_reused() -> None:
+    _, first = LibCLimits.getrlimit(RLIMIT_NOFILE)
+    limit = (first.cur, first.max)
+
+    scratch_pool.release_struct(first)
+
+    _, second = LibCLimits.getrlimit(RLIMIT_NOFILE)
+    _, third = LibCLimits.getrlimit(RLIMIT_NOFILE)
+
+    assert second is first and third is not second
+    assert (second.cur, second.max) == (third.cur, third.max) == limit
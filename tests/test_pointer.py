@@ -0,0 +1,75 @@
+from ctypes import POINTER, addressof, c_int, c_short, pointer
+
+import pytest
+
+from ctypedffi import Pointer, Struct
+
+
+@Struct.annotate
+class Node(Struct):
+    value: c_int
+    data: Pointer[c_int]
+
+
+def test_ops_do_not_leak_into_ctypes() -> None:
+    assert not hasattr(POINTER(c_int), 'read')
+    assert not hasattr(pointer(c_int(1)), '__add__')
+
+    ptr_type = Pointer.normalize(Pointer[c_int])
+
+    assert ptr_type is not POINTER(c_int)
+    assert issubclass(ptr_type, POINTER(c_int))
+
+
+def test_bulk_access() -> None:
+    array = (c_int * 6)(*range(6))
+    ptr = Pointer[c_int].at(addressof(array))
+
+    assert ptr.address == addressof(array)
+    assert list(ptr.read(3, 2)) == [2, 3, 4]
+    assert list(ptr.iter(3, stride=2)) == [0, 2, 4]
+    assert list(ptr.iter(2, stride=2, start=1)) == [1, 3]
+    assert list(ptr.iter(0)) == []
+    assert (ptr + 5)[0] == 5
+    assert ((ptr + 5) - 2)[0] == 3
+
+    ptr.write([10, 11], 1)
+    assert list(array) == [0, 10, 11, 3, 4, 5]
+
+
+def test_fields_accept_plain_pointers() -> None:
+    array = (c_int * 3)(7, 8, 9)
+    node = Node(1)
+
+    node.data = POINTER(c_int)(array)
+    assert list(node.data.read(3)) == [7, 8, 9]
+
+    node.data = Pointer(c_int(5))
+    assert node.data[0] == 5
+
+    node.data = None
+    assert not node.data
+
+
+def test_iter_is_lazy() -> None:
+    array = (c_int * 4)(*range(4))
+    items = Pointer[c_int].at(addressof(array)).iter(4)
+
+    assert next(items) == 0
+
+    # Nothing is read ahead, later writes show up in the remaining elements.
+    array[1] = 10
+
+    assert list(items) == [10, 2, 3]
+
+
+def test_fields_reject_other_pointers() -> None:
+    node = Node(1)
+
+    with pytest.raises(TypeError):
+        node.data = pointer(c_short(5))
+
+    with pytest.raises(TypeError):
+        node.data = Pointer(c_short(5))
+
+    assert not node.data
@@ -0,0 +1,141 @@
+import gc
+import weakref
+from ctypes import c_double, c_int
+from threading import Thread
+
+import pytest
+
+from ctypedffi import Pointer, ScratchPool, Struct, StructPool, get_string_buff, scratch_pool
+
+
+@Struct.annotate
+class Request(Struct):
+    id: c_int
+    value: c_double
+
+
+@Struct.annotate
+class Linked(Struct):
+    data: Pointer[c_int]
+
+
+def test_struct_pool_allocates_lazily() -> None:
+    pool = StructPool(Request, 4)
+
+    assert len(pool) == 0 and pool.stats().allocated == 0
+
+    items = [pool.acquire() for _ in range(4)]
+
+    for item in items:
+        pool.release(item)
+
+    assert len(pool) == 4
+    assert {id(pool.acquire()) for _ in range(4)} == set(map(id, items))
+
+    stats = pool.stats()
+    assert (stats.allocated, stats.reused) == (4, 4)
+
+
+def test_struct_pool_zeroes_on_release() -> None:
+    pool = StructPool(Request, 2)
+
+    with pool.borrow() as item:
+        item.id, item.value = 5, 1.5
+
+    again = pool.acquire()
+    assert again is item
+    assert (again.id, again.value) == (0, 0.0)
+
+
+def test_struct_pool_size_is_fixed() -> None:
+    pool = Request.pool(size=8)
+
+    assert Request.pool() is pool
+    assert Request.pool(size=8) is pool
+
+    with pytest.raises(ValueError):
+        Request.pool(size=16)
+
+    with pytest.raises(AttributeError):
+        pool.size = 16  # type: ignore
+
+    sizes = list[int]()
+    thread = Thread(target=lambda: sizes.append(len(pool)))
+    thread.start()
+    thread.join()
+
+    assert sizes == [0]
+
+
+def test_struct_pool_drops_keepalives() -> None:
+    pool = StructPool(Linked, 2)
+    target = c_int(5)
+    ref = weakref.ref(target)
+
+    with pool.borrow() as item:
+        item.data = Pointer(target)
+
+    del target
+    gc.collect()
+
+    assert ref() is None and not pool.acquire().data
+
+
+def test_double_release_raises() -> None:
+    pool = StructPool(Request, 2)
+    item = pool.acquire()
+    pool.release(item)
+
+    with pytest.raises(ValueError):
+        pool.release(item)
+
+    # Acquired items don't carry the free flag around, it would be pickled with their state otherwise.
+    assert pool.acquire() is item and not item.__dict__
+    pool.release(item)
+
+    scratch = ScratchPool()
+    buffer = scratch.acquire_buffer(100)
+    scratch.release_buffer(buffer)
+
+    with pytest.raises(ValueError):
+        scratch.release_buffer(buffer)
+
+    assert scratch.acquire_buffer(100) is buffer and not buffer.__dict__
+    scratch.release_buffer(buffer)
+
+
+def test_finished_threads_retire_their_stats() -> None:
+    pool = StructPool(Request, 2)
+    scratch = ScratchPool()
+
+    def work() -> None:
+        pool.release(pool.acquire())
+        scratch.release_buffer(scratch.acquire_buffer(10))
+
+    for _ in range(8):
+        thread = Thread(target=work)
+        thread.start()
+        thread.join()
+
+    gc.collect()
+
+    # Only the main thread's counters are still held per thread.
+    assert len(pool._thread_stats) == 1
+    assert len(scratch._thread_stats) == 1
+    assert pool.stats().acquired == 8
+    assert scratch.stats().acquired == 8
+
+
+def test_string_buff_is_pooled() -> None:
+    buffer, length = get_string_buff(100)
+
+    assert length >= 100 and buffer.raw == bytes(length)
+
+    buffer.value = b'error'
+    scratch_pool.release_buffer(buffer)
+
+    again, _ = get_string_buff(100)
+
+    assert again is buffer and again.raw == bytes(length)
+
+    scratch_pool.release_buffer(again)
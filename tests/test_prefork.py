@@ -0,0 +1,37 @@
+from ctypes import c_char, c_char_p, c_double, c_int, c_long
+
+import _prefork_structs as defs
+from ctypedffi import Library, Out, Pointer, warmup
+
+
+class LibC(Library, lib='c'):
+    def strtol(s: c_char_p, end: Out[Pointer[c_char]], base: c_int) -> c_long:
+        ...
+
+    def abs(x: c_int) -> c_int:
+        ...
+
+
+class LibM(Library, lib='m'):
+    def cos(x: c_double) -> c_double:
+        ...
+
+
+def test_warmup_only_reachable_deferred() -> None:
+    report = warmup(defs.Reached, freeze=False)
+
+    assert defs.Reached.finalized and defs.AlsoReached.finalized
+    assert not defs.NotReached.finalized
+
+    assert report.deferred == 2
+    assert report.structs == 2
+
+
+def test_warmup_binds_library_symbols() -> None:
+    report = warmup(LibC, LibM, freeze=False)
+
+    assert report.libraries == 2
+    assert report.functions == 3
+
+    # The out storage of the calling thread is built ahead of time.
+    assert hasattr(LibC.strtol._local, 'template')
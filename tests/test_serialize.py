@@ -0,0 +1,144 @@
+import copyreg
+import pickle
+from ctypes import CFUNCTYPE, c_char_p, c_int16, c_int32, c_size_t
+
+import pytest
+
+import _forward_structs as defs
+from ctypedffi import Library, Struct, StructArray
+
+
+@Struct.annotate
+class Point(Struct, eq=True):
+    x: c_int32
+    y: c_int16
+
+
+_points = [Point(i, -i) for i in range(5)]
+
+
+class LibC(Library, lib='c'):
+    def strlen(s: c_char_p) -> c_size_t:
+        ...
+
+    def strnlen(s: c_char_p, n: c_size_t) -> c_size_t:
+        ...
+
+
+def test_bound_functions_pickle_by_reference() -> None:
+    assert pickle.loads(pickle.dumps(LibC.strlen)) is LibC.strlen
+    assert pickle.loads(pickle.dumps(LibC.strnlen)) is LibC.strnlen
+    assert LibC.strlen(b'abcd') == 4
+
+
+def test_shared_function_types_are_untouched() -> None:
+    base = type(LibC.strlen).__base__
+
+    # The library's own function pointer type and the ctypes callback types keep their default pickling.
+    assert base not in copyreg.dispatch_table
+    assert type(LibC.lib.get('strlen')) is base
+
+    callback = CFUNCTYPE(c_size_t, c_char_p)(lambda s: 0)
+
+    assert type(callback) not in copyreg.dispatch_table
+
+    try:
+        pickle.dumps(callback)
+    except ValueError:
+        ...
+    else:
+        raise AssertionError('Callbacks must not pickle as a bound function!')
+
+
+@pytest.mark.parametrize('protocol', [2, 4, 5])
+def test_struct_round_trip(protocol: int) -> None:
+    point = pickle.loads(pickle.dumps(Point(3, -4), protocol))
+
+    assert type(point) is Point and point == Point(3, -4)
+
+
+def test_struct_out_of_band() -> None:
+    point = Point(3, -4)
+    buffers = list[pickle.PickleBuffer]()
+
+    data = pickle.dumps(point, 5, buffer_callback=buffers.append)
+    loaded = pickle.loads(data, buffers=buffers)
+
+    # The memory travels next to the pickle instead of inside it, and writable buffers are used in place.
+    assert len(buffers) == 1 and bytes(point) not in data
+    assert loaded == point
+
+    point.x = 7
+
+    assert loaded.x == 7
+
+
+@pytest.mark.parametrize('protocol', [2, 4, 5])
+def test_struct_array_round_trip(protocol: int) -> None:
+    array = pickle.loads(pickle.dumps(StructArray.from_records(Point, _points), protocol))
+
+    assert list(array) == _points
+
+
+def test_struct_array_out_of_band() -> None:
+    buffers = list[pickle.PickleBuffer]()
+
+    data = pickle.dumps(StructArray.from_records(Point, _points)[::2], 5, buffer_callback=buffers.append)
+
+    assert len(buffers) == 1
+    assert list(pickle.loads(data, buffers=buffers)) == _points[::2]
+
+
+def test_dumps_array() -> None:
+    data = StructArray.from_records(Point, _points).dumps()
+
+    assert list(StructArray.loads(Point, data)) == _points
+    assert list(StructArray.loads(Point, bytearray(data), copy=True)) == _points
+
+    @Struct.annotate
+    class Other(Struct):
+        x: c_int32
+        y: c_int32
+
+    with pytest.raises(TypeError):
+        StructArray.loads(Other, data)
+
+
+def test_unreachable_struct_fails_when_dumping() -> None:
+    @Struct.annotate
+    class Local(Struct):
+        x: c_int32
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(Local(1))
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(StructArray.from_records(Local, [Local(1)]))
+
+
+@pytest.mark.parametrize('protocol', [2, 5])
+def test_struct_classes_pickle_by_reference(protocol: int) -> None:
+    assert pickle.loads(pickle.dumps(Point, protocol)) is Point
+
+    # Deferred structs come back resolved, both through their proxy and as the resolved class.
+    node = pickle.loads(pickle.dumps(defs.ListNode, protocol))
+
+    assert node is pickle.loads(pickle.dumps(node, protocol))
+    assert node.__name__ == 'ListNode' and isinstance(node, type)
+    assert pickle.loads(pickle.dumps([defs.LinkedList, Point(1, 2)], protocol))[1] == Point(1, 2)
+
+
+def test_unreachable_classes_fail_when_dumping() -> None:
+    @Struct.annotate
+    class Local(Struct):
+        x: c_int32
+
+    class LocalLibC(Library, lib='c'):
+        def strlen(s: c_char_p) -> c_size_t:
+            ...
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(Local)
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(LocalLibC.strlen)
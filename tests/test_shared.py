@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+from ctypes import c_int64
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+import ctypedffi
+from ctypedffi import SharedStructBlock, Struct
+
+
+@Struct.annotate
+class Counter(Struct):
+    hits: c_int64
+    total: c_int64
+
+
+def test_read_inside_write() -> None:
+    results = list[tuple[int, int]]()
+
+    with SharedStructBlock.create(Counter, 2, seqlock=True) as block:
+        def work() -> None:
+            with block.write(1) as record:
+                record.hits = 3
+
+                # The writer sees its own partial update instead of waiting for itself forever.
+                current = block.read(-1)
+                results.append((current.hits, current.total))
+
+        thread = Thread(target=work, daemon=True)
+        thread.start()
+        thread.join(5)
+
+        assert results == [(3, 0)]
+        assert block.read(1).hits == 3
+
+
+def test_nested_write_raises() -> None:
+    with SharedStructBlock.create(Counter, seqlock=True) as block:
+        with block.write() as record:
+            with pytest.raises(RuntimeError):
+                with block.write(-1):
+                    ...
+
+        del record
+
+        assert block._sequence(0).value == 2
+
+
+def test_writers_are_serialized() -> None:
+    with SharedStructBlock.create(Counter, seqlock=True) as block:
+        def work() -> None:
+            for _ in range(2000):
+                with block.write() as record:
+                    hits = record.hits
+                    record.total += 1
+                    record.hits = hits + 1
+
+        threads = [Thread(target=work) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        value = block.read()
+
+        assert (value.hits, value.total) == (8000, 8000)
+        assert block._sequence(0).value == 16000
+
+
+def test_attaching_process_keeps_the_block() -> None:
+    code = (
+        'import sys\n'
+        'from ctypes import c_int64\n'
+        'from ctypedffi import SharedStructBlock, Struct\n'
+        '@Struct.annotate\n'
+        'class Counter(Struct):\n'
+        '    hits: c_int64\n'
+        '    total: c_int64\n'
+        'with SharedStructBlock.attach(Counter, sys.argv[1]) as block:\n'
+        '    block.value.hits = 5\n'
+    )
+
+    with SharedStructBlock.create(Counter) as block:
+        env = dict(os.environ, PYTHONPATH=str(Path(ctypedffi.__file__).parents[1]))
+        subprocess.run([sys.executable, '-c', code, block.name], env=env, check=True, timeout=60)
+
+        # The attaching process exiting must not have unlinked the block, we can still attach to it.
+        attached = SharedStructBlock.attach(Counter, block.name)
+
+        assert attached.value.hits == 5
+
+        attached.close()
+
+
+def test_read_into() -> None:
+    with SharedStructBlock.create(Counter, 2, seqlock=True) as block:
+        with block.write(1) as record:
+            record.hits = 4
+
+        del record
+
+        value = Counter()
+
+        assert block.read(1, value) is value and value.hits == 4
+        assert block.read(0, value) is value and value.hits == 0
+
+        with pytest.raises(TypeError):
+            block.read(0, Counter * 1)  # type: ignore
@@ -0,0 +1,107 @@
+from ctypes import c_int32, c_uint16
+from io import BytesIO
+from typing import Any
+
+import pytest
+
+from ctypedffi import Struct
+
+
+@Struct.annotate
+class Record(Struct):
+    id: c_int32
+    flags: c_uint16
+
+
+_records = [Record(i, i * 2) for i in range(10)]
+_data = b''.join(bytes(record) for record in _records)
+
+
+class _Trickle:
+    def __init__(self, data: bytes, step: int) -> None:
+        self.data = data
+        self.step = step
+
+    def readinto(self, buffer: Any) -> int:
+        step = min(self.step, len(buffer))
+        chunk, self.data = self.data[:step], self.data[step:]
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class _Blocking:
+    def readinto(self, buffer: Any) -> None:
+        return None
+
+    def write(self, buffer: Any) -> None:
+        return None
+
+
+class _ShortWriter:
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def write(self, buffer: Any) -> int:
+        # Like raw files and pipes, accepts less than it's given.
+        self.data += bytes(buffer[:3])
+        return min(len(buffer), 3)
+
+
+class _Socket:
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def sendall(self, buffer: Any) -> None:
+        self.data += bytes(buffer)
+
+
+def _ids(fileobj: Any, batch: int) -> list[int]:
+    return [record.id for chunk in Record.iter_stream(fileobj, batch, copy=True) for record in chunk]
+
+
+def test_read_batches() -> None:
+    assert _ids(BytesIO(_data), 4) == list(range(10))
+
+
+@pytest.mark.parametrize('step', [1, 3, len(_data)])
+def test_read_trickle(step: int) -> None:
+    # Records split across reads are put back together.
+    assert _ids(_Trickle(_data, step), 4) == list(range(10))
+
+
+def test_read_truncated() -> None:
+    with pytest.raises(EOFError):
+        _ids(BytesIO(_data[:-1]), 4)
+
+
+def test_read_non_blocking() -> None:
+    with pytest.raises(BlockingIOError):
+        _ids(_Blocking(), 4)
+
+
+def test_write_short() -> None:
+    fileobj = _ShortWriter()
+
+    with Record.stream_writer(fileobj, 4) as writer:
+        for record in _records:
+            writer.write(record)
+
+    assert fileobj.data == _data
+
+
+def test_write_sendall() -> None:
+    socket = _Socket()
+
+    with Record.stream_writer(socket, 4) as writer:
+        writer.write_many(_records)
+
+    assert socket.data == _data
+
+
+def test_write_non_blocking() -> None:
+    writer = Record.stream_writer(_Blocking(), 4)
+
+    with pytest.raises(BlockingIOError) as error:
+        writer.write_many(_records)
+
+    assert error.value.characters_written == 0
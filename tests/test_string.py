@@ -0,0 +1,54 @@
+import mmap
+from ctypes import CDLL, addressof, c_char, c_void_p, sizeof
+
+import pytest
+
+from ctypedffi import StringArray
+
+_libc = CDLL(None)
+
+
+def test_string_array_items() -> None:
+    strings = StringArray(['alpha', '', 'gamma', 'δέλτα'])
+
+    assert strings[0] == 'alpha'
+    assert strings[1] == ''
+    assert strings[-1] == 'δέλτα'
+    assert strings[1:3] == ['', 'gamma']
+    assert strings[::-2] == ['δέλτα', '']
+    assert list(strings) == strings.tolist() == ['alpha', '', 'gamma', 'δέλτα']
+
+    with pytest.raises(IndexError):
+        strings[4]
+
+    assert list(StringArray([])) == []
+
+
+def test_decode_intern() -> None:
+    first = StringArray.decode(StringArray(['shared', 'shared']), intern=True)
+    second = StringArray.decode(StringArray(['shared']), intern=True)
+
+    assert first == ['shared', 'shared']
+    assert first[0] is first[1] is second[0]
+
+
+def test_string_array_rejects_nul() -> None:
+    with pytest.raises(ValueError):
+        StringArray(['alpha', 'be\0ta'])
+
+
+def test_decode_stops_at_the_terminator() -> None:
+    strings = StringArray(['alpha', 'beta', 'gamma'])
+    table = [addressof(strings._blob) + offset for offset in (0, 6, 11)] + [None]
+
+    # The table ends right before a page that can't be read, nothing past the NULL may be touched.
+    pages = mmap.mmap(-1, 2 * mmap.PAGESIZE)
+    base = addressof(c_char.from_buffer(pages))
+    assert _libc.mprotect(c_void_p(base + mmap.PAGESIZE), mmap.PAGESIZE, 0) == 0
+
+    array = (c_void_p * len(table)).from_address(base + mmap.PAGESIZE - len(table) * sizeof(c_void_p))
+    array[:] = table
+
+    assert StringArray.decode(array) == ['alpha', 'beta', 'gamma']
+
+    assert _libc.mprotect(c_void_p(base + mmap.PAGESIZE), mmap.PAGESIZE, mmap.PROT_READ | mmap.PROT_WRITE) == 0
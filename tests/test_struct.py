@@ -0,0 +1,71 @@
+import sys
+from ctypes import c_int, c_uint16, c_uint32, pointer
+from typing import Any
+
+import pytest
+
+import ctypedffi.struct as struct_module
+from ctypedffi import BigEndianStruct, LittleEndianStruct, Pointer, Struct
+from ctypedffi.codegen import is_generated
+
+
+def test_methods_generated_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    generated = list[str]()
+    generate = struct_module.generate_struct_methods
+
+    def spy(cls: Any, skip: frozenset[str]) -> dict[str, Any]:
+        generated.append(cls.__name__)
+        return generate(cls, skip)
+
+    monkeypatch.setattr(struct_module, 'generate_struct_methods', spy)
+
+    class Plain(Struct):
+        _fields_ = [('x', c_int)]
+
+    @Struct.annotate
+    class Annotated(Struct, eq=True):
+        x: c_int
+
+    # Every class, including the inner one Struct.annotate finalizes, is generated at most once.
+    assert 'Plain' in generated
+    assert len(generated) == len(set(generated))
+
+    assert Plain(3).to_tuple() == (3, )
+    assert Annotated(1) == Annotated(1)
+    assert hash(Annotated(1)) == hash(Annotated(1))
+
+
+@Struct.annotate
+class _Inner(Struct):
+    value: c_int
+
+
+@pytest.mark.parametrize('base, byteorder', [(BigEndianStruct, 'big'), (LittleEndianStruct, 'little')])
+def test_endian_struct(base: Any, byteorder: str) -> None:
+    @base.annotate
+    class Message(base):
+        id: c_uint32
+        length: c_uint16
+        inner: Pointer[_Inner]
+
+    message = Message(1, 2)
+
+    assert bytes(message)[:6] == (1).to_bytes(4, byteorder) + (2).to_bytes(2, byteorder)
+    assert message.to_tuple()[:2] == (1, 2)
+    assert list(message.to_dict()) == ['id', 'length', 'inner']
+
+    # The non-native struct is finalized like any other one.
+    assert is_generated(Message.__dict__['__init__'])
+    assert isinstance(Message.__dict__['inner'], struct_module._PointerField)
+
+    # Plain POINTER(T) values are only accepted through the pointer field wrapper.
+    inner = _Inner(3)
+    message.inner = pointer(inner)
+
+    assert message.inner.contents.value == 3
+
+
+def test_swapped_struct_is_non_native() -> None:
+    swapped = BigEndianStruct if sys.byteorder == 'little' else LittleEndianStruct
+
+    assert isinstance(swapped, struct_module.SwappedStructMeta)
@@ -0,0 +1,40 @@
+from ctypes import c_char, c_int, sizeof
+
+from ctypedffi import Struct, StructArray, value_bytes
+
+
+@Struct.annotate
+class Padded(Struct, eq=True):
+    tag: c_char
+    value: c_int
+
+
+def _array_with_garbage() -> StructArray[Padded]:
+    data = bytearray(b'\xAA' * (3 * sizeof(Padded)))
+    array = StructArray(Padded, data)
+
+    # Only the fields are written, so the padding keeps its garbage.
+    for i, (tag, value) in enumerate(((b'a', 1), (b'b', 2), (b'a', 1))):
+        item = Padded.from_buffer(data, i * sizeof(Padded))
+        item.tag, item.value = tag, value
+
+    return array
+
+
+def test_padding_is_ignored() -> None:
+    a, b = Padded(b'x', 5), Padded(b'x', 5)
+
+    (c_char * 1).from_buffer(a, 1)[0] = b'\xFF'
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert value_bytes(a) == value_bytes(b)
+
+
+def test_array_matches_instances() -> None:
+    array = _array_with_garbage()
+
+    assert array.value_keys() == [value_bytes(item) for item in array]
+    assert array.hashes() == [hash(item) for item in array]
+    assert array.hashes()[0] == array.hashes()[2] == hash(Padded(b'a', 1))
+    assert array.equal(_array_with_garbage()) == [True, True, True]